@@ -7,15 +7,30 @@
 # REFERENCES:
 #   [1] Vallado, David A. Fundamentals of astrodynamics and applications.
 #       First edition.
+#   [2] Markley, F. Landis. "Kepler Equation Solver". Celestial Mechanics and
+#       Dynamical Astronomy 63, 101-111. 1995.
+#   [3] Danby, J. M. A. and Burkardt, T. M. "The solution of Kepler's
+#       equation, I". Celestial Mechanics 31, 95-107. 1983.
+#   [4] Fritsch, F. N. and Carlson, R. E. "Monotone Piecewise Cubic
+#       Interpolation". SIAM Journal on Numerical Analysis 17, 238-246. 1980.
+#   [5] Broucke, R. and Cefola, P. "A note on the relations between true and
+#       eccentric anomalies in the two-body problem". Celestial Mechanics 7,
+#       388-389. 1973.
 # ------------------------------------------------------------------------------
 
 # Python imports
-from math import sqrt, sin, tan, atan, cos, pi
+from functools import lru_cache
+from math import sqrt, sin, atan2, cos, pi, nan
 import numpy as np
 
 # Astrochelle imports
 from astrochelle.utils.constants import GM_EARTH
 
+# Constants
+KEPLER_METHODS = ('newton', 'halley', 'danby')  # see solve_kepler_equation
+KEPLER_TABLE_SIZE = 128  # nodes per axis of the table, see _get_kepler_table
+_SCALAR_TYPES = (int, float, np.number)  # inputs taking the `math` path
+
 ##################
 # Error Handling #
 ##################
@@ -46,25 +61,55 @@ def calculate_mean_motion(semimajor_axis: float) -> float:
 
 
 def convert_anomaly_mean_to_eccentric(
-        mean_anomaly: float,
-        eccentricity: float,
+        mean_anomaly,
+        eccentricity,
         tolerance: float = 1e-8,
-        allowed_iterations: int = 50
-) -> float:
+        allowed_iterations: int = 50,
+        method: str = 'newton'
+):
     '''Convert the mean anomaly to eccentric anomaly
 
     Args:
-        mean_anomaly (`float`): semi-major axis of the orbit [m]
-        eccentricity (`float`): eccentricity of the orbit
+        mean_anomaly (`float` or `np.ndarray`): mean anomaly [rad]
+        eccentricity (`float` or `np.ndarray`): eccentricity of the orbit
         tolerance (`float`): convergence tolerance to stop iterations
         allowed_iterations (`int`): number of iterations allowed
+        method (`str`): see KEPLER_METHODS and `solve_kepler_equation`,
+            'danby' converges in 2 iterations for any eccentricity. 'table'
+            uses `solve_kepler_equation_tabulated`, ignoring tolerance and
+            allowed_iterations
 
     Returns:
-        eccentric anomaly (`float`)
+        eccentric anomaly [rad] (`float` if both inputs are scalars, else
+            `np.ndarray`)
 
     Source:
         Ref. 1 page 211
+
+    Notes:
+        Arrays are solved together by `solve_kepler_equation`. Unlike it,
+        this raises if any element fails to converge.
     '''
+    if method == 'table':
+        eccentric_anomaly = solve_kepler_equation_tabulated(
+            mean_anomaly, eccentricity)
+        if np.isnan(eccentric_anomaly).any():
+            raise AbsoluteStateException(
+                'convert_anomaly_mean_to_eccentric needs 0 <= e < 1.')
+        return eccentric_anomaly
+
+    if method != 'newton' or not _is_scalar(mean_anomaly, eccentricity):
+        if np.any(np.asarray(eccentricity) >= 1):
+            raise AbsoluteStateException(
+                'convert_anomaly_mean_to_eccentric needs e < 1, see '
+                'convert_anomaly_mean_to_true for any orbit.')
+        eccentric_anomaly, converged = solve_kepler_equation(
+            mean_anomaly, eccentricity, tolerance, allowed_iterations,
+            method)
+        if not np.all(converged):
+            raise AbsoluteStateException(
+                'convert_anomaly_mean_to_eccentric did not converge.')
+        return eccentric_anomaly
 
     if mean_anomaly > -pi and mean_anomaly < 0 or mean_anomaly > pi:
         eccentric_anomaly = mean_anomaly - eccentricity
@@ -102,90 +147,721 @@ def convert_anomaly_mean_to_eccentric(
     return eccentric_anomaly
 
 
-def convert_anomaly_eccentric_to_true(
-        eccentric_anomaly: float, eccentricity: float) -> float:
+def solve_kepler_equation(
+        mean_anomaly,
+        eccentricity,
+        tolerance: float = 1e-8,
+        allowed_iterations: int = 50,
+        method: str = 'newton',
+        return_iterations: bool = False
+) -> tuple:
+    '''Solve Kepler's equation for many orbits at once, elliptic, parabolic
+    or hyperbolic per element
+
+    Args:
+        mean_anomaly (`float` or `np.ndarray`): mean anomaly [rad], see
+            `convert_anomaly_parabolic_to_mean` and
+            `convert_anomaly_hyperbolic_to_mean` for e >= 1
+        eccentricity (`float` or `np.ndarray`): eccentricity (>= 0),
+            broadcast against mean_anomaly
+        tolerance (`float`): convergence tolerance on the update step [rad]
+        allowed_iterations (`int`): number of iterations allowed
+        method (`str`): see KEPLER_METHODS
+            'newton': initial guess and Newton steps of Ref. 1
+            'halley': starter of Ref. 2, Halley (third order) steps
+            'danby': starter of Ref. 2, Danby (fourth order) steps, Ref. 3
+        return_iterations (`bool`): also return the iterations per element
+
+    Returns:
+        tuple (`float`/`bool`/`int` if both inputs are scalars, else
+        `np.ndarray` of the broadcast shape)
+            anomaly [rad]: eccentric anomaly E for e < 1, parabolic anomaly
+                D = tan(true anomaly / 2) for e = 1, hyperbolic anomaly F
+                for e > 1
+            converged: False where the iterations ran out (the last iterate
+                is returned) or the input is invalid (NaN is returned)
+            iterations (only if return_iterations): update steps taken
+
+    Notes:
+        For e < 1 the mean anomaly is reduced to [-pi, pi] before solving
+        and the whole turns are added back, so any mean anomaly works.
+        e = 1 is solved in closed form (0 iterations). For e > 1 every method
+        starts from `_get_hyperbolic_starter`.
+
+        Every element takes steps together, whatever its regime. Converged
+        elements drop out of the working set, so later iterations only
+        touch the stragglers. Nothing is raised for a failed element, check
+        `converged` instead.
+
+        From the cubic starter of Ref. 2 (within 5e-4 rad for any
+        eccentricity) one Halley step is within about 2e-11 rad and one Danby
+        step within 4e-15 rad, so 'halley' takes 2 to 3 steps and 'danby' 2
+        (the last one confirms convergence). 'newton' takes about 4 on
+        average and up to 9 near e = 1. Hyperbolic orbits take at most 6
+        Newton or 4 Halley or Danby steps to 1e-12 rad.
+    '''
+    if method not in KEPLER_METHODS:
+        raise AbsoluteStateException(
+            f"Kepler method {method} not in {KEPLER_METHODS}.")
+
+    is_scalar = np.ndim(mean_anomaly) == 0 and np.ndim(eccentricity) == 0
+    mean_anomaly, eccentricity = np.broadcast_arrays(
+        np.asarray(mean_anomaly, dtype=np.float64),
+        np.asarray(eccentricity, dtype=np.float64))
+    shape = mean_anomaly.shape
+    mean_anomaly = mean_anomaly.ravel()
+    eccentricity = eccentricity.ravel()
+
+    # Regime of each element, invalid inputs are in none of them
+    valid = (eccentricity >= 0) & np.isfinite(eccentricity) & \
+        np.isfinite(mean_anomaly)
+    elliptic = np.flatnonzero(valid & (eccentricity < 1))
+    parabolic = np.flatnonzero(valid & (eccentricity == 1))
+    hyperbolic = np.flatnonzero(valid & (eccentricity > 1))
+
+    # Reduce elliptic orbits to [-pi, pi], remembering the whole turns
+    turns = np.zeros(mean_anomaly.shape)
+    turns[elliptic] = 2 * pi * np.round(mean_anomaly[elliptic] / (2 * pi))
+    reduced_anomaly = mean_anomaly - turns
+
+    anomaly = np.full(mean_anomaly.shape, np.nan)
+    if method == 'newton':
+        # Initial guess, Ref. 1 page 232
+        anomaly[elliptic] = np.where(
+            reduced_anomaly[elliptic] < 0,
+            reduced_anomaly[elliptic] - eccentricity[elliptic],
+            reduced_anomaly[elliptic] + eccentricity[elliptic])
+    else:
+        anomaly[elliptic] = _get_kepler_starter(
+            reduced_anomaly[elliptic], eccentricity[elliptic])
+    anomaly[parabolic] = convert_anomaly_mean_to_parabolic(
+        reduced_anomaly[parabolic])
+    anomaly[hyperbolic] = _get_hyperbolic_starter(
+        reduced_anomaly[hyperbolic], eccentricity[hyperbolic])
+
+    converged = np.zeros(mean_anomaly.shape, dtype=bool)
+    converged[parabolic] = True
+    iterations = np.zeros(mean_anomaly.shape, dtype=np.int64)
+    active = np.flatnonzero(valid & (eccentricity != 1))
+
+    for _ in range(allowed_iterations):
+        if active.size == 0:
+            break
+
+        step = _get_kepler_step(
+            anomaly[active], reduced_anomaly[active],
+            eccentricity[active], method)
+        anomaly[active] += step
+        iterations[active] += 1
+
+        done = np.abs(step) < tolerance
+        converged[active[done]] = True
+        active = active[~done]
+
+    anomaly += turns
+    if is_scalar:
+        results = (float(anomaly[0]), bool(converged[0]), int(iterations[0]))
+    else:
+        results = (anomaly.reshape(shape), converged.reshape(shape),
+                   iterations.reshape(shape))
+    return results if return_iterations else results[:2]
+
+
+def _get_kepler_starter(mean_anomaly, eccentricity):
+    '''Cubic starter for Kepler's equation, Ref. 2
+
+    Args:
+        mean_anomaly (`np.ndarray`): mean anomaly in [-pi, pi] [rad]
+        eccentricity (`np.ndarray`): eccentricity in [0, 1)
+
+    Returns:
+        `np.ndarray` eccentric anomaly guess [rad]
+    '''
+    alpha = (3 * pi**2 + 1.6 * pi * (pi - np.abs(mean_anomaly)) /
+             (1 + eccentricity)) / (pi**2 - 6)
+    d = 3 * (1 - eccentricity) + alpha * eccentricity
+    q = 2 * alpha * d * (1 - eccentricity) - mean_anomaly**2
+    r = 3 * alpha * d * (d - 1 + eccentricity) * mean_anomaly + \
+        mean_anomaly**3
+    w = (np.abs(r) + np.sqrt(np.maximum(q**3 + r**2, 0)))**(2 / 3)
+    return (2 * r * w / (w**2 + w * q + q**2) + mean_anomaly) / d
+
+
+def _get_hyperbolic_starter(mean_anomaly, eccentricity):
+    '''Starter for the hyperbolic Kepler equation M = e sinh(F) - F
+
+    Args:
+        mean_anomaly (`np.ndarray`): mean anomaly [rad]
+        eccentricity (`np.ndarray`): eccentricity above 1
+
+    Returns:
+        `np.ndarray` hyperbolic anomaly guess [rad]
+
+    Notes:
+        Near periapsis sinh(F) ~ F + F^3 / 6 gives a cubic, solved without
+        cancellation as in Ref. 2. Far from it sinh(F) ~ exp(F) / 2 gives a
+        logarithm. Both overestimate |F|, so the smaller one is used.
+    '''
+    magnitude = np.abs(mean_anomaly)
+
+    # (e - 1) F + e F^3 / 6 = M, written F^3 + 3 p F - 2 q = 0
+    p = 2 * (eccentricity - 1) / eccentricity
+    q = 3 * magnitude / eccentricity
+    w = np.cbrt(q + np.hypot(q, p**1.5))
+    cubic = 2 * q / (w**2 + p + (p / w)**2)
+
+    logarithm = np.log(2 * magnitude / eccentricity + 1.8)
+    return np.copysign(np.minimum(cubic, logarithm), mean_anomaly)
+
+
+def _get_kepler_step(anomaly, mean_anomaly, eccentricity, method):
+    '''Update step for f(E) = E - e sin(E) - M = 0 (e < 1) or
+    f(F) = e sinh(F) - F - M = 0 (e > 1)
+
+    Args:
+        anomaly (`np.ndarray`): current iterate, E or F [rad]
+        mean_anomaly (`np.ndarray`): mean anomaly [rad]
+        eccentricity (`np.ndarray`): eccentricity, not 1
+        method (`str`): see KEPLER_METHODS
+
+    Returns:
+        `np.ndarray` step to add to the iterate [rad]
+    '''
+    # Second and third derivatives of f, e sin(E) and e cos(E) for an ellipse
+    second = eccentricity * np.sin(anomaly)
+    third = eccentricity * np.cos(anomaly)
+    f = anomaly - second - mean_anomaly
+    f_prime = 1 - third
+
+    hyperbolic = np.flatnonzero(eccentricity > 1)
+    if hyperbolic.size:
+        # e sinh(F) and e cosh(F) for a hyperbola. e sinh(F) - F is split up
+        # so that it doesn't cancel for small F and e near 1
+        anomaly = anomaly[hyperbolic]
+        excess = eccentricity[hyperbolic] - 1
+        sinh = np.sinh(anomaly)
+        cosh = np.cosh(anomaly)
+        second[hyperbolic] = eccentricity[hyperbolic] * sinh
+        third[hyperbolic] = eccentricity[hyperbolic] * cosh
+        f[hyperbolic] = excess * sinh + _get_sinh_minus_identity(anomaly) - \
+            mean_anomaly[hyperbolic]
+        f_prime[hyperbolic] = excess * cosh + 2 * np.sinh(anomaly / 2)**2
+
+    if method == 'newton':
+        return -f / f_prime
+
+    # Halley, then Danby's quartic correction built on it (Ref. 3)
+    step = -f / (f_prime + 0.5 * (-f / f_prime) * second)
+    if method == 'halley':
+        return step
+    return -f / (f_prime + 0.5 * step * second + step**2 * third / 6)
+
+
+def _get_sinh_minus_identity(anomaly):
+    '''sinh(F) - F without cancellation for small F
+
+    Args:
+        anomaly (`np.ndarray`): hyperbolic anomaly [rad]
+
+    Returns:
+        `np.ndarray` sinh(F) - F
+    '''
+    # Taylor series up to F^17 for |F| < 1, the rest is below 1e-16 of it
+    square = anomaly**2
+    term = anomaly * square / 6
+    series = term.copy()
+    for power in range(5, 19, 2):
+        term = term * square / ((power - 1) * power)
+        series += term
+    return np.where(np.abs(anomaly) < 1, series, np.sinh(anomaly) - anomaly)
+
+
+def solve_kepler_equation_tabulated(mean_anomaly, eccentricity):
+    '''Solve Kepler's equation without iterating, for screening large
+    catalogs
+
+    Args:
+        mean_anomaly (`float` or `np.ndarray`): mean anomaly [rad]
+        eccentricity (`float` or `np.ndarray`): eccentricity in [0, 1),
+            broadcast against mean_anomaly
+
+    Returns:
+        eccentric anomaly [rad] (`float` if both inputs are scalars, else
+            `np.ndarray` of the broadcast shape), NaN for invalid inputs
+
+    Notes:
+        The guess is interpolated from a table of E(M, e) over [0, pi] x
+        [0, 1], cubic Hermite in M (Ref. 4) using the exact slope dE/dM =
+        1 / (1 - e cos(E)) and linear in e. One Danby step (Ref. 3) then
+        refines it. dE/dM is unbounded at M = 0 as e goes to 1, so the first
+        cell in M uses the starter of Ref. 2 instead.
+
+        Against `solve_kepler_equation` at tolerance 1e-14 the error is
+        below 2e-13 rad over a dense grid of M and e (including e within
+        1e-14 of 1), well inside the 1e-10 rad intended for screening. The
+        table (KEPLER_TABLE_SIZE**2 nodes, 256 KB) is built on the first
+        call and kept for the rest of the process.
+
+        Every element costs the same, so the throughput is about 1.3 to 2
+        times that of `solve_kepler_equation(..., method='danby')`, see
+        benchmarks/bench_absolute_state.py.
+    '''
+    eccentric_table, slope_table = _get_kepler_table()
+    size = KEPLER_TABLE_SIZE
+
+    is_scalar = np.ndim(mean_anomaly) == 0 and np.ndim(eccentricity) == 0
+    mean_anomaly, eccentricity = np.broadcast_arrays(
+        np.asarray(mean_anomaly, dtype=np.float64),
+        np.asarray(eccentricity, dtype=np.float64))
+    shape = mean_anomaly.shape
+    mean_anomaly = mean_anomaly.ravel()
+    eccentricity = eccentricity.ravel()
+
+    # Invalid elements are looked up at (0, 0) and set to NaN at the end
+    valid = (eccentricity >= 0) & (eccentricity < 1) & \
+        np.isfinite(mean_anomaly)
+    eccentricity = np.where(valid, eccentricity, 0.0)
+
+    # Reduce to [0, pi], E(-M) = -E(M)
+    turns = 2 * pi * np.round(np.where(valid, mean_anomaly, 0.0) / (2 * pi))
+    reduced_anomaly = mean_anomaly - turns
+    sign = np.where(reduced_anomaly < 0, -1.0, 1.0)
+    reduced_anomaly = np.where(valid, np.abs(reduced_anomaly), 0.0)
+
+    # Cell of each element and the position within it
+    position = reduced_anomaly * ((size - 1) / pi)
+    column = np.minimum(position.astype(np.intp), size - 2)
+    t = position - column
+    position = eccentricity * (size - 1)
+    row = np.minimum(position.astype(np.intp), size - 2)
+    u = position - row
+
+    # Cubic Hermite basis, slopes scaled to the cell width
+    t2 = t * t
+    t3 = t2 * t
+    basis = (2 * t3 - 3 * t2 + 1, (t3 - 2 * t2 + t) * (pi / (size - 1)),
+             3 * t2 - 2 * t3, (t3 - t2) * (pi / (size - 1)))
+
+    def interpolate_row(index):
+        return basis[0] * eccentric_table[index, column] + \
+            basis[1] * slope_table[index, column] + \
+            basis[2] * eccentric_table[index, column + 1] + \
+            basis[3] * slope_table[index, column + 1]
+
+    eccentric_anomaly = (1 - u) * interpolate_row(row) + \
+        u * interpolate_row(row + 1)
+
+    first = np.flatnonzero(column == 0)
+    eccentric_anomaly[first] = _get_kepler_starter(
+        reduced_anomaly[first], eccentricity[first])
+
+    eccentric_anomaly += _get_kepler_step(
+        eccentric_anomaly, reduced_anomaly, eccentricity, 'danby')
+    eccentric_anomaly = sign * eccentric_anomaly + turns
+    eccentric_anomaly[~valid] = np.nan
+
+    if is_scalar:
+        return float(eccentric_anomaly[0])
+    return eccentric_anomaly.reshape(shape)
+
+
+@lru_cache(maxsize=None)
+def _get_kepler_table() -> tuple:
+    '''Table of Kepler's equation for `solve_kepler_equation_tabulated`
+
+    Returns:
+        tuple (`np.ndarray` of shape (KEPLER_TABLE_SIZE, KEPLER_TABLE_SIZE),
+        rows evenly spaced in e over [0, 1], columns evenly spaced in M over
+        [0, pi])
+            eccentric anomaly [rad]
+            slope dE/dM
+    '''
+    mean_anomaly, eccentricity = np.meshgrid(
+        np.linspace(0, pi, KEPLER_TABLE_SIZE),
+        np.linspace(0, 1, KEPLER_TABLE_SIZE))
+
+    # e = 1 itself has no solution, the nearest double below it stands in
+    eccentricity = np.minimum(eccentricity, np.nextafter(1, 0))
+    eccentric_anomaly, converged = solve_kepler_equation(
+        mean_anomaly, eccentricity, tolerance=1e-14, method='danby')
+    if not converged.all():
+        raise AbsoluteStateException('Could not build the Kepler table.')
+
+    with np.errstate(divide='ignore'):
+        slope = 1 / (1 - eccentricity * np.cos(eccentric_anomaly))
+    for table in (eccentric_anomaly, slope):
+        table.flags.writeable = False
+    return eccentric_anomaly, slope
+
+
+def convert_anomaly_eccentric_to_true(eccentric_anomaly, eccentricity):
     '''Convert the eccentric anomaly to true anomaly
 
     Args:
-        eccentric_anomaly (`float`): semi-major axis of the orbit [m]
-        eccentricity (`float`): eccentricity of the orbit
+        eccentric_anomaly (`float` or `np.ndarray`): eccentric anomaly [rad]
+        eccentricity (`float` or `np.ndarray`): eccentricity of the orbit
 
     Returns:
-        true anomaly (`float`)
+        true anomaly [rad] (`float` if both inputs are scalars, else
+            `np.ndarray`), in the same turn as the eccentric anomaly, NaN
+            for e outside [0, 1)
 
     Source:
-        Ref. 1 page 215, Eq. 4-14
+        Ref. 5, equivalent to Ref. 1 page 215, Eq. 4-14 within (-pi, pi)
     '''
-    return 2 * atan(
-        sqrt((1+eccentricity)/(1-eccentricity)) * tan(eccentric_anomaly/2)
-    )
+    if _is_scalar(eccentric_anomaly, eccentricity):
+        if not 0 <= eccentricity < 1:
+            return nan
+        beta = eccentricity / (1 + sqrt(1 - eccentricity**2))
+        return eccentric_anomaly + 2 * atan2(
+            beta * sin(eccentric_anomaly), 1 - beta * cos(eccentric_anomaly))
 
+    eccentric_anomaly = np.asarray(eccentric_anomaly, dtype=np.float64)
+    beta = _get_beta(eccentricity)
+    return _get_output(eccentric_anomaly + 2 * np.arctan2(
+        beta * np.sin(eccentric_anomaly),
+        1 - beta * np.cos(eccentric_anomaly)))
 
-def convert_anomaly_true_to_eccentric(
-        true_anomaly: float, eccentricity: float) -> float:
+
+def convert_anomaly_true_to_eccentric(true_anomaly, eccentricity):
     '''Convert the true anomaly to eccentric anomaly
 
     Args:
-        true_anomaly (`float`): semi-major axis of the orbit [m]
-        eccentricity (`float`): eccentricity of the orbit
+        true_anomaly (`float` or `np.ndarray`): true anomaly [rad]
+        eccentricity (`float` or `np.ndarray`): eccentricity of the orbit
 
     Returns:
-        eccentric anomaly (`float`)
+        eccentric anomaly [rad] (`float` if both inputs are scalars, else
+            `np.ndarray`), in the same turn as the true anomaly, NaN for e
+            outside [0, 1)
 
     Source:
-        Ref. 1 page 215, Eq. 4-14
+        Ref. 5, equivalent to Ref. 1 page 215, Eq. 4-14 within (-pi, pi)
     '''
-    return 2 * atan(
-        sqrt((1-eccentricity)/(1+eccentricity)) * tan(true_anomaly/2)
-    )
+    if _is_scalar(true_anomaly, eccentricity):
+        if not 0 <= eccentricity < 1:
+            return nan
+        beta = eccentricity / (1 + sqrt(1 - eccentricity**2))
+        return true_anomaly - 2 * atan2(
+            beta * sin(true_anomaly), 1 + beta * cos(true_anomaly))
+
+    true_anomaly = np.asarray(true_anomaly, dtype=np.float64)
+    beta = _get_beta(eccentricity)
+    return _get_output(true_anomaly - 2 * np.arctan2(
+        beta * np.sin(true_anomaly), 1 + beta * np.cos(true_anomaly)))
 
 
-def convert_anomaly_eccentric_to_mean(
-        eccentric_anomaly: float, eccentricity: float) -> float:
+def convert_anomaly_eccentric_to_mean(eccentric_anomaly, eccentricity):
     '''Convert the eccentric anomaly to mean anomaly
 
     Args:
-        eccentric_anomaly (`float`): semi-major axis of the orbit [m]
-        eccentricity (`float`): eccentricity of the orbit
+        eccentric_anomaly (`float` or `np.ndarray`): eccentric anomaly [rad]
+        eccentricity (`float` or `np.ndarray`): eccentricity of the orbit
 
     Returns:
-        mean anomaly (`float`)
+        mean anomaly [rad] (`float` if both inputs are scalars, else
+            `np.ndarray`)
 
     Source:
         Ref. 1 page 211, Eq. 4-6
     '''
-    return eccentric_anomaly - eccentricity * sin(eccentric_anomaly)
+    if _is_scalar(eccentric_anomaly, eccentricity):
+        return eccentric_anomaly - eccentricity * sin(eccentric_anomaly)
+
+    eccentric_anomaly = np.asarray(eccentric_anomaly, dtype=np.float64)
+    return _get_output(
+        eccentric_anomaly - eccentricity * np.sin(eccentric_anomaly))
 
 
 def convert_anomaly_mean_to_true(
-        mean_anomaly: float, eccentricity: float) -> float:
-    '''Convert the mean anomaly to true anomaly
+        mean_anomaly, eccentricity, method: str = 'newton'):
+    '''Convert the mean anomaly to true anomaly, for any orbit
+
+    Args:
+        mean_anomaly (`float` or `np.ndarray`): mean anomaly [rad]
+        eccentricity (`float` or `np.ndarray`): eccentricity of the orbit,
+            elliptic, parabolic and hyperbolic orbits can be mixed
+        method (`str`): see `convert_anomaly_mean_to_eccentric`, 'table' is
+            for elliptic orbits only
+
+    Returns:
+        true anomaly [rad] (`float` if both inputs are scalars, else
+            `np.ndarray`)
+
+    Notes:
+        Arrays are solved together by `solve_kepler_equation`, each element
+        in its own regime. This raises if any element fails to converge.
+    '''
+    if method == 'table' or \
+            _is_scalar(mean_anomaly, eccentricity) and eccentricity < 1:
+        return convert_anomaly_eccentric_to_true(
+            eccentric_anomaly=convert_anomaly_mean_to_eccentric(
+                mean_anomaly=mean_anomaly, eccentricity=eccentricity,
+                method=method),
+            eccentricity=eccentricity)
+
+    anomaly, converged = solve_kepler_equation(
+        mean_anomaly, eccentricity, method=method)
+    if not np.all(converged):
+        raise AbsoluteStateException(
+            'convert_anomaly_mean_to_true did not converge.')
+
+    anomaly, eccentricity = np.broadcast_arrays(
+        np.asarray(anomaly), np.asarray(eccentricity, dtype=np.float64))
+    true_anomaly = np.full(anomaly.shape, np.nan)
+    for regime, conversion in (
+            (eccentricity < 1, convert_anomaly_eccentric_to_true),
+            (eccentricity == 1, lambda anomaly, _:
+                convert_anomaly_parabolic_to_true(anomaly)),
+            (eccentricity > 1, convert_anomaly_hyperbolic_to_true)):
+        true_anomaly[regime] = conversion(
+            anomaly[regime], eccentricity[regime])
+    return _get_output(true_anomaly)
+
+
+def convert_anomaly_true_to_mean(true_anomaly, eccentricity):
+    '''Convert the true anomaly to mean anomaly, for any orbit
+
+    Args:
+        true_anomaly (`float` or `np.ndarray`): true anomaly [rad]
+        eccentricity (`float` or `np.ndarray`): eccentricity of the orbit,
+            elliptic, parabolic and hyperbolic orbits can be mixed
+
+    Returns:
+        mean anomaly [rad] (`float` if both inputs are scalars, else
+            `np.ndarray`), NaN where a parabolic or hyperbolic orbit never
+            reaches the true anomaly
+    '''
+    if _is_scalar(true_anomaly, eccentricity) and eccentricity < 1:
+        return convert_anomaly_eccentric_to_mean(
+            eccentric_anomaly=convert_anomaly_true_to_eccentric(
+                true_anomaly=true_anomaly, eccentricity=eccentricity),
+            eccentricity=eccentricity)
+
+    true_anomaly, eccentricity = np.broadcast_arrays(
+        np.asarray(true_anomaly, dtype=np.float64),
+        np.asarray(eccentricity, dtype=np.float64))
+    mean_anomaly = np.full(true_anomaly.shape, np.nan)
+    for regime, to_anomaly, to_mean in (
+            (eccentricity < 1, convert_anomaly_true_to_eccentric,
+             convert_anomaly_eccentric_to_mean),
+            (eccentricity == 1,
+             lambda true_anomaly, _:
+                convert_anomaly_true_to_parabolic(true_anomaly),
+             lambda anomaly, _: convert_anomaly_parabolic_to_mean(anomaly)),
+            (eccentricity > 1, convert_anomaly_true_to_hyperbolic,
+             convert_anomaly_hyperbolic_to_mean)):
+        mean_anomaly[regime] = to_mean(
+            to_anomaly(true_anomaly[regime], eccentricity[regime]),
+            eccentricity[regime])
+    return _get_output(mean_anomaly)
+
+
+def convert_anomaly_parabolic_to_true(parabolic_anomaly):
+    '''Convert the parabolic anomaly to true anomaly
+
+    Args:
+        parabolic_anomaly (`float` or `np.ndarray`): parabolic anomaly
+            D = tan(true anomaly / 2)
+
+    Returns:
+        true anomaly [rad] (`float` or `np.ndarray`), in (-pi, pi)
+    '''
+    return _get_output(2 * np.arctan(parabolic_anomaly))
+
+
+def convert_anomaly_true_to_parabolic(true_anomaly):
+    '''Convert the true anomaly to parabolic anomaly
+
+    Args:
+        true_anomaly (`float` or `np.ndarray`): true anomaly [rad]
+
+    Returns:
+        parabolic anomaly D = tan(true anomaly / 2) (`float` or
+            `np.ndarray`), NaN outside of (-pi, pi), which a parabola
+            never reaches
+    '''
+    true_anomaly = np.asarray(true_anomaly, dtype=np.float64)
+    return _get_output(np.where(
+        np.abs(true_anomaly) < pi, np.tan(true_anomaly / 2), np.nan))
+
+
+def convert_anomaly_parabolic_to_mean(parabolic_anomaly):
+    '''Convert the parabolic anomaly to mean anomaly (Barker's equation)
+
+    Args:
+        parabolic_anomaly (`float` or `np.ndarray`): parabolic anomaly
+            D = tan(true anomaly / 2)
+
+    Returns:
+        mean anomaly M = D + D^3 / 3 (`float` or `np.ndarray`)
+
+    Source:
+        Ref. 1, Barker's equation, with the mean motion 2 sqrt(mu / p^3)
+            folded into M
+    '''
+    parabolic_anomaly = np.asarray(parabolic_anomaly, dtype=np.float64)
+    return _get_output(parabolic_anomaly + parabolic_anomaly**3 / 3)
+
+
+def convert_anomaly_mean_to_parabolic(mean_anomaly):
+    '''Convert the mean anomaly to parabolic anomaly, solving Barker's
+    equation in closed form
+
+    Args:
+        mean_anomaly (`float` or `np.ndarray`): mean anomaly, see
+            `convert_anomaly_parabolic_to_mean`
+
+    Returns:
+        parabolic anomaly D = tan(true anomaly / 2) (`float` or
+            `np.ndarray`)
+
+    Notes:
+        D = y - 1 / y with y^3 = 3M / 2 + sqrt(1 + (3M / 2)^2). As
+        y^3 - y^-3 = 3M this is evaluated as 3M / (y^2 + 1 + y^-2), which
+        doesn't cancel for small M.
+    '''
+    mean_anomaly = np.asarray(mean_anomaly, dtype=np.float64)
+    half = 1.5 * np.abs(mean_anomaly)
+    y = np.cbrt(half + np.hypot(1, half))
+    return _get_output(3 * mean_anomaly / (y**2 + 1 + y**-2))
+
+
+def convert_anomaly_hyperbolic_to_true(hyperbolic_anomaly, eccentricity):
+    '''Convert the hyperbolic anomaly to true anomaly
+
+    Args:
+        hyperbolic_anomaly (`float` or `np.ndarray`): hyperbolic anomaly
+            [rad]
+        eccentricity (`float` or `np.ndarray`): eccentricity above 1
+
+    Returns:
+        true anomaly [rad] (`float` or `np.ndarray`), NaN for e <= 1
+
+    Source:
+        Ref. 1, tan(nu / 2) = sqrt((e + 1) / (e - 1)) tanh(F / 2)
+    '''
+    hyperbolic_anomaly = np.asarray(hyperbolic_anomaly, dtype=np.float64)
+    eccentricity = np.asarray(eccentricity, dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio = np.sqrt((eccentricity + 1) / (eccentricity - 1))
+    ratio = np.where(eccentricity > 1, ratio, np.nan)
+    return _get_output(2 * np.arctan(ratio * np.tanh(hyperbolic_anomaly / 2)))
+
+
+def convert_anomaly_true_to_hyperbolic(true_anomaly, eccentricity):
+    '''Convert the true anomaly to hyperbolic anomaly
+
+    Args:
+        true_anomaly (`float` or `np.ndarray`): true anomaly [rad]
+        eccentricity (`float` or `np.ndarray`): eccentricity above 1
+
+    Returns:
+        hyperbolic anomaly [rad] (`float` or `np.ndarray`), NaN for e <= 1
+            and at or beyond the asymptotes, |nu| >= arccos(-1 / e)
+
+    Source:
+        Ref. 1, tanh(F / 2) = sqrt((e - 1) / (e + 1)) tan(nu / 2)
+    '''
+    true_anomaly = np.asarray(true_anomaly, dtype=np.float64)
+    eccentricity = np.asarray(eccentricity, dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        hyperbolic_anomaly = 2 * np.arctanh(
+            np.sqrt((eccentricity - 1) / (eccentricity + 1)) *
+            np.tan(true_anomaly / 2))
+    reachable = (eccentricity > 1) & (np.abs(true_anomaly) < pi) & \
+        np.isfinite(hyperbolic_anomaly)
+    return _get_output(np.where(reachable, hyperbolic_anomaly, np.nan))
+
+
+def convert_anomaly_hyperbolic_to_mean(hyperbolic_anomaly, eccentricity):
+    '''Convert the hyperbolic anomaly to mean anomaly
+
+    Args:
+        hyperbolic_anomaly (`float` or `np.ndarray`): hyperbolic anomaly
+            [rad]
+        eccentricity (`float` or `np.ndarray`): eccentricity above 1
+
+    Returns:
+        mean anomaly M = e sinh(F) - F [rad] (`float` or `np.ndarray`)
+
+    Source:
+        Ref. 1, Kepler's equation for hyperbolic orbits
+    '''
+    hyperbolic_anomaly = np.asarray(hyperbolic_anomaly, dtype=np.float64)
+    return _get_output(
+        eccentricity * np.sinh(hyperbolic_anomaly) - hyperbolic_anomaly)
+
+
+def convert_anomaly_mean_to_hyperbolic(
+        mean_anomaly,
+        eccentricity,
+        tolerance: float = 1e-8,
+        allowed_iterations: int = 50,
+        method: str = 'newton'
+):
+    '''Convert the mean anomaly to hyperbolic anomaly
+
+    Args:
+        mean_anomaly (`float` or `np.ndarray`): mean anomaly [rad]
+        eccentricity (`float` or `np.ndarray`): eccentricity above 1
+        tolerance (`float`): convergence tolerance to stop iterations
+        allowed_iterations (`int`): number of iterations allowed
+        method (`str`): see KEPLER_METHODS and `solve_kepler_equation`
+
+    Returns:
+        hyperbolic anomaly [rad] (`float` if both inputs are scalars, else
+            `np.ndarray`)
+    '''
+    if not np.all(np.asarray(eccentricity) > 1):
+        raise AbsoluteStateException(
+            'convert_anomaly_mean_to_hyperbolic needs e > 1.')
+
+    hyperbolic_anomaly, converged = solve_kepler_equation(
+        mean_anomaly, eccentricity, tolerance, allowed_iterations, method)
+    if not np.all(converged):
+        raise AbsoluteStateException(
+            'convert_anomaly_mean_to_hyperbolic did not converge.')
+    return hyperbolic_anomaly
+
+
+def _is_scalar(anomaly, eccentricity) -> bool:
+    '''Whether both inputs are Python or NumPy numbers, in which case the
+    conversions use `math` rather than NumPy
+
+    Args:
+        anomaly: anomaly input of a conversion
+        eccentricity: eccentricity input of a conversion
+
+    Returns:
+        `bool`
+    '''
+    return isinstance(anomaly, _SCALAR_TYPES) and \
+        isinstance(eccentricity, _SCALAR_TYPES)
+
+
+def _get_beta(eccentricity) -> np.ndarray:
+    '''Half-angle ratio between eccentric and true anomaly, Ref. 5
 
     Args:
-        mean_anomaly (`float`): semi-major axis of the orbit [m]
-        eccentricity (`float`): eccentricity of the orbit
+        eccentricity (`float` or `np.ndarray`): eccentricity in [0, 1)
 
     Returns:
-        true anomaly (`float`)
+        `np.ndarray` e / (1 + sqrt(1 - e^2)), NaN for e outside [0, 1)
     '''
-    return convert_anomaly_eccentric_to_true(
-        eccentric_anomaly=convert_anomaly_mean_to_eccentric(
-            mean_anomaly=mean_anomaly, eccentricity=eccentricity),
-        eccentricity=eccentricity)
+    eccentricity = np.asarray(eccentricity, dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        beta = eccentricity / (1 + np.sqrt(1 - eccentricity**2))
+    return np.where((eccentricity >= 0) & (eccentricity < 1), beta, np.nan)
 
 
-def convert_anomaly_true_to_mean(
-        true_anomaly: float, eccentricity: float) -> float:
-    '''Convert the true anomaly to mean anomaly
+def _get_output(value):
+    '''Unwrap a 0-d result, so that scalar inputs give a `float`
 
     Args:
-        true_anomaly (`float`): semi-major axis of the orbit [m]
-        eccentricity (`float`): eccentricity of the orbit
+        value (`np.ndarray`): result of a conversion
 
     Returns:
-        mean anomaly (`float`)
+        `float` or `np.ndarray`
     '''
-    return convert_anomaly_eccentric_to_mean(
-        eccentric_anomaly=convert_anomaly_true_to_eccentric(
-            true_anomaly=true_anomaly, eccentricity=eccentricity),
-        eccentricity=eccentricity)
+    return float(value) if np.ndim(value) == 0 else value
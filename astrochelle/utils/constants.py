@@ -7,13 +7,16 @@
 # REFERENCES:
 #   [1] Vallado, David A. Fundamentals of astrodynamics and applications.
 #       First edition.
+#   [2] IERS Bulletin C, Leap_Second.dat.
+#       https://hpiers.obspm.fr/iers/bul/bulc/Leap_Second.dat
 # ------------------------------------------------------------------------------
 
 ##################
 # Math constants #
 ##################
 
-# TODO
+# Radians in an arcsecond #
+ARCSECONDS_TO_RADIANS = 3.141592653589793 / 648000
 
 #################################
 # Calendar and timing constants #
@@ -22,6 +25,10 @@
 # Seconds in a day #
 SECONDS_IN_DAY = 86400
 
+# Nanoseconds in a second and in a day #
+NANOSECONDS_IN_SECOND = 1000000000
+NANOSECONDS_IN_DAY = SECONDS_IN_DAY * NANOSECONDS_IN_SECOND
+
 # Minimum allowed calendar year for UTC to MJD conversion #
 YEAR_MIN = -4713  # 4713 BC from Ref. 1, page 67
 
@@ -35,6 +42,49 @@ DAYS_IN_MONTH = {
 # Offset between JD and MJD #
 MJD_OFFSET = 2400000.5
 
+# MJD of the Unix (and numpy datetime64) epoch, 1970-01-01 #
+MJD_UNIX_EPOCH = 40587
+
+# Leap seconds: (UTC MJD from which it applies, TAI-UTC [s]) #
+# From Ref. 2
+# Add a row here whenever IERS announces a new leap second
+LEAP_SECONDS = (
+    (41317, 10),  # 1972-01-01
+    (41499, 11),  # 1972-07-01
+    (41683, 12),  # 1973-01-01
+    (42048, 13),  # 1974-01-01
+    (42413, 14),  # 1975-01-01
+    (42778, 15),  # 1976-01-01
+    (43144, 16),  # 1977-01-01
+    (43509, 17),  # 1978-01-01
+    (43874, 18),  # 1979-01-01
+    (44239, 19),  # 1980-01-01
+    (44786, 20),  # 1981-07-01
+    (45151, 21),  # 1982-07-01
+    (45516, 22),  # 1983-07-01
+    (46247, 23),  # 1985-07-01
+    (47161, 24),  # 1988-01-01
+    (47892, 25),  # 1990-01-01
+    (48257, 26),  # 1991-01-01
+    (48804, 27),  # 1992-07-01
+    (49169, 28),  # 1993-07-01
+    (49534, 29),  # 1994-07-01
+    (50083, 30),  # 1996-01-01
+    (50630, 31),  # 1997-07-01
+    (51179, 32),  # 1999-01-01
+    (53736, 33),  # 2006-01-01
+    (54832, 34),  # 2009-01-01
+    (56109, 35),  # 2012-07-01
+    (57204, 36),  # 2015-07-01
+    (57754, 37),  # 2017-01-01
+)
+
+# TT-TAI [s] #
+TT_MINUS_TAI = 32.184
+
+# TAI-GPS [s] #
+TAI_MINUS_GPS = 19
+
 # GGM05S [m^3/s^2] #
 # TODO need source here
 GM_EARTH = 3.986004415e14
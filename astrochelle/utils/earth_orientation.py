@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# ------------------------------------------------------------------------------
+# earth_orientation
+# DESCRIPTION: Earth orientation parameters (UT1-UTC, polar motion, LOD)
+# REFERENCES:
+#   [1] IERS Rapid Service/Prediction Center, "Format of finals2000A".
+#       https://maia.usno.navy.mil/ser7/readme.finals2000A
+#   [2] Petit, G. and Luzum, B. (eds.). IERS Conventions (2010). IERS
+#       Technical Note 36. Section 5.5.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import os
+import numpy as np
+
+# Astrochelle imports
+from astrochelle.utils.constants import NANOSECONDS_IN_DAY, \
+    ARCSECONDS_TO_RADIANS
+from astrochelle.utils.epoch import Epoch, EpochArray, convert_time_system, \
+    get_tai_minus_utc
+
+# Constants
+EOP_CACHE_SIZE = 256  # scalar epochs kept by `interpolate(..., cache=True)`
+EOP_CACHE_SUFFIX = '.npy'  # cache file is the text file name plus this
+
+# Columns of the finals2000A format (0-indexed slices of each line), Ref. 1
+_FINALS_COLUMNS = {
+    'mean_julian_day': slice(7, 15),
+    'polar_motion_x': slice(18, 27),  # [arcsec]
+    'polar_motion_y': slice(37, 46),  # [arcsec]
+    'ut1_minus_utc': slice(58, 68),  # [s]
+    'length_of_day': slice(79, 86),  # [ms]
+}
+
+# Rows of the columnar cache, in order
+_CACHE_ROWS = ('mean_julian_day', 'polar_motion_x', 'polar_motion_y',
+               'ut1_minus_tai', 'length_of_day')
+
+##################
+# Error Handling #
+##################
+
+
+class EarthOrientationException(Exception):
+    '''Exceptions related to Earth orientation parameters
+    '''
+
+    def __init__(
+        self,
+        msg: str = "Something went wrong in earth_orientation.py."
+    ):
+
+        super().__init__(msg)
+
+
+################################
+# Earth Orientation Parameters #
+################################
+class EarthOrientationParameters():
+    '''Daily Earth orientation parameters, interpolated to any epoch
+
+    Attributes:
+        path (`str`): IERS finals2000A text file
+        cache_path (`str`): binary columnar cache of the text file
+        mean_julian_day (`np.ndarray`): UTC mean julian day of each row
+        polar_motion_x (`np.ndarray`): polar motion x of each row [rad]
+        polar_motion_y (`np.ndarray`): polar motion y of each row [rad]
+        ut1_minus_tai (`np.ndarray`): UT1-TAI of each row [s]
+        length_of_day (`np.ndarray`): excess length of day of each row [s],
+            NaN where the file has none
+
+    Notes:
+        The first read parses the text file and writes `cache_path` (one
+        float64 array of shape (5, rows), each column of the file contiguous).
+        Later reads memory-map the cache, so starting a process costs almost
+        nothing and the table is shared between processes by the page cache.
+        The cache is rebuilt whenever the text file is newer. If it can't be
+        written the parsed table is kept in memory.
+
+        UT1-UTC jumps by one second at each leap second, so rows are stored
+        and interpolated as UT1-TAI, which is continuous, Ref. 2.
+    '''
+
+    def __init__(self, path: str, cache_path: str = None):
+        '''Load a finals2000A file
+
+        Args:
+            path (`str`): IERS finals2000A text file (finals2000A.all,
+                finals2000A.data or finals2000A.daily)
+            cache_path (`str`): where to keep the binary cache, defaults to
+                path plus EOP_CACHE_SUFFIX
+        '''
+        self.path = path
+        self.cache_path = cache_path if cache_path is not None else \
+            path + EOP_CACHE_SUFFIX
+
+        table = self._load()
+        if table.shape[1] < 2:
+            raise EarthOrientationException(
+                f"Need at least 2 rows of EOP data in {path}.")
+        for name, row in zip(_CACHE_ROWS, table):
+            setattr(self, name, row)
+
+        # Scalar epochs, cached per instance so separate tables don't mix.
+        # A plain dict (in least recently used order) rather than an
+        # lru_cache of the bound method, which would be a reference cycle
+        self._interpolate_cache = {}
+
+    def _load(self) -> np.ndarray:
+        '''Memory-map the cache, rebuilding it from the text file if stale
+
+        Returns:
+            `np.ndarray` of shape (5, rows), see _CACHE_ROWS
+        '''
+        try:
+            if os.path.getmtime(self.cache_path) >= \
+                    os.path.getmtime(self.path):
+                table = np.load(self.cache_path, mmap_mode='r')
+                if table.ndim == 2 and table.shape[0] == len(_CACHE_ROWS):
+                    return table
+        except (OSError, ValueError):
+            pass
+
+        table = parse_finals(self.path)
+
+        # Write a temporary file and rename it, so that other processes never
+        # map a half-written cache
+        temporary_path = f'{self.cache_path}.{os.getpid()}.tmp'
+        try:
+            with open(temporary_path, 'wb') as cache_file:
+                np.save(cache_file, table)
+            os.replace(temporary_path, self.cache_path)
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            return table
+        return np.load(self.cache_path, mmap_mode='r')
+
+    def interpolate(self, epoch, cache: bool = False) -> tuple:
+        '''Earth orientation parameters at an epoch
+
+        Args:
+            epoch (`Epoch` or `EpochArray`): epoch in any time system
+            cache (`bool`): reuse results for the last EOP_CACHE_SIZE scalar
+                epochs, keyed on their (day, nanoseconds, time system) values
+
+        Returns:
+            tuple (`float` for an `Epoch`, `np.ndarray` for an `EpochArray`)
+                polar motion x [rad]
+                polar motion y [rad]
+                UT1-UTC [s]
+                excess length of day [s]
+
+        Notes:
+            Linear interpolation between the daily rows. Epochs outside of
+            the table raise, as extrapolating EOPs is never accurate.
+        '''
+        if isinstance(epoch, Epoch):
+            arguments = (epoch.mean_julian_day, epoch.nanoseconds_of_day,
+                         epoch.time_system)
+            if cache:
+                return self._interpolate_cached(arguments)
+            return self._interpolate_split(*arguments)
+
+        if isinstance(epoch, EpochArray):
+            return self._interpolate_split(
+                epoch.mean_julian_day, epoch.nanoseconds_of_day,
+                epoch.time_system)
+
+        raise EarthOrientationException(
+            f"Expected an Epoch or EpochArray, got {type(epoch).__name__}.")
+
+    def get_ut1_minus_utc(self, epoch, cache: bool = False):
+        '''UT1-UTC at an epoch, see `interpolate`
+
+        Args:
+            epoch (`Epoch` or `EpochArray`): epoch in any time system
+            cache (`bool`): see `interpolate`
+
+        Returns:
+            UT1-UTC [s] (`float`, or `np.ndarray` for an `EpochArray`)
+        '''
+        return self.interpolate(epoch, cache)[2]
+
+    def get_polar_motion(self, epoch, cache: bool = False) -> tuple:
+        '''Polar motion at an epoch, see `interpolate`
+
+        Args:
+            epoch (`Epoch` or `EpochArray`): epoch in any time system
+            cache (`bool`): see `interpolate`
+
+        Returns:
+            tuple (`float` for an `Epoch`, `np.ndarray` for an `EpochArray`)
+                polar motion x [rad]
+                polar motion y [rad]
+        '''
+        return self.interpolate(epoch, cache)[:2]
+
+    def _interpolate_cached(self, arguments: tuple) -> tuple:
+        '''Interpolate at a scalar time through the per instance LRU cache,
+        see `interpolate`
+
+        Args:
+            arguments (`tuple`): (day, nanoseconds, time system)
+        '''
+        cache = self._interpolate_cache
+        values = cache.pop(arguments, None)
+        if values is None:
+            values = self._interpolate_split(*arguments)
+            if len(cache) >= EOP_CACHE_SIZE:
+                # Evict the least recently used entry
+                del cache[next(iter(cache))]
+        cache[arguments] = values
+        return values
+
+    def _interpolate_split(
+            self,
+            mean_julian_day,
+            nanoseconds_of_day,
+            time_system: str) -> tuple:
+        '''Interpolate at a split (day, nanoseconds) time, see `interpolate`
+        '''
+        is_array = isinstance(mean_julian_day, np.ndarray)
+        mean_julian_day, nanoseconds_of_day = convert_time_system(
+            mean_julian_day, nanoseconds_of_day, time_system, 'UTC')
+        days = np.asarray(mean_julian_day + nanoseconds_of_day /
+                          NANOSECONDS_IN_DAY, dtype=float)
+
+        if days.size and (days.min() < self.mean_julian_day[0] or
+                          days.max() > self.mean_julian_day[-1]):
+            raise EarthOrientationException(
+                "Epoch outside of the EOP table, MJD "
+                f"{self.mean_julian_day[0]} to {self.mean_julian_day[-1]}.")
+
+        # Row to the left of each epoch, and the weight of the row after it
+        left = np.clip(
+            np.searchsorted(self.mean_julian_day, days, side='right') - 1,
+            0, len(self.mean_julian_day) - 2)
+        weight = (days - self.mean_julian_day[left]) / \
+            (self.mean_julian_day[left + 1] - self.mean_julian_day[left])
+
+        def interpolate_row(row):
+            return row[left] + weight * (row[left + 1] - row[left])
+
+        values = (
+            interpolate_row(self.polar_motion_x),
+            interpolate_row(self.polar_motion_y),
+            interpolate_row(self.ut1_minus_tai) +
+            get_tai_minus_utc(mean_julian_day),
+            interpolate_row(self.length_of_day),
+        )
+        if is_array:
+            return values
+        return tuple(float(value) for value in values)
+
+
+def parse_finals(path: str) -> np.ndarray:
+    '''Parse an IERS finals2000A text file into the columnar cache layout
+
+    Args:
+        path (`str`): finals2000A text file, Ref. 1
+
+    Returns:
+        `np.ndarray` of shape (5, rows): UTC mean julian day, polar motion x
+            [rad], polar motion y [rad], UT1-TAI [s] and excess length of day
+            [s] (NaN where missing)
+
+    Notes:
+        Rows without polar motion or UT1-UTC (the far end of the predictions)
+        are skipped. The Bulletin B columns are ignored.
+    '''
+    def field(line: str, name: str) -> float:
+        text = line[_FINALS_COLUMNS[name]].strip()
+        return float(text) if text else np.nan
+
+    with open(path) as finals_file:
+        rows = [
+            [field(line, name) for name in _FINALS_COLUMNS]
+            for line in finals_file if line.strip()
+        ]
+    table = np.array(rows, dtype=float).reshape(-1, len(_FINALS_COLUMNS)).T
+    table = table[:, ~np.isnan(table[:4]).any(axis=0)]
+
+    mean_julian_day = table[0]
+    if np.any(np.diff(mean_julian_day) <= 0):
+        raise EarthOrientationException(
+            f"EOP rows in {path} are not in increasing MJD order.")
+
+    return np.ascontiguousarray([
+        mean_julian_day,
+        table[1] * ARCSECONDS_TO_RADIANS,
+        table[2] * ARCSECONDS_TO_RADIANS,
+        table[3] - get_tai_minus_utc(mean_julian_day.astype(np.int64)),
+        table[4] / 1000,
+    ])
@@ -13,19 +13,151 @@
 #       Copyright International Astronomical Union Standards of Fundamental
 #       Astronomy (http://www.iausofa.org)”.
 #       Documentation: https://www.iausofa.org/2021_0512_C/sofa/sofa_ts_c.pdf
+#   [4] Kaplan, George H. "The IAU Resolutions on Astronomical Reference
+#       Systems, Time Scales, and Earth Rotation Models". USNO Circular 179.
+#       2005.
+#   [5] Fairhead, L. and Bretagnon, P. "An analytical formula for the time
+#       transformation TB-TT". Astronomy and Astrophysics 229, 240-247. 1990.
 # TODO:
 #   Should probably eventually implement `iauDtf2d` from Ref. 3
 #   This is the simplest implementation. May need more, including print format
 # ------------------------------------------------------------------------------
 
 # Python imports
-from math import floor
+from bisect import bisect_right
+from functools import lru_cache
+from math import floor, sin as math_sin
+import re
+import struct
+import numpy as np
 
 # Astrochelle imports
-from astrochelle.utils.constants import SECONDS_IN_DAY, YEAR_MIN, DAYS_IN_MONTH, MJD_OFFSET
+from astrochelle.utils.constants import SECONDS_IN_DAY, YEAR_MIN, \
+    DAYS_IN_MONTH, MJD_OFFSET, NANOSECONDS_IN_SECOND, NANOSECONDS_IN_DAY, \
+    LEAP_SECONDS, TT_MINUS_TAI, TAI_MINUS_GPS, MJD_UNIX_EPOCH
 
 # Constants
-ALLOWED_TIME_SYSTEMS = ['UTC']
+ALLOWED_TIME_SYSTEMS = ['UTC', 'TAI', 'TT', 'GPS', 'TDB']
+
+# Interned time system codes (index into ALLOWED_TIME_SYSTEMS)
+TIME_SYSTEM_CODES = {
+    time_system: code for code, time_system in enumerate(ALLOWED_TIME_SYSTEMS)
+}
+
+# Largest span of epochs an EpochIndex can hold [days] (keeps nanosecond keys
+# within int64)
+MAX_INDEX_SPAN_DAYS = 100000
+
+# Offsets accepted by Epoch `+`/`-` (in seconds), including NumPy scalars
+_OFFSET_TYPES = (int, float, np.integer, np.floating)
+
+# Validate calendar dates in `Epoch.__init__`, see `set_epoch_validation`
+_validate_epochs = True
+
+# Binary encoding (see `Epoch.to_bytes` and `EpochArray.to_bytes`). Bump the
+# version whenever a layout changes and keep reading the old one.
+SERIALIZATION_VERSION = 1
+_EPOCH_STRUCT = struct.Struct('<BBqq')  # version, time system, day, ns
+_EPOCH_ARRAY_MAGIC = b'AEPA'
+_EPOCH_ARRAY_HEADER = struct.Struct('<4sBBxxQ')  # magic, version, time
+# system, padding, count (16 bytes, so the int64 blocks after it stay aligned)
+
+# Reason codes returned by check_validity_date_array
+DATE_VALID = 0
+DATE_INVALID_YEAR = 1
+DATE_INVALID_MONTH = 2
+DATE_INVALID_DAY = 3
+DATE_INVALID_NEGATIVE_TIME = 4
+DATE_INVALID_DAY_FRACTION = 5
+DATE_VALIDITY_REASONS = {
+    DATE_VALID: "Valid.",
+    DATE_INVALID_YEAR: f"Year is less than {YEAR_MIN}.",
+    DATE_INVALID_MONTH: "Month is outside of the range [1,12].",
+    DATE_INVALID_DAY: "Day not in month.",
+    DATE_INVALID_NEGATIVE_TIME: "Hours, minutes, or seconds negative.",
+    DATE_INVALID_DAY_FRACTION: "Day fraction greater than a day.",
+}
+
+# Leap second table split into columns for bisect / searchsorted
+_LEAP_SECOND_MJDS_LIST = [mjd for mjd, _ in LEAP_SECONDS]
+_LEAP_SECOND_MJDS = np.array(_LEAP_SECOND_MJDS_LIST, dtype=np.int64)
+_LEAP_SECOND_OFFSETS = np.array(
+    [offset for _, offset in LEAP_SECONDS], dtype=np.int64)
+
+# Fixed time system offsets [ns]
+_TT_MINUS_TAI_NANOSECONDS = round(TT_MINUS_TAI * NANOSECONDS_IN_SECOND)
+_TAI_MINUS_GPS_NANOSECONDS = TAI_MINUS_GPS * NANOSECONDS_IN_SECOND
+
+# TDB-TT series modes and cache spacing, see get_tdb_minus_tt
+TDB_MINUS_TT_MODES = ('precise', 'fast')
+TDB_CACHE_NODES_PER_DAY = 4
+
+# Leading terms of the TDB-TT series of Ref. 5 (as tabulated in iauDtdb in
+# Ref. 3), one table per power of Julian millennia since J2000. Rows are
+# (amplitude [s], frequency [rad/millennium], phase [rad])
+_TDB_MINUS_TT_SERIES = (
+    (
+        (1656.674564e-6, 6283.075849991, 6.240054195),
+        (22.417471e-6, 5753.384884897, 4.296977442),
+        (13.839792e-6, 12566.151699983, 6.196904410),
+        (4.770086e-6, 529.690965095, 0.444401603),
+        (4.676740e-6, 6069.776754553, 4.021195093),
+        (2.256707e-6, 213.299095438, 5.543113262),
+        (1.694205e-6, -3.523118349, 5.025132748),
+        (1.554905e-6, 77713.771467920, 5.198467090),
+        (1.276839e-6, 7860.419392439, 5.988822341),
+        (1.193379e-6, 5223.693919802, 3.649823730),
+        (1.115322e-6, 3930.209696220, 1.422745069),
+        (0.794185e-6, 11506.769769794, 2.322313077),
+        (0.447061e-6, 26.298319800, 3.615796498),
+        (0.435206e-6, -398.149003408, 4.349338347),
+        (0.600309e-6, 1577.343542448, 2.678271909),
+        (0.496817e-6, 6208.294251424, 5.696701824),
+        (0.486306e-6, 5884.926846583, 0.520007179),
+        (0.432392e-6, 74.781598567, 2.435898309),
+        (0.468597e-6, 6244.942814354, 5.866398759),
+        (0.375510e-6, 5507.553238667, 4.103476804),
+        (0.243085e-6, -775.522611324, 3.651837925),
+        (0.173435e-6, 18849.227549974, 6.153743485),
+        (0.230685e-6, 5856.477659115, 4.773852582),
+        (0.203747e-6, 12036.460734888, 4.333987818),
+        (0.143935e-6, -796.298006816, 5.957517795),
+        (0.159080e-6, 10977.078804699, 1.890075226),
+        (0.119979e-6, 38.133035638, 4.551585768),
+        (0.118971e-6, 5486.777843175, 1.914547226),
+        (0.116120e-6, 1059.381930189, 0.873504123),
+        (0.137927e-6, 11790.629088659, 1.135934669),
+    ),
+    (
+        (102.156724e-6, 6283.075849991, 4.249032005),
+        (1.706807e-6, 12566.151699983, 4.205904248),
+        (0.269668e-6, 213.299095438, 3.400290479),
+        (0.265919e-6, 529.690965095, 5.836047367),
+        (0.210568e-6, -3.523118349, 6.262738348),
+        (0.077996e-6, 5223.693919802, 4.670344204),
+    ),
+    (
+        (4.322990e-6, 6283.075849991, 2.642893748),
+        (0.406495e-6, 0.0, 4.712388980),
+        (0.122605e-6, 12566.151699983, 2.438140634),
+    ),
+    (
+        (0.143388e-6, 6283.075849991, 1.131453581),
+    ),
+    (
+        (0.003826e-6, 6283.075849991, 5.705257275),
+    ),
+)
+
+# int64 nanosecond limits: datetime64 NaT, and the most days an int64 count
+# of nanoseconds can span (either side of 1970 for datetime64, or between two
+# epochs in an EpochArray difference)
+_NAT = np.iinfo(np.int64).min
+_INT64_NANOSECONDS_MAX_DAYS = np.iinfo(np.int64).max // NANOSECONDS_IN_DAY - 1
+
+# Days in each month indexed by month number (index 0 unused)
+_DAYS_IN_MONTH_ARRAY = np.array(
+    [0] + [DAYS_IN_MONTH[month] for month in range(1, 13)])
 
 ##################
 # Error Handling #
@@ -48,6 +180,8 @@ class EpochException(Exception):
 # Epoch #
 #########
 class Epoch():
+    __slots__ = ('_time_system_code', 'mean_julian_day', 'nanoseconds_of_day')
+
     def __init__(
         self,
         time_system: str = 'UTC',
@@ -80,179 +214,1907 @@ class Epoch():
         Attributes:
             time_system (`str`): time system representation to initialize in
                 see ALLOWED_TIME_SYSTEMS in `Constants` section
-            mean_julian_day (`float`): mean julian day for zero hours
+            mean_julian_day (`int`): mean julian day for zero hours
+            nanoseconds_of_day (`int`): nanoseconds past zero hours,
+                in [0, NANOSECONDS_IN_DAY)
             day_fraction (`float`): fraction of day past zero hours
+                (derived from nanoseconds_of_day)
+
+        Notes:
+            Time is stored as two integers so that repeated additions (e.g. a
+            propagator timestep) accumulate exactly, without floating point
+            drift. `__slots__` keeps each instance small.
+        '''
+        self._time_system_code = _get_time_system_code(time_system)
+
+        if mean_julian_day is not None:
+            # Sweet, no conversions required! Split any fractional MJD into
+            # the nanoseconds of day
+            whole_days = floor(mean_julian_day)
+            nanoseconds = round(
+                (mean_julian_day - whole_days) * NANOSECONDS_IN_DAY)
+            if day_fraction is not None:
+                nanoseconds += round(day_fraction * NANOSECONDS_IN_DAY)
+
+            rollover, self.nanoseconds_of_day = divmod(
+                nanoseconds, NANOSECONDS_IN_DAY)
+            self.mean_julian_day = int(whole_days) + rollover
+            return
+
+        # Make sure that all required inputs are provided
+        if None in (year, month, day, hours, minutes):
+            raise EpochException(
+                msg="If providing ymdhms, must provide ALL components.")
+
+        # If seconds weren't provided, set to zero
+        if seconds is None:
+            seconds = 0
+
+        # Check validity if inputted in calendar date format
+        if _validate_epochs:
+            flag_valid, msg = check_validity_date(
+                year=year, month=month, day=day, hours=hours,
+                minutes=minutes, seconds=seconds
+            )
+
+            if not flag_valid:
+                raise EpochException(msg)
+
+        # Convert to MJD and nanoseconds of day
+        self.mean_julian_day, self.nanoseconds_of_day = _calendar_to_split(
+            year, month, day, hours, minutes, seconds)
+
+    @classmethod
+    def from_mjd_unchecked(
+            cls,
+            mean_julian_day: int,
+            nanoseconds_of_day: int,
+            time_system: str = 'UTC'):
+        '''Build an `Epoch` from trusted, already normalized fields, e.g. when
+        replaying an archive that was validated when it was written
+
+        Args:
+            mean_julian_day (`int`): mean julian day for zero hours
+            nanoseconds_of_day (`int`): nanoseconds past zero hours, must be
+                in [0, NANOSECONDS_IN_DAY)
+            time_system (`str`): see ALLOWED_TIME_SYSTEMS
+
+        Returns:
+            `Epoch` (garbage in, garbage out: only the time system is checked)
+        '''
+        return _new_epoch(mean_julian_day, nanoseconds_of_day,
+                          _get_time_system_code(time_system))
+
+    @classmethod
+    def from_calendar_unchecked(
+            cls,
+            year: int,
+            month: int,
+            day: int,
+            hours: int = 0,
+            minutes: int = 0,
+            seconds: float = 0,
+            time_system: str = 'UTC'):
+        '''Build an `Epoch` from a trusted calendar date, skipping
+        `check_validity_date`
+
+        Args:
+            year (`int`): calendar year
+            month (`int`): calendar month as integer [1,12]
+            day (`int`): calendar day
+            hours (`int`): hours (24 hour format)
+            minutes (`int`): minutes
+            seconds (`float`): seconds
+            time_system (`str`): see ALLOWED_TIME_SYSTEMS
+
+        Returns:
+            `Epoch` (an invalid date gives a meaningless epoch, not an error)
+        '''
+        return _new_epoch(
+            *_calendar_to_split(year, month, day, hours, minutes, seconds),
+            _get_time_system_code(time_system))
+
+    @property
+    def time_system(self) -> str:
+        '''Time system representation, see ALLOWED_TIME_SYSTEMS
+        '''
+        return ALLOWED_TIME_SYSTEMS[self._time_system_code]
+
+    @time_system.setter
+    def time_system(self, time_system: str):
+        self._time_system_code = _get_time_system_code(time_system)
+
+    @property
+    def day_fraction(self) -> float:
+        '''Fraction of day past zero hours
+        '''
+        return self.nanoseconds_of_day / NANOSECONDS_IN_DAY
+
+    @day_fraction.setter
+    def day_fraction(self, day_fraction: float):
+        rollover, self.nanoseconds_of_day = divmod(
+            round(day_fraction * NANOSECONDS_IN_DAY), NANOSECONDS_IN_DAY)
+        self.mean_julian_day += rollover
+
+    def _split_operand(self, operand) -> tuple:
+        '''Split an operand of `+`/`-` into (days, nanoseconds)
+
+        Args:
+            operand (`Epoch` or `float`): if `float`, [s]
+
+        Returns:
+            tuple
+                days (`int`)
+                nanoseconds (`int`)
+            or `NotImplemented` if operand is neither an `Epoch` nor a number
+        '''
+        if isinstance(operand, _OFFSET_TYPES):
+            # Float
+            return 0, _offset_to_nanoseconds(operand)
+
+        if not isinstance(operand, Epoch):
+            # Let the reflected operator (e.g. EpochArray) handle it
+            return NotImplemented
+
+        # Check that the time_systems are the same
+        if self._time_system_code != operand._time_system_code:
+            raise EpochException(
+                f"Mismatch ({self.time_system},{operand.time_system})")
+
+        return operand.mean_julian_day, operand.nanoseconds_of_day
+
+    def __add__(self, to_add):
+        '''Overloaded addition operator, including rollover considerations
+        (epoch+epoch)
+
+        Args:
+            to_add (`Epoch` or `float`): epoch or float you want to add
+            to the current epoch
+                if `float`, [s]
+
+        Returns:
+            `Epoch` result of addition
+        '''
+        split = self._split_operand(to_add)
+        if split is NotImplemented:
+            return NotImplemented
+        days, nanoseconds = split
+
+        # Account for rollover (constant time for any offset size)
+        rollover, new_nanoseconds = divmod(
+            self.nanoseconds_of_day + nanoseconds, NANOSECONDS_IN_DAY)
+
+        # Initialize new Epoch
+        return _new_epoch(
+            self.mean_julian_day + days + rollover,
+            new_nanoseconds,
+            self._time_system_code
+        )
+
+    def __iadd__(self, to_add):
+        '''Overloaded addition (in place) operator, including rollover considerations
+
+        Args:
+            to_add (`Epoch` or `float`): epoch or float you want to add
+            to the current epoch
+                if `float`, [s]
+
+        Modifies:
+            self.mean_julian_day
+            self.nanoseconds_of_day
+        '''
+        if isinstance(to_add, _OFFSET_TYPES):
+            # Float
+            self.nanoseconds_of_day += _offset_to_nanoseconds(to_add)
+
+        elif not isinstance(to_add, Epoch):
+            # Fall back to __add__ and the reflected operator
+            return NotImplemented
+
+        else:
+            # Epoch
+
+            # Check that the time_systems are the same
+            if self._time_system_code != to_add._time_system_code:
+                raise EpochException(
+                    f"Mismatch ({self.time_system},{to_add.time_system})")
+
+            self.mean_julian_day += to_add.mean_julian_day
+            self.nanoseconds_of_day += to_add.nanoseconds_of_day
+
+        # Account for rollover, modifying the fields directly so that no
+        # intermediate Epoch is constructed
+        if not 0 <= self.nanoseconds_of_day < NANOSECONDS_IN_DAY:
+            rollover, self.nanoseconds_of_day = divmod(
+                self.nanoseconds_of_day, NANOSECONDS_IN_DAY)
+            self.mean_julian_day += rollover
+        return self
+
+    def __sub__(self, to_subtract):
+        '''Overloaded subtraction operator, including rollover considerations
+        (epoch+epoch)
+
+        Args:
+            to_subtract (`Epoch` or `float`): epoch or float you want to
+            subtract from the current epoch
+                if `float`, [s]
+
+        Returns:
+            `Epoch` result of addition
+        '''
+        split = self._split_operand(to_subtract)
+        if split is NotImplemented:
+            return NotImplemented
+        days, nanoseconds = split
+
+        # Account for rollover (constant time for any offset size)
+        rollover, new_nanoseconds = divmod(
+            self.nanoseconds_of_day - nanoseconds, NANOSECONDS_IN_DAY)
+
+        # Initialize new Epoch
+        return _new_epoch(
+            self.mean_julian_day - days + rollover,
+            new_nanoseconds,
+            self._time_system_code
+        )
+
+    def __isub__(self, to_subtract):
+        '''Overloaded subtraction (in place) operator, including rollover 
+        considerations
+
+        Args:
+            to_subtract (`Epoch` or `float`): epoch or float you want to 
+            subtract from the current epoch
+                if `float`, [s]
+
+        Modifies:
+            self.mean_julian_day
+            self.nanoseconds_of_day
+        '''
+        if isinstance(to_subtract, _OFFSET_TYPES):
+            # Float
+            self.nanoseconds_of_day -= _offset_to_nanoseconds(to_subtract)
+
+        elif not isinstance(to_subtract, Epoch):
+            # Fall back to __sub__ and the reflected operator
+            return NotImplemented
+
+        else:
+            # Epoch
+
+            # Check that the time_systems are the same
+            if self._time_system_code != to_subtract._time_system_code:
+                raise EpochException(
+                    f"Mismatch ({self.time_system},{to_subtract.time_system})")
+
+            self.mean_julian_day -= to_subtract.mean_julian_day
+            self.nanoseconds_of_day -= to_subtract.nanoseconds_of_day
+
+        # Account for rollover, modifying the fields directly so that no
+        # intermediate Epoch is constructed
+        if not 0 <= self.nanoseconds_of_day < NANOSECONDS_IN_DAY:
+            rollover, self.nanoseconds_of_day = divmod(
+                self.nanoseconds_of_day, NANOSECONDS_IN_DAY)
+            self.mean_julian_day += rollover
+        return self
+
+    def nanoseconds_since(self, other):
+        '''Exact elapsed time from other to this epoch
+
+        Args:
+            other (`Epoch` or `EpochArray`): earlier (or later) epoch(s) in
+                the same time system
+
+        Returns:
+            elapsed time [ns] (`int`, or int64 `np.ndarray` for an
+                `EpochArray`), negative if other is later
+        '''
+        return _get_elapsed_nanoseconds(self, other)
+
+    def seconds_since(self, other):
+        '''Elapsed time from other to this epoch, e.g. a propagator step
+
+        Args:
+            other (`Epoch` or `EpochArray`): earlier (or later) epoch(s) in
+                the same time system
+
+        Returns:
+            elapsed time [s] (`float`, or `np.ndarray` for an `EpochArray`),
+                negative if other is later
+
+        Notes:
+            Computed from the exact day and nanosecond differences, so the
+            result is good to float64 rounding (about 1e-7 s across a
+            century), unlike `(mjd + day_fraction) * SECONDS_IN_DAY`
+            differences, which lose about a microsecond to cancellation.
+        '''
+        return _get_elapsed_seconds(self, other)
+
+    def to_calendar(self) -> tuple:
+        '''Convert to calendar date and time of day
+
+        Returns:
+            tuple
+                year (`int`): calendar year
+                month (`int`): calendar month as integer [1,12]
+                day (`int`): calendar day
+                hours (`int`): hours (24 hour format)
+                minutes (`int`): minutes
+                seconds (`float`): seconds
+        '''
+        return to_calendar(self.mean_julian_day, self.nanoseconds_of_day)
+
+    @classmethod
+    def from_datetime64(cls, value, time_system: str = 'UTC'):
+        '''Build an `Epoch` from a datetime64 value
+
+        Args:
+            value (`np.datetime64`): datetime64 value of any unit
+            time_system (`str`): time system the value is in
+                see ALLOWED_TIME_SYSTEMS in `Constants` section
+
+        Returns:
+            `Epoch`
+        '''
+        nanoseconds = int(np.datetime64(value, 'ns').view(np.int64))
+        if nanoseconds == _NAT:
+            raise EpochException("Cannot convert NaT to an epoch.")
+
+        days, nanoseconds_of_day = divmod(nanoseconds, NANOSECONDS_IN_DAY)
+        return _new_epoch(days + MJD_UNIX_EPOCH, nanoseconds_of_day,
+                          _get_time_system_code(time_system))
+
+    def to_datetime64(self) -> np.datetime64:
+        '''Convert to datetime64[ns]
+
+        Returns:
+            `np.datetime64` in this epoch's time system
+        '''
+        days = self.mean_julian_day - MJD_UNIX_EPOCH
+        if abs(days) > _INT64_NANOSECONDS_MAX_DAYS:
+            raise EpochException("Epoch outside of the datetime64[ns] range.")
+
+        return np.int64(days * NANOSECONDS_IN_DAY +
+                        self.nanoseconds_of_day).view('datetime64[ns]')
+
+    def to_bytes(self) -> bytes:
+        '''Compact binary encoding, see `from_bytes`
+
+        Returns:
+            18 `bytes`: little-endian version (uint8), time system code
+                (uint8), mean julian day (int64), nanoseconds of day (int64)
+        '''
+        return _EPOCH_STRUCT.pack(
+            SERIALIZATION_VERSION, self._time_system_code,
+            self.mean_julian_day, self.nanoseconds_of_day)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        '''Decode an `Epoch` written by `to_bytes`
+
+        Args:
+            data (`bytes`): encoded epoch
+
+        Returns:
+            `Epoch`
+        '''
+        try:
+            version, code, mean_julian_day, nanoseconds_of_day = \
+                _EPOCH_STRUCT.unpack(data)
+        except struct.error:
+            raise EpochException(
+                f"Expected {_EPOCH_STRUCT.size} bytes for an Epoch, "
+                f"got {len(data)}.")
+        _check_serialization(version, code)
+
+        return _new_epoch(mean_julian_day, nanoseconds_of_day, code)
+
+    def __reduce__(self):
+        '''Pickle through the compact encoding
+        '''
+        return (Epoch.from_bytes, (self.to_bytes(),))
+
+    def to_time_system(
+            self,
+            time_system: str,
+            tdb_mode: str = 'precise',
+            tdb_cache: bool = False):
+        '''Convert to another time system
+
+        Args:
+            time_system (`str`): see ALLOWED_TIME_SYSTEMS
+            tdb_mode (`str`): TDB-TT series, see `get_tdb_minus_tt`
+            tdb_cache (`bool`): interpolate TDB-TT between cached nodes, see
+                `get_tdb_minus_tt`
+
+        Returns:
+            `Epoch` in the requested time system
+        '''
+        mean_julian_day, nanoseconds_of_day = convert_time_system(
+            self.mean_julian_day, self.nanoseconds_of_day,
+            self.time_system, time_system,
+            tdb_mode=tdb_mode, tdb_cache=tdb_cache)
+        return _new_epoch(mean_julian_day, nanoseconds_of_day,
+                          TIME_SYSTEM_CODES[time_system])
+
+    def __str__(self):
+        '''ISO-8601 style string with the time system, e.g.
+        2022-07-27T12:05:05.000000000 UTC
+        '''
+        year, month, day, hours, minutes, _ = self.to_calendar()
+        whole_seconds, nanoseconds = divmod(
+            self.nanoseconds_of_day % (60 * NANOSECONDS_IN_SECOND),
+            NANOSECONDS_IN_SECOND)
+        return (f"{year:04d}-{month:02d}-{day:02d}T{hours:02d}:{minutes:02d}:"
+                f"{whole_seconds:02d}.{nanoseconds:09d} {self.time_system}")
+
+    def _comparison_key(self, other) -> tuple:
+        '''Exact ordering keys of self and other, checking time systems
+
+        Args:
+            other (`Epoch`): epoch to compare with
+
+        Returns:
+            tuple
+                (mean_julian_day, nanoseconds_of_day) of self
+                (mean_julian_day, nanoseconds_of_day) of other
+        '''
+        if self._time_system_code != other._time_system_code:
+            raise EpochException(
+                f"Mismatch ({self.time_system},{other.time_system})")
+        return ((self.mean_julian_day, self.nanoseconds_of_day),
+                (other.mean_julian_day, other.nanoseconds_of_day))
+
+    def __eq__(self, other):
+        '''Exact equality of the normalized (day, nanoseconds) pair. Epochs in
+        different time systems are never equal.
+        '''
+        if not isinstance(other, Epoch):
+            return NotImplemented
+        return (self._time_system_code == other._time_system_code and
+                self.mean_julian_day == other.mean_julian_day and
+                self.nanoseconds_of_day == other.nanoseconds_of_day)
+
+    def __lt__(self, other):
+        if not isinstance(other, Epoch):
+            return NotImplemented
+        key, other_key = self._comparison_key(other)
+        return key < other_key
+
+    def __le__(self, other):
+        if not isinstance(other, Epoch):
+            return NotImplemented
+        key, other_key = self._comparison_key(other)
+        return key <= other_key
+
+    def __gt__(self, other):
+        if not isinstance(other, Epoch):
+            return NotImplemented
+        key, other_key = self._comparison_key(other)
+        return key > other_key
+
+    def __ge__(self, other):
+        if not isinstance(other, Epoch):
+            return NotImplemented
+        key, other_key = self._comparison_key(other)
+        return key >= other_key
+
+    def __hash__(self):
+        '''Hash of the normalized (day, nanoseconds) pair and time system.
+        Don't modify (`+=`, `-=`) an epoch while it is used as a dict key.
+        '''
+        return hash((self.mean_julian_day, self.nanoseconds_of_day,
+                     self._time_system_code))
+
+
+def _new_epoch(
+        mean_julian_day: int,
+        nanoseconds_of_day: int,
+        time_system_code: int) -> Epoch:
+    '''Build an `Epoch` directly from its normalized fields, skipping
+    `Epoch.__init__`
+
+    Args:
+        mean_julian_day (`int`): mean julian day for zero hours
+        nanoseconds_of_day (`int`): nanoseconds past zero hours,
+            in [0, NANOSECONDS_IN_DAY)
+        time_system_code (`int`): index into ALLOWED_TIME_SYSTEMS
+
+    Returns:
+        `Epoch`
+    '''
+    epoch = object.__new__(Epoch)
+    epoch._time_system_code = time_system_code
+    epoch.mean_julian_day = mean_julian_day
+    epoch.nanoseconds_of_day = nanoseconds_of_day
+    return epoch
+
+
+def _get_elapsed_nanoseconds(epoch, other):
+    '''Exact nanoseconds from other to epoch on the split representation
+
+    Args:
+        epoch (`Epoch` or `EpochArray`): end epoch(s)
+        other (`Epoch` or `EpochArray`): start epoch(s), same time system
+
+    Returns:
+        elapsed time [ns] (`int`, or int64 `np.ndarray` if either is an
+            `EpochArray`)
+    '''
+    _check_elapsed_operands(epoch, other)
+
+    days = epoch.mean_julian_day - other.mean_julian_day
+    if isinstance(days, np.ndarray) and \
+            np.any(np.abs(days) > _INT64_NANOSECONDS_MAX_DAYS):
+        raise EpochException(
+            "Epochs too far apart for int64 nanoseconds (about 292 years).")
+
+    return days * NANOSECONDS_IN_DAY + \
+        (epoch.nanoseconds_of_day - other.nanoseconds_of_day)
+
+
+def _get_elapsed_seconds(epoch, other):
+    '''Seconds from other to epoch on the split representation
+
+    Args:
+        epoch (`Epoch` or `EpochArray`): end epoch(s)
+        other (`Epoch` or `EpochArray`): start epoch(s), same time system
+
+    Returns:
+        elapsed time [s] (`float`, or `np.ndarray` if either is an
+            `EpochArray`)
+    '''
+    _check_elapsed_operands(epoch, other)
+
+    # Whole days give exact whole seconds, so only the (less than a day)
+    # nanosecond difference and the final sum are rounded
+    return (epoch.mean_julian_day - other.mean_julian_day) * SECONDS_IN_DAY \
+        + (epoch.nanoseconds_of_day - other.nanoseconds_of_day) \
+        / NANOSECONDS_IN_SECOND
+
+
+def _check_elapsed_operands(epoch, other):
+    '''Check that other is an epoch in the same time system as epoch
+
+    Args:
+        epoch (`Epoch` or `EpochArray`): end epoch(s)
+        other: start epoch(s)
+    '''
+    if not isinstance(other, (Epoch, EpochArray)):
+        raise EpochException(
+            f"Expected an Epoch or EpochArray, got {type(other).__name__}.")
+    if epoch.time_system != other.time_system:
+        raise EpochException(
+            f"Mismatch ({epoch.time_system},{other.time_system})")
+
+
+def _check_serialization(version: int, code: int):
+    '''Check the version and time system code of an encoded epoch
+
+    Args:
+        version (`int`): encoding version
+        code (`int`): time system code
+    '''
+    if version != SERIALIZATION_VERSION:
+        raise EpochException(
+            f"Unsupported epoch encoding version {version}.")
+    if code >= len(ALLOWED_TIME_SYSTEMS):
+        raise EpochException(f"Unknown time system code {code}.")
+
+
+def _calendar_to_split(
+        year: int,
+        month: int,
+        day: int,
+        hours: int,
+        minutes: int,
+        seconds: float) -> tuple:
+    '''Convert a scalar calendar date to (day, nanoseconds), see `to_mjd`
+
+    Returns:
+        tuple
+            mean julian day for zero hours (`int`)
+            nanoseconds past zero hours, in [0, NANOSECONDS_IN_DAY) (`int`)
+    '''
+    mean_julian_day = _get_month_start_mjd(year, month) + int(day)
+
+    rollover, nanoseconds_of_day = divmod(
+        round(((hours * 60 + minutes) * 60 + seconds)
+              * NANOSECONDS_IN_SECOND),
+        NANOSECONDS_IN_DAY)
+    return mean_julian_day + rollover, nanoseconds_of_day
+
+
+@lru_cache(maxsize=4096)
+def _get_month_start_mjd(year: int, month: int) -> int:
+    '''MJD of day zero of a month, cached since consecutive epochs (e.g. an
+    archive being replayed) share a month
+
+    Args:
+        year (`int`): calendar year
+        month (`int`): calendar month as integer [1,12]
+
+    Returns:
+        mean julian day of day zero of the month (`int`)
+    '''
+    # Same integer arithmetic as `to_mjd` (iauCal2jd in Ref. 3)
+    year, month = int(year), int(month)
+    mo_scaled = -((14 - month) // 12)
+    year_mo_scaled = year + mo_scaled
+    return (
+        (1461 * (year_mo_scaled + 4800)) // 4
+        + (367 * (month - 2 - 12 * mo_scaled)) // 12
+        - (3 * ((year_mo_scaled + 4900) // 100)) // 4
+        - 2432076
+    )
+
+
+def set_epoch_validation(enabled: bool) -> bool:
+    '''Turn calendar date validation in `Epoch.__init__` on or off for the
+    whole process, e.g. while replaying an already validated archive
+
+    Args:
+        enabled (`bool`): run `check_validity_date` for every calendar-form
+            `Epoch` (the default)
+
+    Returns:
+        previous setting (`bool`), so it can be restored
+    '''
+    global _validate_epochs
+    previous, _validate_epochs = _validate_epochs, bool(enabled)
+    return previous
+
+
+def _get_time_system_code(time_system: str) -> int:
+    '''Look up the interned code of a time system
+
+    Args:
+        time_system (`str`): see ALLOWED_TIME_SYSTEMS
+
+    Returns:
+        code (`int`)
+    '''
+    if time_system not in TIME_SYSTEM_CODES:
+        # obvious TODO lol
+        raise EpochException(
+            msg="See ALLOWED_TIME_SYSTEMS for currently supported systems."
+        )
+    return TIME_SYSTEM_CODES[time_system]
+
+
+##############
+# EpochArray #
+##############
+class EpochArray():
+    def __init__(
+        self,
+        mean_julian_day,
+        day_fraction=None,
+        time_system: str = 'UTC',
+        *,
+        nanoseconds_of_day=None
+    ):
+        '''Container for many epochs, stored as two contiguous int64 NumPy
+        arrays instead of one `Epoch` object per timestamp
+
+        Args:
+            mean_julian_day (`np.ndarray`): mean julian days for zero hours
+            day_fraction (`np.ndarray`): fractions of day past zero hours,
+                same shape as mean_julian_day
+            time_system (`str`): time system representation of every epoch
+                see ALLOWED_TIME_SYSTEMS in `Constants` section
+            nanoseconds_of_day (`np.ndarray`): nanoseconds past zero hours,
+                alternative to day_fraction (zero if neither is provided)
+
+        Attributes:
+            time_system (`str`): time system representation of every epoch
+            mean_julian_day (`np.ndarray`): int64 mean julian days
+            nanoseconds_of_day (`np.ndarray`): int64 nanoseconds past zero
+                hours, in [0, NANOSECONDS_IN_DAY)
+            day_fraction (`np.ndarray`): fractions of day past zero hours
+                (derived from nanoseconds_of_day)
+
+        Notes:
+            Normalized int64 arrays are used as-is (no copy), so slicing an
+            `EpochArray` returns a view into the same memory.
+        '''
+        _get_time_system_code(time_system)
+        self.time_system = time_system
+
+        mean_julian_day = np.asarray(mean_julian_day)
+        if nanoseconds_of_day is None:
+            nanoseconds_of_day = np.zeros(mean_julian_day.shape, np.int64)
+        nanoseconds_of_day = np.asarray(nanoseconds_of_day)
+
+        if day_fraction is not None:
+            day_fraction = np.asarray(day_fraction, dtype=np.float64)
+            if day_fraction.shape != mean_julian_day.shape:
+                raise EpochException(
+                    f"Shape mismatch ({mean_julian_day.shape},"
+                    f"{day_fraction.shape})")
+            nanoseconds_of_day = nanoseconds_of_day + np.rint(
+                day_fraction * NANOSECONDS_IN_DAY).astype(np.int64)
+
+        if mean_julian_day.shape != nanoseconds_of_day.shape:
+            raise EpochException(
+                f"Shape mismatch ({mean_julian_day.shape},"
+                f"{nanoseconds_of_day.shape})")
+
+        if not np.issubdtype(mean_julian_day.dtype, np.integer):
+            # Move any fractional part of the MJD into the nanoseconds
+            whole_days = np.floor(mean_julian_day)
+            nanoseconds_of_day = nanoseconds_of_day + np.rint(
+                (mean_julian_day - whole_days) * NANOSECONDS_IN_DAY
+            ).astype(np.int64)
+            mean_julian_day = whole_days
+
+        mean_julian_day = np.asarray(mean_julian_day, dtype=np.int64)
+        nanoseconds_of_day = np.asarray(nanoseconds_of_day, dtype=np.int64)
+
+        # Account for rollover (only touches memory if needed)
+        if np.any(nanoseconds_of_day < 0) or \
+                np.any(nanoseconds_of_day >= NANOSECONDS_IN_DAY):
+            rollover, nanoseconds_of_day = np.divmod(
+                nanoseconds_of_day, NANOSECONDS_IN_DAY)
+            mean_julian_day = mean_julian_day + rollover
+
+        self.mean_julian_day = mean_julian_day
+        self.nanoseconds_of_day = nanoseconds_of_day
+
+    @property
+    def day_fraction(self) -> np.ndarray:
+        '''Fractions of day past zero hours
+        '''
+        return self.nanoseconds_of_day / NANOSECONDS_IN_DAY
+
+    @property
+    def time_of_day(self) -> np.ndarray:
+        '''Time past zero hours as a timedelta64[ns] view of
+        nanoseconds_of_day (no copy)
+        '''
+        return self.nanoseconds_of_day.view('timedelta64[ns]')
+
+    @classmethod
+    def from_datetime64(cls, values, time_system: str = 'UTC'):
+        '''Build an `EpochArray` from datetime64 values, e.g. a pandas
+        `DatetimeIndex` or `Series`
+
+        Args:
+            values (`np.ndarray` or array-like): datetime64 values of any
+                unit (timezone-aware pandas values are converted to UTC)
+            time_system (`str`): time system the values are in
+                see ALLOWED_TIME_SYSTEMS in `Constants` section
+
+        Returns:
+            `EpochArray`
+
+        Notes:
+            datetime64[ns] input is reinterpreted as int64 without a copy and
+            split into days and nanoseconds in one vectorized pass.
+        '''
+        nanoseconds = np.asarray(values, dtype='datetime64[ns]').view(
+            np.int64)
+        if np.any(nanoseconds == _NAT):
+            raise EpochException("Cannot convert NaT to an epoch.")
+
+        days, nanoseconds_of_day = np.divmod(nanoseconds, NANOSECONDS_IN_DAY)
+        return cls(
+            days + MJD_UNIX_EPOCH,
+            time_system=time_system,
+            nanoseconds_of_day=nanoseconds_of_day
+        )
+
+    def to_datetime64(self) -> np.ndarray:
+        '''Convert to datetime64[ns] (pandas accepts the result directly,
+        e.g. `pd.DatetimeIndex(epochs.to_datetime64())`)
+
+        Returns:
+            `np.ndarray` of datetime64[ns], in this array's time system
+
+        Notes:
+            datetime64[ns] covers years 1678 to 2261.
+        '''
+        days = self.mean_julian_day - MJD_UNIX_EPOCH
+        if np.any(np.abs(days) > _INT64_NANOSECONDS_MAX_DAYS):
+            raise EpochException("Epoch outside of the datetime64[ns] range.")
+
+        return (days * NANOSECONDS_IN_DAY + self.nanoseconds_of_day).view(
+            'datetime64[ns]')
+
+    def to_bytes(self) -> bytes:
+        '''Contiguous binary encoding, see `from_bytes`
+
+        Returns:
+            `bytes`: a 16 byte header (b'AEPA', version, time system code,
+                2 padding bytes, uint64 count), then all mean julian days,
+                then all nanoseconds of day, as little-endian int64.
+                Multi-dimensional arrays are flattened.
+        '''
+        code = TIME_SYSTEM_CODES[self.time_system]
+        return b''.join((
+            _EPOCH_ARRAY_HEADER.pack(_EPOCH_ARRAY_MAGIC, SERIALIZATION_VERSION,
+                                     code, self.mean_julian_day.size),
+            self.mean_julian_day.astype('<i8', copy=False).tobytes(),
+            self.nanoseconds_of_day.astype('<i8', copy=False).tobytes()
+        ))
+
+    @classmethod
+    def from_bytes(cls, buffer):
+        '''Decode an `EpochArray` written by `to_bytes`
+
+        Args:
+            buffer (`bytes`, `memoryview` or any buffer): encoded epochs
+
+        Returns:
+            `EpochArray` whose arrays are read-only views into buffer (no
+                copy on little-endian machines)
+        '''
+        buffer = memoryview(buffer).cast('B')
+        if len(buffer) < _EPOCH_ARRAY_HEADER.size:
+            raise EpochException("Buffer too short for an EpochArray header.")
+        magic, version, code, count = _EPOCH_ARRAY_HEADER.unpack_from(buffer)
+        if magic != _EPOCH_ARRAY_MAGIC:
+            raise EpochException("Buffer is not an encoded EpochArray.")
+        _check_serialization(version, code)
+
+        size = _EPOCH_ARRAY_HEADER.size + 16 * count
+        if len(buffer) != size:
+            raise EpochException(
+                f"Expected {size} bytes for {count} epochs, got "
+                f"{len(buffer)}.")
+
+        mean_julian_day = np.frombuffer(
+            buffer, dtype='<i8', count=count,
+            offset=_EPOCH_ARRAY_HEADER.size)
+        nanoseconds_of_day = np.frombuffer(
+            buffer, dtype='<i8', count=count,
+            offset=_EPOCH_ARRAY_HEADER.size + 8 * count)
+        return cls(mean_julian_day, time_system=ALLOWED_TIME_SYSTEMS[code],
+                   nanoseconds_of_day=nanoseconds_of_day)
+
+    def __reduce__(self):
+        '''Pickle through the contiguous encoding
+        '''
+        return (EpochArray.from_bytes, (self.to_bytes(),))
+
+    @classmethod
+    def from_epochs(cls, epochs: list):
+        '''Build an `EpochArray` from a list of `Epoch`
+
+        Args:
+            epochs (`list`): `Epoch` objects, all in the same time system
+
+        Returns:
+            `EpochArray`
+        '''
+        if len(epochs) == 0:
+            return cls(np.zeros(0, dtype=np.int64))
+
+        time_system = epochs[0].time_system
+        if any(epoch.time_system != time_system for epoch in epochs):
+            raise EpochException("All epochs must share one time system.")
+
+        return cls(
+            mean_julian_day=np.array(
+                [epoch.mean_julian_day for epoch in epochs], dtype=np.int64),
+            nanoseconds_of_day=np.array(
+                [epoch.nanoseconds_of_day for epoch in epochs],
+                dtype=np.int64),
+            time_system=time_system
+        )
+
+    def to_epochs(self) -> list:
+        '''Convert to a list of `Epoch`
+
+        Returns:
+            `list` of `Epoch`
+        '''
+        time_system_code = TIME_SYSTEM_CODES[self.time_system]
+        return [
+            _new_epoch(mjd, nanoseconds, time_system_code)
+            for mjd, nanoseconds in zip(self.mean_julian_day.tolist(),
+                                        self.nanoseconds_of_day.tolist())
+        ]
+
+    def to_calendar(self) -> tuple:
+        '''Convert every epoch to calendar date and time of day
+
+        Returns:
+            tuple of `np.ndarray`
+                year, month, day, hours, minutes (int64), seconds (float64)
+        '''
+        return to_calendar(self.mean_julian_day, self.nanoseconds_of_day)
+
+    def to_time_system(
+            self,
+            time_system: str,
+            tdb_mode: str = 'precise',
+            tdb_cache: bool = False):
+        '''Convert every epoch to another time system in one array operation
+
+        Args:
+            time_system (`str`): see ALLOWED_TIME_SYSTEMS
+            tdb_mode (`str`): TDB-TT series, see `get_tdb_minus_tt`
+            tdb_cache (`bool`): interpolate TDB-TT between cached nodes, see
+                `get_tdb_minus_tt`
+
+        Returns:
+            `EpochArray` in the requested time system
+        '''
+        mean_julian_day, nanoseconds_of_day = convert_time_system(
+            self.mean_julian_day, self.nanoseconds_of_day,
+            self.time_system, time_system,
+            tdb_mode=tdb_mode, tdb_cache=tdb_cache)
+        return EpochArray(
+            mean_julian_day,
+            time_system=time_system,
+            nanoseconds_of_day=nanoseconds_of_day
+        )
+
+    def argsort(self) -> np.ndarray:
+        '''Indices that sort the epochs in time (stable)
+
+        Returns:
+            `np.ndarray` of indices
+        '''
+        return np.lexsort((self.nanoseconds_of_day, self.mean_julian_day))
+
+    def __len__(self):
+        return len(self.mean_julian_day)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        '''Element access returns an `Epoch`, slicing returns an `EpochArray`
+        (a view for basic slices, a copy for index arrays, as in NumPy)
+        '''
+        mean_julian_day = self.mean_julian_day[index]
+        nanoseconds_of_day = self.nanoseconds_of_day[index]
+
+        if np.ndim(mean_julian_day) == 0:
+            return _new_epoch(
+                int(mean_julian_day),
+                int(nanoseconds_of_day),
+                TIME_SYSTEM_CODES[self.time_system]
+            )
+
+        return EpochArray(
+            mean_julian_day,
+            time_system=self.time_system,
+            nanoseconds_of_day=nanoseconds_of_day
+        )
+
+    def _split_operand(self, operand) -> tuple:
+        '''Split an operand of `+`/`-` into (days, nanoseconds) arrays
+
+        Args:
+            operand (`Epoch`, `EpochArray`, `float`, or `np.ndarray`):
+                if a number or array of numbers, [s]
+
+        Returns:
+            tuple
+                days (`np.ndarray` or `int`)
+                nanoseconds, less than a day (`np.ndarray` or `int`)
+        '''
+        if isinstance(operand, (Epoch, EpochArray)):
+            # Check that the time_systems are the same
+            if self.time_system != operand.time_system:
+                raise EpochException(
+                    f"Mismatch ({self.time_system},{operand.time_system})")
+            return operand.mean_julian_day, operand.nanoseconds_of_day
+
+        # Split seconds into whole days first so huge offsets can't overflow
+        seconds = np.asarray(operand, dtype=np.float64)
+        days = np.floor_divide(seconds, SECONDS_IN_DAY)
+        nanoseconds = np.rint(
+            (seconds - days * SECONDS_IN_DAY) * NANOSECONDS_IN_SECOND)
+        return days.astype(np.int64), nanoseconds.astype(np.int64)
+
+    def __add__(self, to_add):
+        '''Overloaded addition operator, elementwise with rollover
+
+        Args:
+            to_add (`Epoch`, `EpochArray`, `float`, or `np.ndarray`): epoch(s)
+            or seconds to add to every epoch in the array
+                if `float` or `np.ndarray` of floats, [s]
+
+        Returns:
+            `EpochArray` result of addition
+        '''
+        days, nanoseconds = self._split_operand(to_add)
+        return EpochArray(
+            self.mean_julian_day + days,
+            time_system=self.time_system,
+            nanoseconds_of_day=self.nanoseconds_of_day + nanoseconds
+        )
+
+    def __radd__(self, to_add):
+        '''Reflected addition operator (epoch+array or float+array),
+        elementwise with rollover
+
+        Args:
+            to_add (`Epoch` or `float`): epoch or seconds added to every
+            epoch in the array
+                if `float`, [s]
+
+        Returns:
+            `EpochArray` result of addition
+        '''
+        if not isinstance(to_add, (Epoch,) + _OFFSET_TYPES):
+            return NotImplemented
+        return self.__add__(to_add)
+
+    def __rsub__(self, to_subtract_from):
+        '''Reflected subtraction operator (epoch-array), elementwise with
+        rollover
+
+        Args:
+            to_subtract_from (`Epoch`): epoch every epoch in the array is
+            subtracted from
+
+        Returns:
+            `EpochArray` result of subtraction
+        '''
+        if not isinstance(to_subtract_from, Epoch):
+            return NotImplemented
+        time_system = to_subtract_from.time_system
+        if self.time_system != time_system:
+            raise EpochException(
+                f"Mismatch ({time_system},{self.time_system})")
+        return EpochArray(
+            to_subtract_from.mean_julian_day - self.mean_julian_day,
+            time_system=self.time_system,
+            nanoseconds_of_day=(
+                to_subtract_from.nanoseconds_of_day - self.nanoseconds_of_day)
+        )
+
+    def nanoseconds_since(self, other) -> np.ndarray:
+        '''Exact elapsed time from other to each epoch, elementwise
+
+        Args:
+            other (`Epoch` or `EpochArray`): epoch(s) in the same time
+                system, broadcast against this array
+
+        Returns:
+            int64 `np.ndarray` of elapsed time [ns], negative where other is
+                later
+        '''
+        return _get_elapsed_nanoseconds(self, other)
+
+    def seconds_since(self, other) -> np.ndarray:
+        '''Elapsed time from other to each epoch, elementwise, see
+        `Epoch.seconds_since`
+
+        Args:
+            other (`Epoch` or `EpochArray`): epoch(s) in the same time
+                system, broadcast against this array
+
+        Returns:
+            `np.ndarray` of elapsed time [s], negative where other is later
+        '''
+        return _get_elapsed_seconds(self, other)
+
+    def __sub__(self, to_subtract):
+        '''Overloaded subtraction operator, elementwise with rollover
+
+        Args:
+            to_subtract (`Epoch`, `EpochArray`, `float`, or `np.ndarray`):
+            epoch(s) or seconds to subtract from every epoch in the array
+                if `float` or `np.ndarray` of floats, [s]
+
+        Returns:
+            `EpochArray` result of subtraction
+        '''
+        days, nanoseconds = self._split_operand(to_subtract)
+        return EpochArray(
+            self.mean_julian_day - days,
+            time_system=self.time_system,
+            nanoseconds_of_day=self.nanoseconds_of_day - nanoseconds
+        )
+
+
+##############
+# EpochIndex #
+##############
+class EpochIndex():
+    def __init__(self, epochs):
+        '''Sorted epoch collection with O(log n) lookups, e.g. to find the
+        ephemeris table rows to interpolate between
+
+        Args:
+            epochs (`EpochArray` or `list` of `Epoch`): epochs to index, in
+                any order, all in one time system
+
+        Attributes:
+            epochs (`EpochArray`): the epochs, sorted
+            order (`np.ndarray`): position of each sorted epoch in the input
+                (epochs = input[order])
+            time_system (`str`): time system of the epochs
+
+        Notes:
+            Lookups search an int64 array of nanoseconds since the first
+            epoch's day, so the indexed epochs may span at most
+            MAX_INDEX_SPAN_DAYS (about 270 years).
+        '''
+        if not isinstance(epochs, EpochArray):
+            epochs = EpochArray.from_epochs(list(epochs))
+        if len(epochs) == 0:
+            raise EpochException("Cannot index an empty set of epochs.")
+
+        self.order = epochs.argsort()
+        self.epochs = epochs[self.order]
+        self.time_system = epochs.time_system
+
+        self._reference_day = int(self.epochs.mean_julian_day[0])
+        span = int(self.epochs.mean_julian_day[-1]) - self._reference_day
+        if span > MAX_INDEX_SPAN_DAYS:
+            raise EpochException(
+                f"Epochs span {span} days, more than {MAX_INDEX_SPAN_DAYS}.")
+        self._keys = self._to_keys(self.epochs)
+
+    def _to_keys(self, epochs) -> np.ndarray:
+        '''Nanoseconds since the reference day, with far away epochs
+        clamped (they still sort before/after every indexed epoch)
+
+        Args:
+            epochs (`Epoch` or `EpochArray`): epochs to convert
+
+        Returns:
+            `np.ndarray` int64 keys
+        '''
+        if epochs.time_system != self.time_system:
+            raise EpochException(
+                f"Mismatch ({self.time_system},{epochs.time_system})")
+        return get_index_keys(epochs, self._reference_day)
+
+    def __len__(self):
+        return len(self.epochs)
+
+    def searchsorted(self, epochs, side: str = 'left'):
+        '''Find where epochs would be inserted to keep the order
+
+        Args:
+            epochs (`Epoch` or `EpochArray`): epochs to look up
+            side (`str`): 'left' or 'right', as in `np.searchsorted`
 
+        Returns:
+            insertion index (`int`, or `np.ndarray` for an `EpochArray`)
         '''
-        if time_system not in ALLOWED_TIME_SYSTEMS:
-            # obvious TODO lol
-            raise EpochException(
-                msg="See ALLOWED_TIME_SYSTEMS for currently supported systems."
-            )
+        index = np.searchsorted(self._keys, self._to_keys(epochs), side=side)
+        return int(index) if isinstance(epochs, Epoch) else index
 
-        self.time_system = time_system
-
-        if mean_julian_day is not None:
-            # Sweet, no conversions required!
-            self.mean_julian_day = mean_julian_day
-            self.day_fraction = 0 if day_fraction is None else day_fraction
-            return
+    def bracket(self, epochs):
+        '''Find the sorted epochs on either side of each query, for
+        interpolation
 
-        # Make sure that all required inputs are provided
-        ymdhm = [year, month, day, hours, minutes]  # TODO better name
-        if None in ymdhm and not all([val is None for val in ymdhm]):
-            raise EpochException(
-                msg="If providing ymdhms, must provide ALL components.")
+        Args:
+            epochs (`Epoch` or `EpochArray`): epochs to look up, all within
+                the indexed range
 
-        # If seconds weren't provided, set to zero
-        if seconds is None:
-            seconds = 0
+        Returns:
+            index i (`int`, or `np.ndarray` for an `EpochArray`) such that
+            self.epochs[i] <= epoch <= self.epochs[i + 1]
+        '''
+        if len(self) < 2:
+            raise EpochException("Need at least two epochs to bracket.")
 
-        # Check validity if inputted in calendar date format
-        flag_valid, msg = check_validity_date(
-            year=year, month=month, day=day, hours=hours,
-            minutes=minutes, seconds=seconds
-        )
+        keys = self._to_keys(epochs)
+        if np.any(keys < self._keys[0]) or np.any(keys > self._keys[-1]):
+            raise EpochException("Epoch outside of the indexed range.")
 
-        if not flag_valid:
-            assert EpochException(msg)
-
-        # Convert to MJD and day fraction
-        self.mean_julian_day, self.day_fraction = to_mjd(
-            year=year,
-            month=month,
-            day=day,
-            hours=hours,
-            minutes=minutes,
-            seconds=seconds
-        )
+        index = np.clip(
+            np.searchsorted(self._keys, keys, side='right') - 1,
+            0, len(self) - 2)
+        return int(index) if isinstance(epochs, Epoch) else index
 
-    def __add__(self, to_add):
-        '''Overloaded addition operator, including rollover considerations
-        (epoch+epoch)
+    def nearest(self, epochs):
+        '''Find the sorted epoch closest to each query (the earlier one on
+        ties)
 
         Args:
-            to_add (`Epoch` or `float`): epoch or float you want to add
-            to the current epoch
-                if `float`, [s]
+            epochs (`Epoch` or `EpochArray`): epochs to look up
 
         Returns:
-            `Epoch` result of addition
+            index (`int`, or `np.ndarray` for an `EpochArray`) into
+            self.epochs
         '''
-        if isinstance(to_add, float) or isinstance(to_add, int):
-            # Float
-            new_mjd = self.mean_julian_day
-            new_day_fraction = self.day_fraction + to_add / SECONDS_IN_DAY
+        keys = self._to_keys(epochs)
+        right = np.clip(
+            np.searchsorted(self._keys, keys, side='left'), 1, len(self) - 1)
+        left = right - 1
+        if len(self) == 1:
+            right = left = np.zeros_like(right)
 
-        else:
-            # Epoch
+        index = np.where(
+            keys - self._keys[left] <= self._keys[right] - keys, left, right)
+        return int(index) if isinstance(epochs, Epoch) else index
 
-            # Check that the time_systems are the same
-            if self.time_system != to_add.time_system:
-                raise EpochException(
-                    f"Mismatch ({self.time_system},{to_add.time_system})")
 
-            # Add the MJDs
-            new_mjd = self.mean_julian_day + to_add.mean_julian_day
+def get_index_keys(epochs, reference_day: int) -> np.ndarray:
+    '''Exact int64 sort keys of epochs, nanoseconds since a reference day,
+    as searched by `EpochIndex`
 
-            # Add fractional days
-            new_day_fraction = self.day_fraction + to_add.day_fraction
+    Args:
+        epochs (`Epoch` or `EpochArray`): epochs to convert
+        reference_day (`int`): mean julian day of key zero
 
-        # Account for rollover
-        while new_day_fraction > 1:
-            # Needs rollover
-            new_day_fraction -= 1
-            new_mjd += 1
+    Returns:
+        `np.ndarray` int64 keys, exact within MAX_INDEX_SPAN_DAYS of the
+        reference day. Farther epochs are clamped just outside of that span,
+        so they still sort before/after every epoch within it.
+    '''
+    days = np.clip(
+        np.asarray(epochs.mean_julian_day, dtype=np.int64) - reference_day,
+        -MAX_INDEX_SPAN_DAYS - 2, MAX_INDEX_SPAN_DAYS + 2)
+    return days * NANOSECONDS_IN_DAY + \
+        np.asarray(epochs.nanoseconds_of_day, dtype=np.int64)
 
-        # Initialize new Epoch
-        return Epoch(mean_julian_day=new_mjd, day_fraction=new_day_fraction)
 
-    def __iadd__(self, to_add):
-        '''Overloaded addition (in place) operator, including rollover considerations
+##############
+# Time Grids #
+##############
+def epoch_range(start: Epoch, stop: Epoch, step: float):
+    '''Lazily generate epochs from start (inclusive) to stop (exclusive), like
+    `range`
 
-        Args:
-            to_add (`Epoch` or `float`): epoch or float you want to add
-            to the current epoch
-                if `float`, [s]
+    Args:
+        start (`Epoch`): first epoch
+        stop (`Epoch`): end of the grid, not included
+        step (`float`): time between epochs [s], e.g.
+            GVEPropagatorConfig.timestep; negative to step backwards
+
+    Yields:
+        `Epoch`, each computed as start + k * step in integer nanoseconds, so
+        there is no accumulated rounding over long spans
+    '''
+    mean_julian_day, nanoseconds_of_day, step_nanoseconds, num_epochs = \
+        _get_grid(start, stop, step)
 
-        Modifies:
-            self.mean_julian_day
-            self.day_fraction
-        '''
-        original_epoch = Epoch(
-            mean_julian_day=self.mean_julian_day,
-            day_fraction=self.day_fraction
+    for index in range(num_epochs):
+        rollover, nanoseconds = divmod(
+            nanoseconds_of_day + index * step_nanoseconds, NANOSECONDS_IN_DAY)
+        yield _new_epoch(mean_julian_day + rollover, nanoseconds,
+                         start._time_system_code)
+
+
+def epoch_range_chunked(
+        start: Epoch,
+        stop: Epoch,
+        step: float,
+        chunk_size: int = 100000):
+    '''Lazily generate the epochs of `epoch_range` in `EpochArray` blocks
+
+    Args:
+        start (`Epoch`): first epoch
+        stop (`Epoch`): end of the grid, not included
+        step (`float`): time between epochs [s]; negative to step backwards
+        chunk_size (`int`): number of epochs per block (the last block may be
+            shorter)
+
+    Yields:
+        `EpochArray` of up to chunk_size epochs
+    '''
+    if chunk_size < 1:
+        raise EpochException(f"Chunk size {chunk_size} must be positive.")
+
+    mean_julian_day, nanoseconds_of_day, step_nanoseconds, num_epochs = \
+        _get_grid(start, stop, step)
+
+    for first_index in range(0, num_epochs, chunk_size):
+        # Exact (Python int) start of the block, then int64 offsets within it
+        rollover, block_nanoseconds = divmod(
+            nanoseconds_of_day + first_index * step_nanoseconds,
+            NANOSECONDS_IN_DAY)
+        num_block = min(chunk_size, num_epochs - first_index)
+        yield EpochArray(
+            np.full(num_block, mean_julian_day + rollover, dtype=np.int64),
+            time_system=start.time_system,
+            nanoseconds_of_day=block_nanoseconds +
+            np.arange(num_block, dtype=np.int64) * step_nanoseconds
         )
-        new_epoch = original_epoch + to_add
 
-        # Modify in place TODO is this the smart way to do this?
-        self.mean_julian_day = new_epoch.mean_julian_day
-        self.day_fraction = new_epoch.day_fraction
-        return self
 
-    def __sub__(self, to_subtract):
-        '''Overloaded subtraction operator, including rollover considerations
-        (epoch+epoch)
+def _get_grid(start: Epoch, stop: Epoch, step: float) -> tuple:
+    '''Check and set up the grid of `epoch_range`
 
-        Args:
-            to_subtract (`Epoch` or `float`): epoch or float you want to
-            subtract from the current epoch
-                if `float`, [s]
+    Args:
+        start (`Epoch`): first epoch
+        stop (`Epoch`): end of the grid, not included
+        step (`float`): time between epochs [s]
 
-        Returns:
-            `Epoch` result of addition
-        '''
-        if isinstance(to_subtract, float) or isinstance(to_subtract, int):
-            # Float
-            new_mjd = self.mean_julian_day
-            new_day_fraction = self.day_fraction - to_subtract / SECONDS_IN_DAY
+    Returns:
+        tuple
+            mean julian day of start (`int`)
+            nanoseconds of day of start (`int`)
+            step [ns] (`int`)
+            number of epochs (`int`)
+    '''
+    if start._time_system_code != stop._time_system_code:
+        raise EpochException(
+            f"Mismatch ({start.time_system},{stop.time_system})")
 
-        else:
-            # Epoch
+    step_nanoseconds = round(step * NANOSECONDS_IN_SECOND)
+    if step_nanoseconds == 0:
+        raise EpochException("Step must be at least a nanosecond.")
 
-            # Check that the time_systems are the same
-            if self.time_system != to_subtract.time_system:
-                raise EpochException(
-                    f"Mismatch ({self.time_system},{to_subtract.time_system})")
+    span_nanoseconds = \
+        (stop.mean_julian_day - start.mean_julian_day) * NANOSECONDS_IN_DAY \
+        + stop.nanoseconds_of_day - start.nanoseconds_of_day
 
-            # Add the MJDs
-            new_mjd = self.mean_julian_day - to_subtract.mean_julian_day
+    # Ceiling division, zero if stop is behind start for this step direction
+    num_epochs = max(0, -(-span_nanoseconds // step_nanoseconds))
 
-            # Add fractional days
-            new_day_fraction = self.day_fraction - to_subtract.day_fraction
+    return (start.mean_julian_day, start.nanoseconds_of_day,
+            step_nanoseconds, num_epochs)
 
-        # Account for rollover
-        while new_day_fraction < 0:
-            # Needs rollover
-            new_day_fraction += 1
-            new_mjd -= 1
 
-        # Initialize new Epoch
-        return Epoch(mean_julian_day=new_mjd, day_fraction=new_day_fraction)
+###########
+# Parsing #
+###########
+def parse_timestamps(timestamps, time_system: str = 'UTC') -> EpochArray:
+    '''Parse ISO-8601 / CCSDS ASCII timestamps into an `EpochArray`
 
-    def __isub__(self, to_subtract):
-        '''Overloaded subtraction (in place) operator, including rollover 
-        considerations
+    Args:
+        timestamps (`str`, `iterable` or `np.ndarray`): timestamp string(s),
+            each in calendar form YYYY-MM-DDThh:mm:ss[.f...][Z] (CCSDS ASCII
+            time code A) or day-of-year form YYYY-DDDThh:mm:ss[.f...][Z] (time
+            code B). The time of day (and the fraction of seconds) may be left
+            off, and a space may be used instead of `T`. A single string gives
+            an array of one epoch.
+        time_system (`str`): time system of the timestamps
+            see ALLOWED_TIME_SYSTEMS in `Constants` section
 
-        Args:
-            to_subtract (`Epoch` or `float`): epoch or float you want to 
-            subtract from the current epoch
-                if `float`, [s]
+    Returns:
+        `EpochArray`
 
-        Modifies:
-            self.mean_julian_day
-            self.day_fraction
-        '''
-        original_epoch = Epoch(
-            mean_julian_day=self.mean_julian_day,
-            day_fraction=self.day_fraction
+    Notes:
+        If every timestamp has the same fixed-width layout as the first one
+        (the usual case for OEM and tracking files), all fields are decoded
+        straight from the character codes of a NumPy string array with no
+        per-string Python work. Otherwise the timestamps are grouped by
+        layout and each group is decoded the same way, see
+        `_parse_variable_width`. Digits must be ASCII.
+        Fractions of seconds beyond nanoseconds are truncated. A leap second
+        (ss = 60) rolls over into the next day.
+    '''
+    _get_time_system_code(time_system)
+
+    if isinstance(timestamps, (str, bytes)):
+        # A single timestamp, not an iterable of characters
+        timestamps = [timestamps]
+    timestamps = np.asarray(
+        timestamps if isinstance(timestamps, np.ndarray) else
+        list(timestamps))
+    timestamps = timestamps.ravel()
+    if len(timestamps) == 0:
+        return EpochArray(np.zeros(0, dtype=np.int64), time_system=time_system)
+
+    if timestamps.dtype.kind not in 'US':
+        raise EpochException("Timestamps must be strings.")
+
+    fields = _parse_fixed_width(timestamps)
+    if fields is None:
+        fields = _parse_variable_width(timestamps)
+    year, month, day, day_of_year, hours, minutes, seconds, nanoseconds = \
+        fields
+
+    # Validate everything at once (day-of-year rows are checked against
+    # January 1st and then for the day-of-year itself)
+    valid, _ = check_validity_date_array(
+        year=year, month=month, day=day, hours=hours, minutes=minutes,
+        seconds=seconds + nanoseconds / NANOSECONDS_IN_SECOND)
+    valid &= (day_of_year >= 1) & \
+        (day_of_year <= 365 + check_leap_year(year))
+    if not np.all(valid):
+        first_invalid = int(np.argmin(valid))
+        raise EpochException(
+            f"{np.count_nonzero(~valid)} invalid timestamps, first is "
+            f"{_decode_timestamp(timestamps[first_invalid])!r} "
+            f"(index {first_invalid}).")
+
+    mean_julian_day, _ = to_mjd(
+        year=year, month=month, day=day, hours=0, minutes=0, seconds=0)
+    return EpochArray(
+        mean_julian_day + (day_of_year - 1),
+        time_system=time_system,
+        nanoseconds_of_day=((hours * 60 + minutes) * 60 + seconds)
+        * NANOSECONDS_IN_SECOND + nanoseconds
+    )
+
+
+# Timestamp layout accepted by parse_timestamps (ASCII digits only)
+_TIMESTAMP_PATTERN = re.compile(
+    r'(?P<year>\d{4})-(?:(?P<month>\d{2})-(?P<day>\d{2})|(?P<doy>\d{3}))'
+    r'(?:[T ](?P<hours>\d{2}):(?P<minutes>\d{2}):(?P<seconds>\d{2})'
+    r'(?:\.(?P<fraction>\d+))?)?Z?',
+    re.ASCII
+)
+
+# Numeric fields of _TIMESTAMP_PATTERN, with the value used when absent
+_TIMESTAMP_FIELDS = (('year', 0), ('month', 1), ('day', 1), ('doy', 1),
+                     ('hours', 0), ('minutes', 0), ('seconds', 0))
+
+# Layouts tried per timestamp length by _parse_variable_width before the
+# remaining timestamps of that length are matched one by one
+_MAX_TIMESTAMP_LAYOUTS = 8
+
+
+def _parse_fixed_width(timestamps: np.ndarray):
+    '''Fast path of `parse_timestamps` for timestamps that all share the
+    fixed-width layout of the first one
+
+    Args:
+        timestamps (`np.ndarray`): 1-D string (`U` or `S`) array
+
+    Returns:
+        tuple of int64 `np.ndarray` (year, month, day, day of year, hours,
+        minutes, seconds, nanoseconds), or None if the layouts differ
+    '''
+    first = _decode_timestamp(timestamps[0])
+    match = _TIMESTAMP_PATTERN.fullmatch(first)
+    if match is None:
+        return None
+
+    # Shorter strings are zero-padded, so they fail the layout check
+    codes = _get_character_codes(timestamps)
+    if codes.shape[1] != len(first) or \
+            not np.all(_check_layout(codes, match)):
+        return None
+    return _decode_layout(codes, match)
+
+
+def _parse_variable_width(timestamps: np.ndarray) -> tuple:
+    '''General path of `parse_timestamps`, for timestamps of several
+    layouts
+
+    Args:
+        timestamps (`np.ndarray`): 1-D string (`U` or `S`) array
+
+    Returns:
+        tuple of int64 `np.ndarray` (year, month, day, day of year, hours,
+        minutes, seconds, nanoseconds)
+
+    Notes:
+        Timestamps are grouped by length. Within a group, the first
+        timestamp not yet parsed gives a layout, and every timestamp of the
+        group with that layout is decoded at once as in
+        `_parse_fixed_width`. Only timestamps fitting none of the first
+        _MAX_TIMESTAMP_LAYOUTS layouts of their length (e.g. padded with
+        whitespace) are matched one by one.
+    '''
+    codes = _get_character_codes(timestamps)
+    lengths = np.char.str_len(timestamps)
+    fields = np.zeros((8, len(timestamps)), dtype=np.int64)
+    unparsed = np.ones(len(timestamps), dtype=bool)
+
+    for length in np.unique(lengths):
+        group = np.flatnonzero(lengths == length)
+        for _ in range(_MAX_TIMESTAMP_LAYOUTS):
+            if group.size == 0:
+                break
+            match = _TIMESTAMP_PATTERN.fullmatch(
+                _decode_timestamp(timestamps[group[0]]))
+            if match is None:
+                break
+
+            # The first timestamp of the group always fits its own layout
+            group_codes = codes[group, :length]
+            fits = _check_layout(group_codes, match)
+            fields[:, group[fits]] = _decode_layout(group_codes[fits], match)
+            unparsed[group[fits]] = False
+            group = group[~fits]
+
+    for index in np.flatnonzero(unparsed):
+        fields[:, index] = _parse_timestamp(
+            _decode_timestamp(timestamps[index]))
+    return tuple(fields)
+
+
+def _parse_timestamp(timestamp: str) -> tuple:
+    '''Match a single timestamp, see `parse_timestamps`
+
+    Args:
+        timestamp (`str`): timestamp, surrounding whitespace is ignored
+
+    Returns:
+        tuple of `int` (year, month, day, day of year, hours, minutes,
+        seconds, nanoseconds)
+    '''
+    match = _TIMESTAMP_PATTERN.fullmatch(timestamp.strip())
+    if match is None:
+        raise EpochException(f"Could not parse timestamp {timestamp!r}.")
+
+    fraction = (match.group('fraction') or '')[:9]
+    return tuple(
+        int(match.group(name) or default)
+        for name, default in _TIMESTAMP_FIELDS
+    ) + (int(fraction.ljust(9, '0')),)
+
+
+def _decode_timestamp(timestamp) -> str:
+    '''Timestamp as `str`, bytes are decoded as ASCII
+
+    Args:
+        timestamp (`str` or `bytes`): element of a timestamp array
+
+    Returns:
+        `str`, non-ASCII bytes are replaced so that they fail to match
+    '''
+    if isinstance(timestamp, bytes):
+        return timestamp.decode('ascii', errors='replace')
+    return str(timestamp)
+
+
+def _get_character_codes(timestamps: np.ndarray) -> np.ndarray:
+    '''Character codes of a string array, one row per string (a view, no
+    copy), zero-padded to the width of the array
+
+    Args:
+        timestamps (`np.ndarray`): 1-D string (`U` or `S`) array
+
+    Returns:
+        `np.ndarray` (uint32 for `U`, uint8 for `S`) of shape (strings,
+        width)
+    '''
+    is_unicode = timestamps.dtype.kind == 'U'
+    width = timestamps.dtype.itemsize // (4 if is_unicode else 1)
+    return timestamps.view(
+        np.uint32 if is_unicode else np.uint8
+    ).reshape(len(timestamps), width)
+
+
+def _check_layout(codes: np.ndarray, match) -> np.ndarray:
+    '''Check which rows of character codes have the layout of a matched
+    timestamp
+
+    Args:
+        codes (`np.ndarray`): (rows, length of the matched timestamp)
+            character codes
+        match (`re.Match`): _TIMESTAMP_PATTERN match of the template
+
+    Returns:
+        `np.ndarray` of `bool`, True where the row has ASCII digits (0x30 to
+        0x39) in every numeric field of the template and the same
+        separators everywhere else
+    '''
+    is_digit = np.zeros(codes.shape[1], dtype=bool)
+    for name in [name for name, _ in _TIMESTAMP_FIELDS] + ['fraction']:
+        start, stop = match.span(name)
+        if start >= 0:
+            is_digit[start:stop] = True
+
+    template = np.array([ord(character) for character in match.string])
+    lower = np.where(is_digit, ord('0'), template).astype(codes.dtype)
+    upper = np.where(is_digit, ord('9'), template).astype(codes.dtype)
+    return np.all((codes >= lower) & (codes <= upper), axis=1)
+
+
+def _decode_layout(codes: np.ndarray, match) -> tuple:
+    '''Decode rows of character codes that have the layout of a matched
+    timestamp, see `_check_layout`
+
+    Args:
+        codes (`np.ndarray`): (rows, length of the matched timestamp)
+            character codes
+        match (`re.Match`): _TIMESTAMP_PATTERN match of the template
+
+    Returns:
+        tuple of int64 `np.ndarray` (year, month, day, day of year, hours,
+        minutes, seconds, nanoseconds)
+    '''
+    def field(name: str, default: int) -> np.ndarray:
+        start, stop = match.span(name)
+        if start < 0:
+            return np.full(len(codes), default, dtype=np.int64)
+        return _digits_to_int(codes[:, start:stop])
+
+    # Fractions of seconds, padded or truncated to nanoseconds
+    start, stop = match.span('fraction')
+    if start < 0:
+        nanoseconds = np.zeros(len(codes), dtype=np.int64)
+    else:
+        stop = min(stop, start + 9)
+        nanoseconds = _digits_to_int(codes[:, start:stop]) * \
+            10 ** (9 - (stop - start))
+
+    return tuple(
+        field(name, default) for name, default in _TIMESTAMP_FIELDS
+    ) + (nanoseconds,)
+
+
+def _digits_to_int(codes: np.ndarray) -> np.ndarray:
+    '''Combine columns of decimal digit character codes into integers
+
+    Args:
+        codes (`np.ndarray`): (rows, number of digits) character codes of
+            digits, most significant first
+
+    Returns:
+        `np.ndarray` int64 value of each row
+    '''
+    powers = 10 ** np.arange(codes.shape[1] - 1, -1, -1, dtype=np.int64)
+    return (codes.astype(np.int64) - ord('0')) @ powers
+
+
+################
+# Time Systems #
+################
+def get_tai_minus_utc(mean_julian_day):
+    '''Look up TAI-UTC (the accumulated leap seconds)
+
+    Args:
+        mean_julian_day (`int` or `np.ndarray`): UTC mean julian day
+
+    Returns:
+        TAI-UTC [s] (`int`, or int64 `np.ndarray` for array input)
+
+    Notes:
+        O(log n) lookup in LEAP_SECONDS with bisect (searchsorted for arrays).
+        Dates before 1972-01-01 use the 1972 offset of 10 s; the pre-1972
+        "rubber second" offsets are not modeled.
+    '''
+    if _is_array_input(mean_julian_day):
+        index = np.searchsorted(
+            _LEAP_SECOND_MJDS, np.floor(mean_julian_day), side='right') - 1
+        return _LEAP_SECOND_OFFSETS[np.maximum(index, 0)]
+
+    index = bisect_right(_LEAP_SECOND_MJDS_LIST, mean_julian_day) - 1
+    return LEAP_SECONDS[max(index, 0)][1]
+
+
+def get_tdb_minus_tt(
+        mean_julian_day,
+        nanoseconds_of_day=0,
+        mode: str = 'precise',
+        cache: bool = False):
+    '''Evaluate TDB-TT, the periodic difference between barycentric and
+    terrestrial dynamical time (geocentric)
+
+    Args:
+        mean_julian_day (`int` or `np.ndarray`): TT (or TDB) mean julian day
+        nanoseconds_of_day (`int` or `np.ndarray`): nanoseconds past zero
+            hours
+        mode (`str`): series to evaluate, see TDB_MINUS_TT_MODES
+            'precise': leading 41 terms of the Fairhead & Bretagnon series
+                (Ref. 5, as tabulated in iauDtdb in Ref. 3), within 1
+                microsecond of the complete series over 1600-2400
+            'fast': 7 term series of Ref. 4, Eq. 2.6, error of about 10
+                microseconds over 1600-2200
+        cache (`bool`): interpolate linearly between values at fixed nodes
+            (TDB_CACHE_NODES_PER_DAY per day). Adds at most about 5
+            nanoseconds of error. For scalars the nodes are kept in an LRU
+            cache, so repeated calls near the same time (e.g. integrator
+            stages) reuse them. Arrays don't use the LRU cache: each call
+            evaluates the nodes it needs once, or the epochs themselves when
+            there are fewer epochs than nodes.
+
+    Returns:
+        TDB-TT [s] (`float`, or `np.ndarray` for array input)
+    '''
+    if mode not in TDB_MINUS_TT_MODES:
+        raise EpochException(
+            f"TDB-TT mode {mode} not in {TDB_MINUS_TT_MODES}.")
+
+    # Days of TT since J2000 (MJD 51544.5)
+    days = (mean_julian_day - 51544) + \
+        (nanoseconds_of_day / NANOSECONDS_IN_DAY - 0.5)
+
+    if not cache:
+        return _evaluate_tdb_minus_tt(days, mode)
+
+    # Linear interpolation between nodes
+    nodes = days * TDB_CACHE_NODES_PER_DAY
+    if not _is_array_input(days):
+        node = floor(nodes)
+        weight = nodes - node
+        left = _get_tdb_minus_tt_node(node, mode)
+        right = _get_tdb_minus_tt_node(node + 1, mode)
+        return left + weight * (right - left)
+
+    node = np.floor(nodes)
+    weight = nodes - node
+    node = node.astype(np.int64)
+    if node.size == 0:
+        return np.zeros(node.shape)
+
+    # Evaluate every node in the covered range once, or only the ones used
+    # if the epochs are spread out. If that is no fewer evaluations than
+    # epochs, evaluating the epochs directly is both cheaper and exact
+    node_min = node.min()
+    if node.max() - node_min + 2 <= node.size:
+        node_values = _evaluate_tdb_minus_tt(
+            np.arange(node_min, node.max() + 2) / TDB_CACHE_NODES_PER_DAY,
+            mode)
+        left = node_values[node - node_min]
+        right = node_values[node - node_min + 1]
+    else:
+        unique_nodes, inverse = np.unique(
+            np.concatenate([node.ravel(), node.ravel() + 1]),
+            return_inverse=True)
+        if unique_nodes.size >= node.size:
+            return _evaluate_tdb_minus_tt(days, mode)
+        node_values = _evaluate_tdb_minus_tt(
+            unique_nodes / TDB_CACHE_NODES_PER_DAY, mode)[inverse]
+        left = node_values[:node.size].reshape(node.shape)
+        right = node_values[node.size:].reshape(node.shape)
+    return left + weight * (right - left)
+
+
+@lru_cache(maxsize=4096)
+def _get_tdb_minus_tt_node(node: int, mode: str) -> float:
+    '''TDB-TT at a cache node, see `get_tdb_minus_tt`
+
+    Args:
+        node (`int`): node number since J2000
+        mode (`str`): see TDB_MINUS_TT_MODES
+
+    Returns:
+        TDB-TT [s] (`float`)
+    '''
+    return _evaluate_tdb_minus_tt(node / TDB_CACHE_NODES_PER_DAY, mode)
+
+
+def _evaluate_tdb_minus_tt(days, mode: str):
+    '''Evaluate a TDB-TT series, see `get_tdb_minus_tt`
+
+    Args:
+        days (`float` or `np.ndarray`): days of TT since J2000
+        mode (`str`): see TDB_MINUS_TT_MODES
+
+    Returns:
+        TDB-TT [s] (`float`, or `np.ndarray` for array input)
+    '''
+    is_array = _is_array_input(days)
+    sin = np.sin if is_array else math_sin
+
+    if mode == 'fast':
+        # Julian centuries since J2000
+        centuries = days / 36525
+        return (
+            0.001657 * sin(628.3076 * centuries + 6.2401)
+            + 0.000022 * sin(575.3385 * centuries + 4.2970)
+            + 0.000014 * sin(1256.6152 * centuries + 6.1969)
+            + 0.000005 * sin(606.9777 * centuries + 4.0212)
+            + 0.000005 * sin(52.9691 * centuries + 0.4444)
+            + 0.000002 * sin(21.3299 * centuries + 5.5431)
+            + 0.000010 * centuries * sin(628.3076 * centuries + 4.2490)
         )
-        new_epoch = original_epoch - to_subtract
 
-        # Modify in place TODO is this the smart way to do this?
-        self.mean_julian_day = new_epoch.mean_julian_day
-        self.day_fraction = new_epoch.day_fraction
-        return self
+    # Julian millennia since J2000, then sum each power of time (highest
+    # first, Horner style)
+    millennia = days / 365250
+    tdb_minus_tt = 0
+    for terms in reversed(_TDB_MINUS_TT_SERIES):
+        power_sum = 0
+        for amplitude, frequency, phase in terms:
+            power_sum = power_sum + amplitude * sin(frequency * millennia +
+                                                    phase)
+        tdb_minus_tt = tdb_minus_tt * millennia + power_sum
+    return tdb_minus_tt
+
+
+def convert_time_system(
+        mean_julian_day,
+        nanoseconds_of_day,
+        time_system_from: str,
+        time_system_to: str,
+        tdb_mode: str = 'precise',
+        tdb_cache: bool = False) -> tuple:
+    '''Convert a split (day, nanoseconds) time between time systems
+
+    Args:
+        mean_julian_day (`int` or `np.ndarray`): mean julian day for zero
+            hours in time_system_from
+        nanoseconds_of_day (`int` or `np.ndarray`): nanoseconds past zero
+            hours in time_system_from
+        time_system_from (`str`): see ALLOWED_TIME_SYSTEMS
+        time_system_to (`str`): see ALLOWED_TIME_SYSTEMS
+        tdb_mode (`str`): TDB-TT series used to or from TDB, see
+            `get_tdb_minus_tt`
+        tdb_cache (`bool`): interpolate TDB-TT between cached nodes, see
+            `get_tdb_minus_tt`
+
+    Returns:
+        tuple
+            mean julian day in time_system_to (`int` or `np.ndarray`)
+            nanoseconds of day in time_system_to (`int` or `np.ndarray`)
+
+    Notes:
+        Every conversion goes through TAI. Times inside a leap second
+        (23:59:60 UTC) can't be represented in UTC and map onto the
+        following second.
+    '''
+    _get_time_system_code(time_system_from)
+    _get_time_system_code(time_system_to)
+    if time_system_from == time_system_to:
+        return mean_julian_day, nanoseconds_of_day
+
+    # To TAI
+    if time_system_from == 'UTC':
+        nanoseconds_of_day = nanoseconds_of_day + \
+            get_tai_minus_utc(mean_julian_day) * NANOSECONDS_IN_SECOND
+    elif time_system_from == 'TT':
+        nanoseconds_of_day = nanoseconds_of_day - _TT_MINUS_TAI_NANOSECONDS
+    elif time_system_from == 'GPS':
+        nanoseconds_of_day = nanoseconds_of_day + _TAI_MINUS_GPS_NANOSECONDS
+    elif time_system_from == 'TDB':
+        nanoseconds_of_day = nanoseconds_of_day - _TT_MINUS_TAI_NANOSECONDS \
+            - seconds_to_nanoseconds(
+                get_tdb_minus_tt(mean_julian_day, nanoseconds_of_day,
+                                 mode=tdb_mode, cache=tdb_cache))
+    mean_julian_day, nanoseconds_of_day = normalize_split_time(
+        mean_julian_day, nanoseconds_of_day)
+
+    # From TAI
+    if time_system_to == 'UTC':
+        # Look up the leap seconds with TAI as a first guess of UTC, then
+        # again with the resulting UTC day (only differs right at a leap)
+        tai_minus_utc = get_tai_minus_utc(mean_julian_day)
+        utc_mean_julian_day, _ = normalize_split_time(
+            mean_julian_day,
+            nanoseconds_of_day - tai_minus_utc * NANOSECONDS_IN_SECOND)
+        nanoseconds_of_day = nanoseconds_of_day - \
+            get_tai_minus_utc(utc_mean_julian_day) * NANOSECONDS_IN_SECOND
+    elif time_system_to == 'TT':
+        nanoseconds_of_day = nanoseconds_of_day + _TT_MINUS_TAI_NANOSECONDS
+    elif time_system_to == 'GPS':
+        nanoseconds_of_day = nanoseconds_of_day - _TAI_MINUS_GPS_NANOSECONDS
+    elif time_system_to == 'TDB':
+        nanoseconds_of_day = nanoseconds_of_day + _TT_MINUS_TAI_NANOSECONDS
+        nanoseconds_of_day = nanoseconds_of_day + seconds_to_nanoseconds(
+            get_tdb_minus_tt(mean_julian_day, nanoseconds_of_day,
+                             mode=tdb_mode, cache=tdb_cache))
+
+    return normalize_split_time(mean_julian_day, nanoseconds_of_day)
+
+
+def normalize_split_time(mean_julian_day, nanoseconds_of_day) -> tuple:
+    '''Carry whole days out of the nanoseconds of day
+
+    Args:
+        mean_julian_day (`int` or `np.ndarray`): mean julian day
+        nanoseconds_of_day (`int` or `np.ndarray`): nanoseconds, any size
+
+    Returns:
+        tuple
+            mean julian day (`int` or `np.ndarray`)
+            nanoseconds of day, in [0, NANOSECONDS_IN_DAY)
+    '''
+    rollover, nanoseconds_of_day = divmod(
+        nanoseconds_of_day, NANOSECONDS_IN_DAY)
+    return mean_julian_day + rollover, nanoseconds_of_day
+
+
+def _offset_to_nanoseconds(offset) -> int:
+    '''Round an offset of `Epoch` arithmetic to integer nanoseconds
+
+    Args:
+        offset (`int`, `float` or NumPy scalar): [s]
+
+    Returns:
+        nanoseconds (`int`)
+    '''
+    if isinstance(offset, np.generic):
+        # Python numbers, so that large integer offsets can't overflow int64
+        offset = offset.item()
+    return round(offset * NANOSECONDS_IN_SECOND)
+
+
+def seconds_to_nanoseconds(seconds):
+    '''Round seconds to integer nanoseconds
+
+    Args:
+        seconds (`float` or `np.ndarray`): [s]
+
+    Returns:
+        nanoseconds (`int`, or int64 `np.ndarray` for array input)
+    '''
+    if _is_array_input(seconds):
+        return np.rint(seconds * NANOSECONDS_IN_SECOND).astype(np.int64)
+    return round(seconds * NANOSECONDS_IN_SECOND)
+
 
 ########################
 # Supporting Functions #
@@ -268,34 +2130,47 @@ def to_mjd(year: int = None,
     '''Convert UTC time (saved) to Julian Date (JD)
 
     Args:
-        year (`int`): calendar year
-        month (`int`): calendar month as integer [1,12]
-        day (`int`): calendar day
-        hours (`int`): hours (24 hour format)
-        minutes (`int`): minutes
-        seconds (`float`): seconds 
+        year (`int` or `np.ndarray`): calendar year
+        month (`int` or `np.ndarray`): calendar month as integer [1,12]
+        day (`int` or `np.ndarray`): calendar day
+        hours (`int` or `np.ndarray`): hours (24 hour format)
+        minutes (`int` or `np.ndarray`): minutes
+        seconds (`float` or `np.ndarray`): seconds
 
     Modifies:
         None (TODO? mb i want this to be an attribute)
 
     Returns:
         tuple
-            MJD (`float`) for zero hours (aka day number)
+            MJD (`int`) for zero hours (aka day number)
             day_fraction (`float`): fraction of day past zero hours
+        If any input is an array, both outputs are arrays (int64 and float64)
+        broadcast over all inputs, matching the scalar results exactly.
 
     Notes:
         Adapted from iauCal2jd in Ref. 3
     '''
-
-    # Compute scaled month (See pages 67-68 in Ref. 1)
-    mo_scaled = int((month - 14) / 12)
-    year_mo_scaled = int(year + mo_scaled)
+    if _is_array_input(year, month, day, hours, minutes, seconds):
+        year = np.asarray(year, dtype=np.int64)
+        month = np.asarray(month, dtype=np.int64)
+        day = np.asarray(day, dtype=np.int64)
+        hours = np.asarray(hours, dtype=np.float64)
+        minutes = np.asarray(minutes, dtype=np.float64)
+        seconds = np.asarray(seconds, dtype=np.float64)
+    else:
+        year, month, day = int(year), int(month), int(day)
+
+    # Compute scaled month (See pages 67-68 in Ref. 1). All divisions are
+    # integer divisions as in iauCal2jd; the operands are positive for valid
+    # dates, so flooring matches C truncation
+    mo_scaled = -((14 - month) // 12)
+    year_mo_scaled = year + mo_scaled
 
     mean_julian_day = (
-        (int((1461 * (year_mo_scaled + 4800)) / 4)
-         + int((367 * int((month - 2 - 12 * mo_scaled))) / 12)
-         - int((3 * ((year_mo_scaled + 4900) / 100)) / 4)
-         + int(day) - 2432076)
+        (1461 * (year_mo_scaled + 4800)) // 4
+        + (367 * (month - 2 - 12 * mo_scaled)) // 12
+        - (3 * ((year_mo_scaled + 4900) // 100)) // 4
+        + day - 2432076
     )
     day_fraction = (hours + minutes/60 + seconds/3600)/24
 
@@ -312,18 +2187,18 @@ def to_jd(
     '''Convert UTC time (saved) to Mean Julian Date (MJD)
 
     Args:
-        year (`int`): calendar year
-        month (`int`): calendar month as integer [1,12]
-        day (`int`): calendar day
-        hours (`int`): hours (24 hour format)
-        minutes (`int`): minutes
-        seconds (`float`): seconds
+        year (`int` or `np.ndarray`): calendar year
+        month (`int` or `np.ndarray`): calendar month as integer [1,12]
+        day (`int` or `np.ndarray`): calendar day
+        hours (`int` or `np.ndarray`): hours (24 hour format)
+        minutes (`int` or `np.ndarray`): minutes
+        seconds (`float` or `np.ndarray`): seconds
 
     Modifies:
         None (TODO? mb i want this to be an attribute)
 
     Returns:
-        JD (`float`)
+        JD (`float`, or `np.ndarray` if any input is an array)
     '''
 
     mean_julian_day, day_fraction = to_mjd(
@@ -337,6 +2212,57 @@ def to_jd(
     return mean_julian_day + day_fraction + MJD_OFFSET
 
 
+def to_calendar(mean_julian_day: int, nanoseconds_of_day: int = 0) -> tuple:
+    '''Convert MJD and time of day to calendar date and time, the inverse of
+    `to_mjd`
+
+    Args:
+        mean_julian_day (`int` or `np.ndarray`): mean julian day for zero
+            hours
+        nanoseconds_of_day (`int` or `np.ndarray`): nanoseconds past zero
+            hours, in [0, NANOSECONDS_IN_DAY)
+
+    Returns:
+        tuple
+            year (`int`): calendar year
+            month (`int`): calendar month as integer [1,12]
+            day (`int`): calendar day
+            hours (`int`): hours (24 hour format)
+            minutes (`int`): minutes
+            seconds (`float`): seconds
+        If any input is an array, all outputs are arrays (int64, and float64
+        for seconds).
+
+    Notes:
+        Adapted from iauJd2cal in Ref. 3, using integer arithmetic only. All
+        intermediate values are positive for MJDs on or after YEAR_MIN, so
+        flooring matches C truncation.
+    '''
+    if _is_array_input(mean_julian_day, nanoseconds_of_day):
+        mean_julian_day = np.asarray(mean_julian_day, dtype=np.int64)
+        nanoseconds_of_day = np.asarray(nanoseconds_of_day, dtype=np.int64)
+
+    # Julian day number of the date (noon), then iauJd2cal
+    remainder = mean_julian_day + 2400001 + 68569
+    n = (4 * remainder) // 146097
+    remainder = remainder - (146097 * n + 3) // 4
+    i = (4000 * (remainder + 1)) // 1461001
+    remainder = remainder - (1461 * i) // 4 + 31
+    k = (80 * remainder) // 2447
+    day = remainder - (2447 * k) // 80
+    year_carry = k // 11
+    month = k + 2 - 12 * year_carry
+    year = 100 * (n - 49) + i + year_carry
+
+    # Time of day
+    hours = nanoseconds_of_day // (3600 * NANOSECONDS_IN_SECOND)
+    minutes = nanoseconds_of_day // (60 * NANOSECONDS_IN_SECOND) % 60
+    seconds = nanoseconds_of_day % (60 * NANOSECONDS_IN_SECOND) / \
+        NANOSECONDS_IN_SECOND
+
+    return year, month, day, hours, minutes, seconds
+
+
 def check_validity_date(
         year: int = None,
         month: int = None,
@@ -389,20 +2315,99 @@ def check_validity_date(
     return True, ""
 
 
+def check_validity_date_array(
+        year: np.ndarray = None,
+        month: np.ndarray = None,
+        day: np.ndarray = None,
+        hours: np.ndarray = None,
+        minutes: np.ndarray = None,
+        seconds: np.ndarray = None) -> tuple:
+    '''Check whole columns of date vectors at once, array version of
+    `check_validity_date`
+
+    Args:
+        year(`np.ndarray`): calendar years
+        month(`np.ndarray`): calendar months as integers [1, 12]
+        day(`np.ndarray`): calendar days
+        hours(`np.ndarray`): hours (24 hour format)
+        minutes(`np.ndarray`): minutes
+        seconds(`np.ndarray`): seconds
+        (scalars broadcast against the arrays)
+
+    Returns:
+        tuple
+            valid (`np.ndarray` of `bool`): True where the row is valid
+            reasons (`np.ndarray` of `int`): DATE_VALID where the row is
+                valid, else the code of the first failed check (same order as
+                `check_validity_date`), see DATE_VALIDITY_REASONS
+
+    Notes:
+        Columns may be integer or float. Non-integer or non-finite years,
+        months and days, and non-finite times, are reported as invalid.
+    '''
+    year, month, day, hours, minutes, seconds = np.broadcast_arrays(
+        np.asarray(year), np.asarray(month), np.asarray(day),
+        np.asarray(hours), np.asarray(minutes), np.asarray(seconds))
+
+    # Calendar fields must be whole and finite. Float columns (np.loadtxt's
+    # default, or any column holding NaN) are cast to int64 for the lookups
+    # below, the failures are flagged by the checks
+    whole_year, whole_month, whole_day = (
+        np.isfinite(values) & (np.floor(values) == values)
+        for values in (year, month, day))
+    month_index = np.where(whole_month, month, 0).astype(np.int64)
+
+    # Days in month, with leap Februaries (invalid months are clipped here but
+    # flagged by the month check first)
+    days_in_month = _DAYS_IN_MONTH_ARRAY[np.clip(month_index, 0, 12)] + \
+        ((month_index == 2) &
+         check_leap_year(np.where(whole_year, year, 0).astype(np.int64)))
+
+    # Same checks as check_validity_date, in the same order. NaN times fail
+    # the day fraction check
+    day_fraction = (hours + minutes/60 + seconds/3600)/24
+    checks = (
+        (DATE_INVALID_YEAR, ~whole_year | (year < YEAR_MIN)),
+        (DATE_INVALID_MONTH, ~whole_month | (month < 1) | (month > 12)),
+        (DATE_INVALID_DAY, ~whole_day | (day < 0) | (day > days_in_month)),
+        (DATE_INVALID_NEGATIVE_TIME, (hours < 0) | (minutes < 0) |
+         (seconds < 0)),
+        (DATE_INVALID_DAY_FRACTION, ~(day_fraction <= 1)),
+    )
+
+    # Apply in reverse so that the first failed check wins
+    reasons = np.full(year.shape, DATE_VALID, dtype=np.int8)
+    for reason, failed in reversed(checks):
+        reasons[failed] = reason
+
+    return reasons == DATE_VALID, reasons
+
+
 def check_leap_year(year: int) -> bool:
     '''Check if it's a leap year
 
     Args:
-        year(`int`): calendar year
+        year(`int` or `np.ndarray`): calendar year
 
     Returns:
-        True if leap year, False else
+        True if leap year, False else (`np.ndarray` of `bool` if year is an
+        array)
 
     Notes:
         from Ref. [2]
     '''
-    if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
-        # it's a leap year!
-        return True
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def _is_array_input(*values) -> bool:
+    '''Check whether any of the inputs is array-like (so the vectorized
+    path should be used)
 
-    return False
+    Args:
+        values: inputs to check
+
+    Returns:
+        True if any input is a `np.ndarray`, `list`, or `tuple`, False else
+    '''
+    return any(isinstance(value, (np.ndarray, list, tuple))
+               for value in values)
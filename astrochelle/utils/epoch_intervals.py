@@ -0,0 +1,401 @@
+#!/usr/bin/env python
+# ------------------------------------------------------------------------------
+# epoch_intervals
+# DESCRIPTION: sets of time windows (access, eclipse, blackout, ...)
+# ------------------------------------------------------------------------------
+
+# Python imports
+import numpy as np
+
+# Astrochelle imports
+from astrochelle.utils.constants import NANOSECONDS_IN_DAY, \
+    NANOSECONDS_IN_SECOND
+from astrochelle.utils.epoch import Epoch, EpochArray, MAX_INDEX_SPAN_DAYS, \
+    get_index_keys
+
+##################
+# Error Handling #
+##################
+
+
+class EpochIntervalException(Exception):
+    '''Exceptions related to epoch intervals
+    '''
+
+    def __init__(
+        self,
+        msg: str = "Something went wrong in epoch_intervals.py."
+    ):
+
+        super().__init__(msg)
+
+
+####################
+# EpochIntervalSet #
+####################
+class EpochIntervalSet():
+    def __init__(self, starts, stops, time_system: str = None):
+        '''Set of half-open time windows [start, stop), kept sorted and
+        disjoint
+
+        Args:
+            starts (`EpochArray` or `list` of `Epoch`): window starts
+            stops (`EpochArray` or `list` of `Epoch`): window stops, same
+                length and time system as starts
+            time_system (`str`): time system, only needed when both are
+                empty lists (defaults to 'UTC')
+
+        Attributes:
+            time_system (`str`): time system of every window
+            starts (`EpochArray`): sorted window starts
+            stops (`EpochArray`): window stops, starts[i] < stops[i] <
+                starts[i + 1]
+
+        Notes:
+            Windows may be given in any order and may overlap or touch; they
+            are merged in O(n log n). Empty windows are dropped and a stop
+            before its start raises.
+
+            Windows are stored as int64 nanoseconds since a reference day, so
+            a set (and any two sets combined) may span at most
+            MAX_INDEX_SPAN_DAYS. Every set operation is a vectorized sweep
+            over the sorted window boundaries.
+        '''
+        starts = _to_epoch_array(starts, time_system)
+        stops = _to_epoch_array(stops, time_system)
+        if starts.time_system != stops.time_system:
+            raise EpochIntervalException(
+                f"Mismatch ({starts.time_system},{stops.time_system})")
+        if starts.mean_julian_day.shape != stops.mean_julian_day.shape:
+            raise EpochIntervalException(
+                f"Got {len(starts)} starts and {len(stops)} stops.")
+
+        self.time_system = starts.time_system
+        self._reference_day = int(starts.mean_julian_day.min()) \
+            if len(starts) else 0
+
+        start_keys = self._to_keys(starts)
+        stop_keys = self._to_keys(stops)
+        if np.any(stop_keys < start_keys):
+            raise EpochIntervalException("Window stops before it starts.")
+        self._starts, self._stops = _sweep(start_keys, stop_keys, 1)
+
+    @classmethod
+    def _from_keys(cls, starts, stops, reference_day, time_system):
+        '''Build a set from normalized keys, skipping `__init__`
+        '''
+        interval_set = object.__new__(cls)
+        interval_set.time_system = time_system
+        interval_set._reference_day = reference_day
+        interval_set._starts = starts
+        interval_set._stops = stops
+        return interval_set
+
+    def _to_keys(self, epochs: EpochArray) -> np.ndarray:
+        '''Nanoseconds since the reference day
+
+        Args:
+            epochs (`EpochArray`): epochs to convert, within
+                MAX_INDEX_SPAN_DAYS of the reference day
+
+        Returns:
+            `np.ndarray` int64 keys
+        '''
+        days = epochs.mean_julian_day - self._reference_day
+        if np.any(np.abs(days) > MAX_INDEX_SPAN_DAYS):
+            raise EpochIntervalException(
+                f"Windows span more than {MAX_INDEX_SPAN_DAYS} days.")
+        return get_index_keys(epochs, self._reference_day)
+
+    def _to_epochs(self, keys: np.ndarray) -> EpochArray:
+        '''Inverse of `_to_keys`
+        '''
+        days, nanoseconds_of_day = np.divmod(keys, NANOSECONDS_IN_DAY)
+        return EpochArray(days + self._reference_day,
+                          time_system=self.time_system,
+                          nanoseconds_of_day=nanoseconds_of_day)
+
+    @property
+    def starts(self) -> EpochArray:
+        return self._to_epochs(self._starts)
+
+    @property
+    def stops(self) -> EpochArray:
+        return self._to_epochs(self._stops)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __iter__(self):
+        '''Iterate over (start, stop) `Epoch` pairs
+        '''
+        return zip(self.starts, self.stops)
+
+    @staticmethod
+    def union_all(interval_sets: list):
+        '''Windows covered by any of the sets, in one sweep (e.g. the
+        visibility of a whole constellation)
+
+        Args:
+            interval_sets (`list` of `EpochIntervalSet`): at least one set,
+                all in the same time system
+
+        Returns:
+            `EpochIntervalSet`
+        '''
+        return _combine(interval_sets, 1)
+
+    @staticmethod
+    def intersection_all(interval_sets: list):
+        '''Windows covered by every one of the sets, in one sweep
+
+        Args:
+            interval_sets (`list` of `EpochIntervalSet`): at least one set,
+                all in the same time system
+
+        Returns:
+            `EpochIntervalSet`
+        '''
+        return _combine(interval_sets, len(interval_sets))
+
+    def union(self, other):
+        '''Windows covered by either set (`|`)
+
+        Args:
+            other (`EpochIntervalSet`): set in the same time system
+
+        Returns:
+            `EpochIntervalSet`
+        '''
+        return _combine([self, other], 1)
+
+    def intersection(self, other):
+        '''Windows covered by both sets (`&`)
+
+        Args:
+            other (`EpochIntervalSet`): set in the same time system
+
+        Returns:
+            `EpochIntervalSet`
+        '''
+        return _combine([self, other], 2)
+
+    def difference(self, other):
+        '''Windows covered by this set but not by other (`-`)
+
+        Args:
+            other (`EpochIntervalSet`): set in the same time system
+
+        Returns:
+            `EpochIntervalSet`
+        '''
+        if len(self) == 0:
+            return self
+        reference_day, ((starts, stops), (other_starts, other_stops)) = \
+            _align([self, other])
+
+        # Intersect with the gaps of other, within this set's extent
+        gap_starts, gap_stops = _gaps(
+            other_starts, other_stops, starts[0], stops[-1])
+        return EpochIntervalSet._from_keys(
+            *_sweep(np.concatenate([starts, gap_starts]),
+                    np.concatenate([stops, gap_stops]), 2),
+            reference_day, self.time_system)
+
+    def complement(self, start: Epoch = None, stop: Epoch = None):
+        '''Gaps between the windows, within [start, stop)
+
+        Args:
+            start (`Epoch`): start of the span to complement within, defaults
+                to the first window start
+            stop (`Epoch`): stop of the span, defaults to the last window stop
+
+        Returns:
+            `EpochIntervalSet`
+        '''
+        if len(self) == 0:
+            if start is None or stop is None:
+                raise EpochIntervalException(
+                    "Complement of an empty set needs a start and a stop.")
+            if self._reference_day != start.mean_julian_day:
+                # Nothing to keep aligned, so count from the span's start
+                return EpochIntervalSet._from_keys(
+                    self._starts, self._stops, start.mean_julian_day,
+                    self.time_system).complement(start, stop)
+
+        lower = self._starts[0] if start is None else self._bound_key(start)
+        upper = self._stops[-1] if stop is None else self._bound_key(stop)
+        if upper < lower:
+            raise EpochIntervalException("Complement stops before it starts.")
+
+        return EpochIntervalSet._from_keys(
+            *_gaps(self._starts, self._stops, lower, upper),
+            self._reference_day, self.time_system)
+
+    def _bound_key(self, epoch: Epoch) -> int:
+        '''Key of a single `Epoch`, see `_to_keys`
+        '''
+        if epoch.time_system != self.time_system:
+            raise EpochIntervalException(
+                f"Mismatch ({self.time_system},{epoch.time_system})")
+        return int(self._to_keys(EpochArray(
+            [epoch.mean_julian_day], time_system=self.time_system,
+            nanoseconds_of_day=[epoch.nanoseconds_of_day]))[0])
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def durations(self) -> np.ndarray:
+        '''Length of each window
+
+        Returns:
+            `np.ndarray` of durations [s]
+        '''
+        return (self._stops - self._starts) / NANOSECONDS_IN_SECOND
+
+    def total_duration(self) -> float:
+        '''Total time covered by the set
+
+        Returns:
+            duration [s] (`float`), summed exactly in nanoseconds
+        '''
+        return int((self._stops - self._starts).sum()) / NANOSECONDS_IN_SECOND
+
+    def contains(self, epochs):
+        '''Check whether epochs fall inside any window
+
+        Args:
+            epochs (`Epoch` or `EpochArray`): epochs in the same time system
+
+        Returns:
+            `bool`, or `np.ndarray` of `bool` for an `EpochArray`
+        '''
+        if epochs.time_system != self.time_system:
+            raise EpochIntervalException(
+                f"Mismatch ({self.time_system},{epochs.time_system})")
+
+        if len(self) == 0:
+            inside = np.zeros(np.shape(epochs.mean_julian_day), dtype=bool)
+        else:
+            # Far away epochs are clamped, they are outside every window
+            keys = get_index_keys(epochs, self._reference_day)
+            index = np.searchsorted(self._starts, keys, side='right') - 1
+            inside = (index >= 0) & (keys < self._stops[np.maximum(index, 0)])
+        return bool(inside) if isinstance(epochs, Epoch) else inside
+
+
+def _align(interval_sets: list) -> tuple:
+    '''Express sets' keys relative to a common reference day
+
+    Args:
+        interval_sets (`list` of `EpochIntervalSet`): sets in one time system
+
+    Returns:
+        tuple
+            reference day (`int`)
+            `list` of (start keys, stop keys) per set (`np.ndarray` int64)
+    '''
+    if not interval_sets:
+        raise EpochIntervalException("Need at least one EpochIntervalSet.")
+    for interval_set in interval_sets:
+        if not isinstance(interval_set, EpochIntervalSet):
+            raise EpochIntervalException(
+                "Expected an EpochIntervalSet, got "
+                f"{type(interval_set).__name__}.")
+        if interval_set.time_system != interval_sets[0].time_system:
+            raise EpochIntervalException(
+                f"Mismatch ({interval_sets[0].time_system},"
+                f"{interval_set.time_system})")
+
+    reference_day = min(
+        (interval_set._reference_day for interval_set in interval_sets
+         if len(interval_set)),
+        default=interval_sets[0]._reference_day)
+
+    keys = []
+    for interval_set in interval_sets:
+        shift = interval_set._reference_day - reference_day
+        if len(interval_set) and shift + interval_set._stops[-1] // \
+                NANOSECONDS_IN_DAY > MAX_INDEX_SPAN_DAYS:
+            raise EpochIntervalException(
+                f"Windows span more than {MAX_INDEX_SPAN_DAYS} days.")
+        keys.append((interval_set._starts + shift * NANOSECONDS_IN_DAY,
+                     interval_set._stops + shift * NANOSECONDS_IN_DAY))
+    return reference_day, keys
+
+
+def _combine(interval_sets: list, minimum: int) -> EpochIntervalSet:
+    '''Windows covered by at least `minimum` of the sets, see `_sweep`
+    '''
+    reference_day, keys = _align(interval_sets)
+    starts, stops = zip(*keys)
+    return EpochIntervalSet._from_keys(
+        *_sweep(np.concatenate(starts), np.concatenate(stops), minimum),
+        reference_day, interval_sets[0].time_system)
+
+
+def _sweep(starts: np.ndarray, stops: np.ndarray, minimum: int) -> tuple:
+    '''Windows where at least `minimum` of the input windows overlap
+
+    Args:
+        starts (`np.ndarray`): int64 window start keys
+        stops (`np.ndarray`): int64 window stop keys
+        minimum (`int`): coverage needed, 1 for a union and the number of
+            sets for an intersection (each set's windows are disjoint)
+
+    Returns:
+        tuple
+            sorted, disjoint start keys (`np.ndarray`)
+            stop keys (`np.ndarray`)
+
+    Notes:
+        Starts sort before stops at the same time, so touching windows merge
+        in a union and leave an empty window (dropped) in an intersection.
+    '''
+    keys = np.concatenate([starts, stops]).astype(np.int64, copy=False)
+    changes = np.concatenate([
+        np.ones(len(starts), dtype=np.int64),
+        -np.ones(len(stops), dtype=np.int64)
+    ])
+    order = np.lexsort((-changes, keys))
+    keys = keys[order]
+    inside = np.cumsum(changes[order]) >= minimum
+
+    was_inside = np.concatenate([[False], inside[:-1]])
+    new_starts = keys[inside & ~was_inside]
+    new_stops = keys[~inside & was_inside]
+
+    keep = new_starts < new_stops
+    return new_starts[keep], new_stops[keep]
+
+
+def _gaps(starts: np.ndarray, stops: np.ndarray, lower: int, upper: int):
+    '''Gaps between sorted, disjoint windows, within [lower, upper)
+
+    Returns:
+        tuple
+            gap start keys (`np.ndarray`)
+            gap stop keys (`np.ndarray`)
+    '''
+    gap_starts = np.maximum(np.concatenate([[lower], stops]), lower)
+    gap_stops = np.minimum(np.concatenate([starts, [upper]]), upper)
+    keep = gap_starts < gap_stops
+    return gap_starts[keep].astype(np.int64), gap_stops[keep].astype(np.int64)
+
+
+def _to_epoch_array(epochs, time_system: str = None) -> EpochArray:
+    '''Accept an `EpochArray` or a list of `Epoch`
+    '''
+    if isinstance(epochs, EpochArray):
+        return epochs
+    epochs = list(epochs)
+    if not epochs:
+        return EpochArray(np.zeros(0, dtype=np.int64),
+                          time_system=time_system or 'UTC')
+    return EpochArray.from_epochs(epochs)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# ------------------------------------------------------------------------------
+# sidereal_time
+# DESCRIPTION: Earth rotation angle and Greenwich mean sidereal time
+# REFERENCES:
+#   [1] Software Routines from the IAU SOFA Collection were used.
+#       Copyright International Astronomical Union Standards of Fundamental
+#       Astronomy (http://www.iausofa.org)”.
+#       Routines `iauEra00` and `iauGmst06`.
+#   [2] Kaplan, George H. "The IAU Resolutions on Astronomical Reference
+#       Systems, Time Scales, and Earth Rotation Models". USNO Circular 179.
+#       2005.
+# ------------------------------------------------------------------------------
+
+# Python imports
+from functools import lru_cache
+from math import pi
+import numpy as np
+
+# Astrochelle imports
+from astrochelle.utils.constants import NANOSECONDS_IN_DAY, \
+    ARCSECONDS_TO_RADIANS
+from astrochelle.utils.epoch import Epoch, EpochArray, convert_time_system, \
+    normalize_split_time, seconds_to_nanoseconds
+
+# Constants
+SIDEREAL_TIME_CACHE_SIZE = 64  # epochs kept, a few integrator steps' worth
+
+# Earth rotation angle at J2000 UT1 and its rate past one turn per day, from
+# Ref. 1 [turns, turns / day]
+_ERA_AT_J2000 = 0.7790572732640
+_ERA_RATE = 0.00273781191135448
+
+# IAU 2006 GMST polynomial in Julian centuries of TT, from Ref. 1 [arcsec]
+_GMST_POLYNOMIAL = (
+    0.014506, 4612.156534, 1.3915817, -0.00000044, -0.000029956, -0.0000000368
+)
+
+##################
+# Error Handling #
+##################
+
+
+class SiderealTimeException(Exception):
+    '''Exceptions related to sidereal time
+    '''
+
+    def __init__(
+        self,
+        msg: str = "Something went wrong in sidereal_time.py."
+    ):
+
+        super().__init__(msg)
+
+
+#################
+# Sidereal Time #
+#################
+def get_earth_rotation_angle(
+        epoch,
+        ut1_minus_utc=0.0,
+        cache: bool = False):
+    '''Earth rotation angle (IAU 2000)
+
+    Args:
+        epoch (`Epoch` or `EpochArray`): epoch in any time system
+        ut1_minus_utc (`float` or `np.ndarray`): UT1-UTC [s], broadcast
+            against an `EpochArray`
+        cache (`bool`): reuse results for recently seen scalar epochs, see
+            Notes of `get_greenwich_mean_sidereal_time`
+
+    Returns:
+        Earth rotation angle in [0, 2 pi) [rad] (`float`, or `np.ndarray`
+            for an `EpochArray`)
+    '''
+    return _get_sidereal_time(epoch, ut1_minus_utc, cache)[0]
+
+
+def get_greenwich_mean_sidereal_time(
+        epoch,
+        ut1_minus_utc=0.0,
+        cache: bool = False):
+    '''Greenwich mean sidereal time (IAU 2006)
+
+    Args:
+        epoch (`Epoch` or `EpochArray`): epoch in any time system
+        ut1_minus_utc (`float` or `np.ndarray`): UT1-UTC [s], broadcast
+            against an `EpochArray`
+        cache (`bool`): reuse results for recently seen scalar epochs
+
+    Returns:
+        GMST in [0, 2 pi) [rad] (`float`, or `np.ndarray` for an
+            `EpochArray`)
+
+    Notes:
+        GMST is the Earth rotation angle (from UT1) plus a polynomial in TT,
+        Ref. 1 and Ref. 2.
+
+        With `cache`, the last SIDEREAL_TIME_CACHE_SIZE scalar epochs are
+        kept, keyed on their (day, nanoseconds, time system, UT1-UTC)
+        values, so force-model stages evaluating the same epoch share one
+        computation. `EpochArray` input is always computed directly.
+    '''
+    return _get_sidereal_time(epoch, ut1_minus_utc, cache)[1]
+
+
+def _get_sidereal_time(epoch, ut1_minus_utc, cache: bool) -> tuple:
+    '''Dispatch on epoch type, see `get_greenwich_mean_sidereal_time`
+
+    Returns:
+        tuple
+            Earth rotation angle [rad]
+            GMST [rad]
+    '''
+    if isinstance(epoch, Epoch):
+        arguments = (epoch.mean_julian_day, epoch.nanoseconds_of_day,
+                     epoch.time_system, float(ut1_minus_utc))
+        if cache:
+            return _evaluate_sidereal_time_cached(*arguments)
+        return _evaluate_sidereal_time(*arguments)
+
+    if isinstance(epoch, EpochArray):
+        return _evaluate_sidereal_time(
+            epoch.mean_julian_day, epoch.nanoseconds_of_day,
+            epoch.time_system, np.asarray(ut1_minus_utc, dtype=float))
+
+    raise SiderealTimeException(
+        f"Expected an Epoch or EpochArray, got {type(epoch).__name__}.")
+
+
+@lru_cache(maxsize=SIDEREAL_TIME_CACHE_SIZE)
+def _evaluate_sidereal_time_cached(
+        mean_julian_day: int,
+        nanoseconds_of_day: int,
+        time_system: str,
+        ut1_minus_utc: float) -> tuple:
+    '''Cached `_evaluate_sidereal_time` for scalar epochs
+    '''
+    return _evaluate_sidereal_time(
+        mean_julian_day, nanoseconds_of_day, time_system, ut1_minus_utc)
+
+
+def _evaluate_sidereal_time(
+        mean_julian_day,
+        nanoseconds_of_day,
+        time_system: str,
+        ut1_minus_utc) -> tuple:
+    '''Earth rotation angle and GMST from a split (day, nanoseconds) time
+
+    Args:
+        mean_julian_day (`int` or `np.ndarray`): mean julian day
+        nanoseconds_of_day (`int` or `np.ndarray`): nanoseconds past zero
+            hours
+        time_system (`str`): time system of the epoch
+        ut1_minus_utc (`float` or `np.ndarray`): UT1-UTC [s]
+
+    Returns:
+        tuple
+            Earth rotation angle in [0, 2 pi) [rad]
+            GMST in [0, 2 pi) [rad]
+    '''
+    # UT1
+    ut1_day, ut1_nanoseconds = convert_time_system(
+        mean_julian_day, nanoseconds_of_day, time_system, 'UTC')
+    ut1_day, ut1_nanoseconds = normalize_split_time(
+        ut1_day, ut1_nanoseconds + seconds_to_nanoseconds(ut1_minus_utc))
+
+    # Earth rotation angle, Ref. 1. The whole days since J2000 contribute
+    # whole turns, so only the fraction of the day is added at full size.
+    day_fraction = ut1_nanoseconds / NANOSECONDS_IN_DAY - 0.5
+    days = (ut1_day - 51544) + day_fraction
+    turns = (day_fraction + _ERA_AT_J2000 + _ERA_RATE * days) % 1.0
+    earth_rotation_angle = 2 * pi * turns
+
+    # GMST, Ref. 1
+    tt_day, tt_nanoseconds = convert_time_system(
+        mean_julian_day, nanoseconds_of_day, time_system, 'TT')
+    centuries = ((tt_day - 51544) +
+                 (tt_nanoseconds / NANOSECONDS_IN_DAY - 0.5)) / 36525
+    polynomial = 0.0
+    for coefficient in reversed(_GMST_POLYNOMIAL):
+        polynomial = polynomial * centuries + coefficient
+    gmst = (earth_rotation_angle + polynomial * ARCSECONDS_TO_RADIANS) \
+        % (2 * pi)
+
+    return earth_rotation_angle, gmst
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# ------------------------------------------------------------------------------
+# bench_absolute_state
+# DESCRIPTION: timing benchmarks for astrochelle/utils/absolute_state.py
+#   Run with `python benchmarks/bench_absolute_state.py` after
+#   `pip3 install -e .`
+# ------------------------------------------------------------------------------
+
+# Python imports
+from timeit import repeat
+import numpy as np
+
+# Astrochelle imports
+from astrochelle.utils.absolute_state import KEPLER_METHODS, \
+    convert_anomaly_mean_to_eccentric, solve_kepler_equation, \
+    solve_kepler_equation_tabulated
+
+# Constants
+REPEAT = 5  # timing samples, the fastest is reported
+TOLERANCE = 1e-12  # [rad]
+CATALOG_SIZE = 1000000  # orbits solved at once for the throughput benchmark
+
+# Eccentricity bands, to show how each method copes as e approaches 1
+ECCENTRICITY_BANDS = {
+    'e < 0.1': (0.0, 0.1),
+    '0.1 <= e < 0.7': (0.1, 0.7),
+    '0.7 <= e < 0.99': (0.7, 0.99),
+    '0.99 <= e < 1': (0.99, 1.0),
+}
+
+
+def time_per_call(statement, number: int) -> float:
+    '''Time a statement, returning the best time per call [s]
+
+    Args:
+        statement (`callable`): zero-argument callable to time
+        number (`int`): calls per timing sample
+
+    Returns:
+        time per call [s] (`float`)
+    '''
+    return min(repeat(statement, number=number, repeat=REPEAT)) / number
+
+
+def bench_kepler_solvers(num_orbits: int = 20000) -> dict:
+    '''Iteration counts and time per solve of each Kepler method, per
+    eccentricity band, against the scalar solver
+
+    Args:
+        num_orbits (`int`): orbits per eccentricity band
+
+    Returns:
+        `dict` of {(band, method): (mean iterations, max iterations, time
+            per solve [s])}
+    '''
+    rng = np.random.default_rng(0)
+    results = {}
+    for band, (lower, upper) in ECCENTRICITY_BANDS.items():
+        mean_anomaly = rng.uniform(-np.pi, np.pi, num_orbits)
+        eccentricity = rng.uniform(lower, upper, num_orbits)
+
+        for method in KEPLER_METHODS:
+            _, _, iterations = solve_kepler_equation(
+                mean_anomaly, eccentricity, tolerance=TOLERANCE,
+                method=method, return_iterations=True)
+            time_solve = time_per_call(
+                lambda: solve_kepler_equation(
+                    mean_anomaly, eccentricity, tolerance=TOLERANCE,
+                    method=method), number=1) / num_orbits
+            results[band, method] = (
+                iterations.mean(), iterations.max(), time_solve)
+
+        # The original scalar loop (its iteration count isn't exposed)
+        sample = list(zip(mean_anomaly[:1000], eccentricity[:1000]))
+
+        def scalar_loop():
+            for mean, eccentric in sample:
+                convert_anomaly_mean_to_eccentric(
+                    mean, eccentric, tolerance=TOLERANCE)
+
+        results[band, 'scalar newton'] = (
+            np.nan, np.nan, time_per_call(scalar_loop, number=1) / len(sample))
+    return results
+
+
+def bench_kepler_throughput() -> dict:
+    '''Solves per second over a catalog of CATALOG_SIZE orbits, uniform in
+    mean anomaly and eccentricity
+
+    Returns:
+        `dict` of {solver: (solves per second, max error vs 'danby' [rad])}
+    '''
+    rng = np.random.default_rng(1)
+    mean_anomaly = rng.uniform(-np.pi, np.pi, CATALOG_SIZE)
+    eccentricity = rng.uniform(0, 1, CATALOG_SIZE)
+    reference, _ = solve_kepler_equation(
+        mean_anomaly, eccentricity, tolerance=1e-14, method='danby')
+
+    solvers = {
+        method: lambda method=method: solve_kepler_equation(
+            mean_anomaly, eccentricity, tolerance=TOLERANCE,
+            method=method)[0]
+        for method in KEPLER_METHODS
+    }
+    solvers['table'] = lambda: solve_kepler_equation_tabulated(
+        mean_anomaly, eccentricity)
+
+    results = {}
+    for name, solver in solvers.items():
+        error = np.abs(solver() - reference).max()
+        results[name] = (CATALOG_SIZE / time_per_call(solver, number=1),
+                         error)
+    return results
+
+
+def collect() -> dict:
+    '''Run every benchmark in this file, see `run_benchmarks.py`
+
+    Returns:
+        `dict` of {metric name: (value, unit)}
+    '''
+    metrics = {}
+    for (band, method), (_, _, time_solve) in bench_kepler_solvers().items():
+        metrics[f'kepler/{method} {band}'] = (time_solve * 1e9, 'ns')
+    for name, (throughput, _) in bench_kepler_throughput().items():
+        metrics[f'kepler throughput/{name}'] = (throughput, '/s')
+    return metrics
+
+
+if __name__ == '__main__':
+    print('Kepler equation, per solve (tolerance 1e-12 rad)')
+    for (band, method), (mean_iterations, max_iterations, time_solve) in \
+            bench_kepler_solvers().items():
+        print(f'  {band:>16} {method:>13}: {mean_iterations:5.2f} mean '
+              f'{max_iterations:3.0f} max iterations, '
+              f'{time_solve * 1e9:8.1f} ns')
+
+    print(f'Kepler equation, catalog of {CATALOG_SIZE} orbits')
+    for name, (throughput, error) in bench_kepler_throughput().items():
+        print(f'  {name:>6}: {throughput / 1e6:6.2f} million solves/s, '
+              f'max error {error:.1e} rad')
@@ -0,0 +1,388 @@
+#!/usr/bin/env python
+# ------------------------------------------------------------------------------
+# bench_epoch
+# DESCRIPTION: timing benchmarks for astrochelle/utils/epoch.py
+#   Run with `python benchmarks/bench_epoch.py` after `pip3 install -e .`
+# ------------------------------------------------------------------------------
+
+# Python imports
+from timeit import repeat
+import tracemalloc
+import numpy as np
+
+# Astrochelle imports
+from astrochelle.utils.constants import SECONDS_IN_DAY, NANOSECONDS_IN_DAY
+from astrochelle.utils.epoch import Epoch, EpochArray, parse_timestamps, \
+    get_tdb_minus_tt, set_epoch_validation, to_mjd, check_validity_date
+
+# Constants
+NUMBER = 20000  # calls per timing sample
+REPEAT = 5  # timing samples, the fastest is reported
+
+# Offsets used to show that arithmetic cost does not depend on offset size [s]
+OFFSETS = {
+    '1 second': 1.0,
+    '1 day': float(SECONDS_IN_DAY),
+    '30 days': 30.0 * SECONDS_IN_DAY,
+    '1 year': 365.25 * SECONDS_IN_DAY,
+    '1 century': 36525.0 * SECONDS_IN_DAY,
+    '10 millennia': 3652500.0 * SECONDS_IN_DAY,
+}
+
+
+def time_per_call(statement, number: int = NUMBER) -> float:
+    '''Time a statement, returning the best time per call [s]
+
+    Args:
+        statement (`callable`): zero-argument callable to time
+        number (`int`): calls per timing sample
+
+    Returns:
+        time per call [s] (`float`)
+    '''
+    return min(repeat(statement, number=number, repeat=REPEAT)) / number
+
+
+def bench_arithmetic_vs_offset() -> dict:
+    '''Time `Epoch + seconds` and `Epoch - seconds` for growing offsets
+
+    Returns:
+        `dict` of {offset name: (add time, subtract time)} [s]
+    '''
+    epoch = Epoch(year=2022, month=7, day=27, hours=12, minutes=5, seconds=5)
+
+    results = {}
+    for name, offset in OFFSETS.items():
+        results[name] = (
+            time_per_call(lambda: epoch + offset),
+            time_per_call(lambda: epoch - offset)
+        )
+    return results
+
+
+def bench_in_place_stepping(num_steps: int = 100000,
+                            timestep: float = 10.0) -> tuple:
+    '''Step an epoch in place like a propagator loop, measuring time and
+    memory allocated per step
+
+    Args:
+        num_steps (`int`): number of steps to take
+        timestep (`float`): step size [s]
+
+    Returns:
+        tuple
+            time per `+=` step [s] (`float`)
+            memory still allocated after all steps [bytes] (`int`)
+            peak memory allocated during the steps [bytes] (`int`)
+    '''
+    epoch = Epoch(year=2022, month=7, day=27, hours=12, minutes=5, seconds=5)
+
+    def step():
+        nonlocal epoch
+        epoch += timestep
+
+    time_step = time_per_call(step, number=num_steps)
+
+    # Memory: anything an in-place step left behind would grow with num_steps
+    tracemalloc.start()
+    start_size, _ = tracemalloc.get_traced_memory()
+    for _ in range(num_steps):
+        epoch += timestep
+    end_size, peak_size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return time_step, end_size - start_size, peak_size - start_size
+
+
+def bench_calendar_conversion(num_epochs: int = 1000000) -> float:
+    '''Time MJD to calendar conversion of an `EpochArray`
+
+    Args:
+        num_epochs (`int`): number of epochs to convert
+
+    Returns:
+        conversions per second (`float`)
+    '''
+    rng = np.random.default_rng(0)
+    epochs = EpochArray(
+        rng.integers(40000, 80000, num_epochs),
+        nanoseconds_of_day=rng.integers(0, NANOSECONDS_IN_DAY, num_epochs)
+    )
+    return num_epochs / time_per_call(epochs.to_calendar, number=1)
+
+
+def bench_parse_timestamps(num_timestamps: int = 1000000) -> dict:
+    '''Time bulk parsing of ISO-8601 timestamps, fixed width, variable width
+    and mixed layouts, against splitting each string and calling the `Epoch`
+    constructor
+
+    Args:
+        num_timestamps (`int`): number of timestamps to parse in bulk
+
+    Returns:
+        `dict` of {method: timestamps per second}
+    '''
+    epochs = EpochArray(
+        np.full(num_timestamps, 59787),
+        nanoseconds_of_day=np.arange(num_timestamps) * 10**9
+        % NANOSECONDS_IN_DAY
+    )
+    timestamps = np.array(
+        [str(epoch)[:23] + 'Z' for epoch in epochs[:100000]])
+    timestamps = np.resize(timestamps, num_timestamps)
+    mixed = timestamps.copy()
+    mixed[::2] = np.char.replace(mixed[::2], 'Z', '')
+
+    # Calendar and day-of-year forms, with several fraction lengths
+    layouts = timestamps.copy()
+    layouts[1::4] = np.char.replace(layouts[1::4], '2022-07-27', '2022-208')
+    layouts[2::4] = np.char.replace(layouts[2::4], '0Z', '')
+    layouts[3::4] = np.char.replace(
+        np.char.replace(layouts[3::4], '.000', ''), '2022-07-27T',
+        '2022-07-27 ')
+
+    def per_line():
+        for timestamp in timestamps[:10000].tolist():
+            date, time = timestamp.rstrip('Z').split('T')
+            year, month, day = date.split('-')
+            hours, minutes, seconds = time.split(':')
+            Epoch(year=int(year), month=int(month), day=int(day),
+                  hours=int(hours), minutes=int(minutes),
+                  seconds=float(seconds))
+
+    return {
+        'fixed width': num_timestamps / time_per_call(
+            lambda: parse_timestamps(timestamps), number=1),
+        'variable width': num_timestamps / time_per_call(
+            lambda: parse_timestamps(mixed), number=1),
+        'mixed layouts': num_timestamps / time_per_call(
+            lambda: parse_timestamps(layouts), number=1),
+        'Epoch per line': 10000 / time_per_call(per_line, number=1),
+    }
+
+
+def bench_time_system_conversion(num_epochs: int = 1000000) -> dict:
+    '''Time UTC to TT/TDB conversion of an `EpochArray` against converting
+    one `Epoch` at a time
+
+    Args:
+        num_epochs (`int`): number of epochs to convert
+
+    Returns:
+        `dict` of {method: conversions per second}
+    '''
+    rng = np.random.default_rng(0)
+    epochs = EpochArray(
+        rng.integers(41317, 62000, num_epochs),
+        nanoseconds_of_day=rng.integers(0, NANOSECONDS_IN_DAY, num_epochs)
+    )
+    epoch_list = epochs[:10000].to_epochs()
+
+    def per_epoch():
+        for epoch in epoch_list:
+            epoch.to_time_system('TT')
+
+    return {
+        'array UTC->TT': num_epochs / time_per_call(
+            lambda: epochs.to_time_system('TT'), number=1),
+        'array UTC->TDB': num_epochs / time_per_call(
+            lambda: epochs.to_time_system('TDB'), number=1),
+        'Epoch UTC->TT': len(epoch_list) / time_per_call(
+            per_epoch, number=1),
+    }
+
+
+def bench_tdb_minus_tt(num_epochs: int = 1000000) -> dict:
+    '''Time TDB-TT evaluation per mode, uncached and cached, for one epoch
+    at a time (as in a force model) and for an integration grid
+
+    Args:
+        num_epochs (`int`): number of epochs in the grid (10 s apart)
+
+    Returns:
+        `dict` of {method: time per evaluation [s]}
+    '''
+    # Integrator stages revisit the same few times, so the cache is warm
+    mean_julian_day, nanoseconds = 59787, 43200 * 10**9
+    grid_days = np.full(num_epochs, 59787)
+    grid_nanoseconds = np.arange(num_epochs, dtype=np.int64) * 10 * 10**9
+
+    results = {}
+    for mode in ('precise', 'fast'):
+        for cache in (False, True):
+            name = f"{mode}{' cached' if cache else ''}"
+            results[f'scalar {name}'] = time_per_call(
+                lambda: get_tdb_minus_tt(
+                    mean_julian_day, nanoseconds, mode=mode, cache=cache))
+            results[f'array {name}'] = time_per_call(
+                lambda: get_tdb_minus_tt(
+                    grid_days, grid_nanoseconds, mode=mode, cache=cache),
+                number=1) / num_epochs
+    return results
+
+
+def bench_elapsed_seconds(num_epochs: int = 1000000) -> dict:
+    '''Time elapsed seconds between epochs, exact against recomputing from
+    floating point MJDs, with the worst error of the float approach
+
+    Args:
+        num_epochs (`int`): number of epochs in the array
+
+    Returns:
+        `dict` of {method: time per difference [s] or error [s]}
+    '''
+    start = Epoch(year=2000, month=1, day=1, hours=12, minutes=0)
+    end = start + 123456.789
+    rng = np.random.default_rng(0)
+    epochs = EpochArray(
+        rng.integers(40000, 80000, num_epochs),
+        nanoseconds_of_day=rng.integers(0, NANOSECONDS_IN_DAY, num_epochs)
+    )
+
+    def float_difference(epoch, other):
+        return ((epoch.mean_julian_day + epoch.day_fraction) -
+                (other.mean_julian_day + other.day_fraction)) * SECONDS_IN_DAY
+
+    float_error = np.abs(
+        float_difference(epochs, start) -
+        epochs.nanoseconds_since(start) / 10**9).max()
+
+    return {
+        'scalar exact': time_per_call(lambda: end.seconds_since(start)),
+        'scalar float MJD': time_per_call(
+            lambda: float_difference(end, start)),
+        'array exact': time_per_call(
+            lambda: epochs.seconds_since(start), number=1) / num_epochs,
+        'array float MJD': time_per_call(
+            lambda: float_difference(epochs, start), number=1) / num_epochs,
+        'float MJD worst error': float_error,
+    }
+
+
+def bench_construction() -> dict:
+    '''Time `Epoch` construction, validated against the trusted fast paths
+
+    Returns:
+        `dict` of {method: time per construction [s]}
+    '''
+    def calendar():
+        return Epoch(year=2022, month=7, day=27, hours=12, minutes=5,
+                     seconds=5.25)
+
+    results = {'calendar validated': time_per_call(calendar)}
+    previous = set_epoch_validation(False)
+    results['calendar no validation'] = time_per_call(calendar)
+    set_epoch_validation(previous)
+    results['from_calendar_unchecked'] = time_per_call(
+        lambda: Epoch.from_calendar_unchecked(2022, 7, 27, 12, 5, 5.25))
+    results['MJD'] = time_per_call(
+        lambda: Epoch(mean_julian_day=59787, day_fraction=0.5))
+    results['from_mjd_unchecked'] = time_per_call(
+        lambda: Epoch.from_mjd_unchecked(59787, 43200000000000))
+    return results
+
+
+def bench_supporting_functions(num_dates: int = 1000000) -> dict:
+    '''Time the calendar helpers, one date at a time and in bulk
+
+    Args:
+        num_dates (`int`): number of dates in the bulk conversion
+
+    Returns:
+        `dict` of {method: time per date [s]}
+    '''
+    rng = np.random.default_rng(0)
+    years = rng.integers(1900, 2100, num_dates)
+    months = rng.integers(1, 13, num_dates)
+    days = rng.integers(1, 29, num_dates)
+    zeros = np.zeros(num_dates)
+
+    return {
+        'to_mjd scalar': time_per_call(lambda: to_mjd(
+            year=2022, month=7, day=27, hours=12, minutes=5, seconds=5.25)),
+        'to_mjd array': time_per_call(lambda: to_mjd(
+            year=years, month=months, day=days, hours=zeros, minutes=zeros,
+            seconds=zeros), number=1) / num_dates,
+        'check_validity_date': time_per_call(lambda: check_validity_date(
+            year=2022, month=7, day=27, hours=12, minutes=5, seconds=5.25)),
+    }
+
+
+def collect() -> dict:
+    '''Run every benchmark in this file, see `run_benchmarks.py`
+
+    Returns:
+        `dict` of {metric name: (value, unit)}, unit 'ns' (time per call),
+            '/s' (rate) or 'B' (bytes)
+    '''
+    metrics = {}
+    for name, (time_add, time_sub) in bench_arithmetic_vs_offset().items():
+        metrics[f'arithmetic/add {name}'] = (time_add * 1e9, 'ns')
+        metrics[f'arithmetic/subtract {name}'] = (time_sub * 1e9, 'ns')
+
+    time_step, net_bytes, peak_bytes = bench_in_place_stepping()
+    metrics['in-place stepping/step'] = (time_step * 1e9, 'ns')
+    metrics['in-place stepping/peak memory'] = (peak_bytes, 'B')
+
+    for name, time_call in bench_construction().items():
+        metrics[f'construction/{name}'] = (time_call * 1e9, 'ns')
+    for name, time_call in bench_supporting_functions().items():
+        metrics[f'supporting functions/{name}'] = (time_call * 1e9, 'ns')
+
+    metrics['bulk conversion/to_calendar'] = (
+        bench_calendar_conversion(), '/s')
+    for name, rate in bench_parse_timestamps().items():
+        metrics[f'bulk conversion/parse {name}'] = (rate, '/s')
+
+    for name, rate in bench_time_system_conversion().items():
+        metrics[f'time systems/{name}'] = (rate, '/s')
+    for name, time_call in bench_tdb_minus_tt().items():
+        metrics[f'time systems/TDB-TT {name}'] = (time_call * 1e9, 'ns')
+
+    for name, value in bench_elapsed_seconds().items():
+        if 'error' not in name:
+            metrics[f'arithmetic/elapsed {name}'] = (value * 1e9, 'ns')
+    return metrics
+
+
+if __name__ == '__main__':
+    print('Epoch arithmetic vs offset magnitude')
+    for name, (time_add, time_sub) in bench_arithmetic_vs_offset().items():
+        print(f'  {name:>10}: add {time_add * 1e9:8.1f} ns'
+              f'   subtract {time_sub * 1e9:8.1f} ns')
+
+    num_steps = 100000
+    time_step, net_bytes, peak_bytes = bench_in_place_stepping(num_steps)
+    print(f'In-place stepping ({num_steps} steps of 10 s)')
+    print(f'  time per step: {time_step * 1e9:8.1f} ns')
+    print(f'  memory retained: {net_bytes} bytes, '
+          f'peak: {peak_bytes} bytes ({peak_bytes / num_steps:.4f} per step)')
+
+    print('MJD to calendar conversion (EpochArray of 10^6 epochs)')
+    print(f'  {bench_calendar_conversion():.3e} conversions per second')
+
+    print('Timestamp parsing (10^6 ISO-8601 strings)')
+    for name, rate in bench_parse_timestamps().items():
+        print(f'  {name:>14}: {rate:.3e} timestamps per second')
+
+    print('Time system conversion (10^6 epochs)')
+    for name, rate in bench_time_system_conversion().items():
+        print(f'  {name:>14}: {rate:.3e} conversions per second')
+
+    print('TDB-TT evaluation (per epoch)')
+    for name, time_call in bench_tdb_minus_tt().items():
+        print(f'  {name:>21}: {time_call * 1e9:10.1f} ns')
+
+    print('Elapsed seconds between epochs (per difference)')
+    for name, value in bench_elapsed_seconds().items():
+        unit = 's' if 'error' in name else 'ns'
+        scale = 1 if 'error' in name else 1e9
+        print(f'  {name:>21}: {value * scale:10.3g} {unit}')
+
+    print('Epoch construction')
+    for name, time_call in bench_construction().items():
+        print(f'  {name:>23}: {time_call * 1e9:8.1f} ns')
+
+    print('Calendar helpers (per date)')
+    for name, time_call in bench_supporting_functions().items():
+        print(f'  {name:>19}: {time_call * 1e9:8.1f} ns')
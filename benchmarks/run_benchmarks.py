@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# ------------------------------------------------------------------------------
+# run_benchmarks
+# DESCRIPTION: run the benchmark suite, save the results as JSON and compare
+#   them against a baseline from another commit
+#   Run with `python benchmarks/run_benchmarks.py --output results.json
+#   [--baseline baseline.json] [--threshold 1.25] [--runs 3]` after
+#   `pip3 install -e .`. Timings are only comparable on the same machine;
+#   run the baseline and the candidate back to back.
+# ------------------------------------------------------------------------------
+
+# Python imports
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import numpy as np
+
+# Benchmark imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import bench_absolute_state  # noqa: E402
+import bench_epoch  # noqa: E402
+
+# Constants
+SUITES = {
+    'absolute_state': bench_absolute_state,
+    'epoch': bench_epoch,
+}  # each module provides `collect()` -> {metric: (value, unit)}
+HIGHER_IS_BETTER_UNITS = ('/s',)  # rates; everything else is a cost
+DEFAULT_THRESHOLD = 1.25  # allowed slowdown factor before failing
+FORMAT_VERSION = 1
+
+
+def get_environment() -> dict:
+    '''Describe where the benchmarks ran, so results are only compared
+    like for like
+
+    Returns:
+        `dict` of environment details
+    '''
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, universal_newlines=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+    }
+
+
+def run_suites(names: list, runs: int = 1) -> dict:
+    '''Run benchmark suites
+
+    Args:
+        names (`list`): keys of SUITES to run
+        runs (`int`): times to run each suite, keeping the best value of
+            each metric (damps noise from other processes)
+
+    Returns:
+        `dict` of results, ready for JSON
+    '''
+    metrics = {}
+    for name in names:
+        for _ in range(runs):
+            for metric, (value, unit) in SUITES[name].collect().items():
+                key = f'{name}/{metric}'
+                value = float(value)
+                if key in metrics:
+                    best = metrics[key]['value']
+                    value = max(value, best) if unit in \
+                        HIGHER_IS_BETTER_UNITS else min(value, best)
+                metrics[key] = {'value': value, 'unit': unit}
+
+    return {
+        'format_version': FORMAT_VERSION,
+        'environment': get_environment(),
+        'runs': runs,
+        'metrics': metrics,
+    }
+
+
+def compare_results(
+        results: dict,
+        baseline: dict,
+        threshold: float = DEFAULT_THRESHOLD) -> list:
+    '''Find metrics that got worse than baseline by more than threshold
+
+    Args:
+        results (`dict`): output of `run_suites`
+        baseline (`dict`): output of `run_suites` from another commit
+        threshold (`float`): allowed ratio of worse to baseline, e.g. 1.25
+            allows a 25% slowdown (or a 20% lower rate)
+
+    Returns:
+        `list` of (metric, baseline value, value, ratio) for each regression,
+            ratio > 1 meaning worse. Metrics missing from either side, or
+            with a zero baseline, are skipped.
+    '''
+    regressions = []
+    for metric, entry in results['metrics'].items():
+        if metric not in baseline['metrics']:
+            continue
+        baseline_value = baseline['metrics'][metric]['value']
+        value = entry['value']
+        if entry['unit'] in HIGHER_IS_BETTER_UNITS:
+            ratio = baseline_value / value if value else float('inf')
+        else:
+            ratio = value / baseline_value if baseline_value else 0.0
+        if baseline_value and ratio > threshold:
+            regressions.append((metric, baseline_value, value, ratio))
+    return regressions
+
+
+def main(arguments: list = None) -> int:
+    '''Command line entry point
+
+    Returns:
+        exit status (`int`): 1 if any metric regressed, else 0
+    '''
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--suite', action='append', choices=sorted(SUITES),
+                        help='suite to run (repeatable, default: all)')
+    parser.add_argument('--runs', type=int, default=1,
+                        help='runs per suite, best value kept (default 1)')
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--baseline',
+                        help='JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed worse/baseline ratio '
+                             f'(default {DEFAULT_THRESHOLD})')
+    arguments = parser.parse_args(arguments)
+
+    results = run_suites(arguments.suite or sorted(SUITES), arguments.runs)
+    for metric, entry in results['metrics'].items():
+        print(f"{metric:<60} {entry['value']:12.4g} {entry['unit']}")
+
+    if arguments.output:
+        with open(arguments.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2, sort_keys=True)
+
+    if not arguments.baseline:
+        return 0
+
+    with open(arguments.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline['environment'].get('machine') != \
+            results['environment']['machine']:
+        print('Warning: baseline was measured on a different machine.')
+
+    regressions = compare_results(results, baseline, arguments.threshold)
+    for metric, baseline_value, value, ratio in regressions:
+        print(f'REGRESSION {metric}: {baseline_value:.4g} -> {value:.4g} '
+              f'({ratio:.2f}x worse)')
+    if not regressions:
+        print(f'No regressions beyond {arguments.threshold}x.')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
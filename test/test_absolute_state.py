@@ -6,6 +6,7 @@
 
 # Python imports
 from math import pi
+import numpy as np
 import pytest
 
 # Astrochelle imports
@@ -131,3 +132,278 @@ def test_convert_anomaly_true_to_mean():
             eccentricity=eccentricity),
         eccentricity=eccentricity
     ) - true_anomaly) < 1e-7
+
+
+def test_solve_kepler_equation():
+    # From Example 4.1 on page 233 in Ref. 1, scalars in, scalars out
+    eccentric_anomaly, converged = solve_kepler_equation(
+        mean_anomaly=235.4 * pi / 180, eccentricity=0.4)
+    assert converged is True
+    assert abs(eccentric_anomaly - 3.8486617) < 1e-7
+
+    # Arrays match the scalar solver and satisfy Kepler's equation
+    rng = np.random.default_rng(0)
+    mean_anomaly = rng.uniform(-pi, 2 * pi, 1000)
+    eccentricity = rng.uniform(0, 0.95, 1000)
+    eccentric_anomaly, converged = solve_kepler_equation(
+        mean_anomaly, eccentricity, tolerance=1e-12)
+    assert converged.all()
+    assert np.abs(eccentric_anomaly - eccentricity * np.sin(eccentric_anomaly)
+                  - mean_anomaly).max() < 1e-12
+    for index in range(0, 1000, 50):
+        assert abs(eccentric_anomaly[index] -
+                   convert_anomaly_mean_to_eccentric(
+                       mean_anomaly[index], eccentricity[index])) < 1e-7
+
+    # Inputs broadcast
+    eccentric_anomaly, converged = solve_kepler_equation(
+        [1.0, 2.0, 3.0], [[0.1], [0.5]])
+    assert eccentric_anomaly.shape == converged.shape == (2, 3)
+    assert converged.all()
+
+    # Failures are reported per element instead of raising
+    eccentric_anomaly, converged = solve_kepler_equation(
+        [3.0, 3.0, 1.0, np.nan], [0.999, 0.1, -0.5, 0.1],
+        tolerance=1e-10, allowed_iterations=3)
+    assert converged.tolist() == [False, True, False, False]
+    assert np.isfinite(eccentric_anomaly[0])
+    assert np.isnan(eccentric_anomaly[2:]).all()
+
+
+def test_solve_kepler_equation_methods():
+    # Every method solves any mean anomaly (reduced internally) for
+    # 0 <= e < 1; the higher order ones in at most 3 iterations
+    rng = np.random.default_rng(1)
+    mean_anomaly = rng.uniform(-20, 20, 10000)
+    eccentricity = np.concatenate([
+        rng.uniform(0, 1, 9990), [0, 0.9, 0.99, 0.999, 0.9999, 1 - 1e-6,
+                                  1 - 1e-8, 1 - 1e-10, 1 - 1e-12, 1e-12]])
+    for method in KEPLER_METHODS:
+        eccentric_anomaly, converged, iterations = solve_kepler_equation(
+            mean_anomaly, eccentricity, tolerance=1e-12, method=method,
+            return_iterations=True)
+        assert converged.all()
+        assert np.abs(eccentric_anomaly - eccentricity *
+                      np.sin(eccentric_anomaly) - mean_anomaly).max() < 1e-12
+        if method != 'newton':
+            assert iterations.max() <= 3
+
+    # Scalars, with and without iterations
+    eccentric_anomaly, converged, iterations = solve_kepler_equation(
+        235.4 * pi / 180, 0.4, method='danby', return_iterations=True)
+    assert abs(eccentric_anomaly - 3.8486617) < 1e-7
+    assert converged is True and iterations == 2
+    assert abs(convert_anomaly_mean_to_eccentric(
+        mean_anomaly=235.4 * pi / 180, eccentricity=0.4, method='halley')
+        - 3.8486617) < 1e-7
+
+    # Whole turns carry through
+    assert abs(solve_kepler_equation(1.0 + 4 * pi, 0.5, method='danby')[0]
+               - solve_kepler_equation(1.0, 0.5, method='danby')[0]
+               - 4 * pi) < 1e-12
+
+    with pytest.raises(AbsoluteStateException):
+        solve_kepler_equation(1.0, 0.5, method='bisection')
+    with pytest.raises(AbsoluteStateException):
+        convert_anomaly_mean_to_eccentric(
+            mean_anomaly=1.0, eccentricity=1.5, method='danby')
+
+
+def test_solve_kepler_equation_tabulated():
+    # Within the documented 2e-13 rad of the iterative solver for any mean
+    # anomaly, including eccentricities very close to 1
+    rng = np.random.default_rng(2)
+    mean_anomaly = rng.uniform(-20, 20, 20000)
+    eccentricity = np.concatenate([
+        rng.uniform(0, 1, 10000), 1 - 10**rng.uniform(-14, 0, 10000)])
+    eccentric_anomaly, converged = solve_kepler_equation(
+        mean_anomaly, eccentricity, tolerance=1e-14, method='danby')
+    assert converged.all()
+    assert np.abs(solve_kepler_equation_tabulated(
+        mean_anomaly, eccentricity) - eccentric_anomaly).max() < 2e-13
+
+    # Near the cusp at M = 0, e -> 1, and on the table nodes themselves
+    mean_anomaly, eccentricity = np.meshgrid(
+        np.linspace(-0.1, 0.1, 201), 1 - np.logspace(-14, -1, 27))
+    eccentric_anomaly, _ = solve_kepler_equation(
+        mean_anomaly, eccentricity, tolerance=1e-14, method='danby')
+    assert np.abs(solve_kepler_equation_tabulated(
+        mean_anomaly, eccentricity) - eccentric_anomaly).max() < 2e-13
+    mean_anomaly, eccentricity = np.meshgrid(
+        np.linspace(0, pi, KEPLER_TABLE_SIZE),
+        np.linspace(0, 0.999, KEPLER_TABLE_SIZE))
+    eccentric_anomaly, _ = solve_kepler_equation(
+        mean_anomaly, eccentricity, tolerance=1e-14, method='danby')
+    assert np.abs(solve_kepler_equation_tabulated(
+        mean_anomaly, eccentricity) - eccentric_anomaly).max() < 2e-13
+
+    # Scalars, invalid inputs and the convert_anomaly_mean_to_eccentric mode
+    assert abs(solve_kepler_equation_tabulated(235.4 * pi / 180, 0.4)
+               - 3.8486617) < 1e-7
+    assert np.isnan(solve_kepler_equation_tabulated(
+        [1.0, 1.0, np.nan], [1.0, -0.1, 0.5])).all()
+    assert abs(convert_anomaly_mean_to_eccentric(
+        mean_anomaly=235.4 * pi / 180, eccentricity=0.4, method='table')
+        - 3.8486617) < 1e-7
+    with pytest.raises(AbsoluteStateException):
+        convert_anomaly_mean_to_eccentric(
+            mean_anomaly=1.0, eccentricity=1.5, method='table')
+
+
+def test_convert_anomaly_arrays():
+    # Every conversion takes arrays, matches the scalar path and keeps
+    # anomalies beyond +/- pi in their own turn
+    rng = np.random.default_rng(3)
+    anomaly = rng.uniform(-4 * pi, 4 * pi, 500)
+    eccentricity = rng.uniform(0, 0.95, 500)
+    conversions = (
+        convert_anomaly_mean_to_eccentric, convert_anomaly_eccentric_to_mean,
+        convert_anomaly_eccentric_to_true, convert_anomaly_true_to_eccentric,
+        convert_anomaly_mean_to_true, convert_anomaly_true_to_mean)
+    for conversion in conversions:
+        converted = conversion(anomaly, eccentricity)
+        assert isinstance(converted, np.ndarray)
+        assert converted.shape == anomaly.shape
+        assert np.abs(converted - anomaly).max() < pi
+        for index in range(0, 500, 25):
+            scalar = conversion(float(anomaly[index]),
+                                float(eccentricity[index]))
+            assert isinstance(scalar, float)
+            assert abs(scalar - converted[index]) < 1e-7
+
+    # Round trips recover the anomaly, including past +/- pi
+    assert np.abs(convert_anomaly_true_to_mean(convert_anomaly_mean_to_true(
+        anomaly, eccentricity), eccentricity) - anomaly).max() < 1e-7
+    assert np.abs(convert_anomaly_true_to_eccentric(
+        convert_anomaly_eccentric_to_true(anomaly, eccentricity),
+        eccentricity) - anomaly).max() < 1e-12
+
+    # Half turns line up, e.g. apoapsis after one orbit
+    assert abs(convert_anomaly_eccentric_to_true(3 * pi, 0.7) - 3 * pi) < 1e-12
+    assert np.allclose(convert_anomaly_true_to_eccentric(
+        [-pi, 0.0, pi], 0.5), [-pi, 0.0, pi])
+
+    # Eccentricity broadcasts; invalid eccentricities give NaN
+    assert convert_anomaly_eccentric_to_true(
+        [1.0, 2.0], [[0.1], [0.2], [0.3]]).shape == (3, 2)
+    assert np.isnan(convert_anomaly_eccentric_to_true([1.0], [1.5])).all()
+    with pytest.raises(AbsoluteStateException):
+        convert_anomaly_mean_to_eccentric([1.0, 2.0], [0.5, 1.5])
+
+
+def test_convert_anomaly_parabolic():
+    # D = tan(nu / 2) = 1 at nu = 90 deg, M = D + D^3 / 3
+    assert abs(convert_anomaly_true_to_parabolic(pi / 2) - 1) < 1e-15
+    assert abs(convert_anomaly_parabolic_to_true(1.0) - pi / 2) < 1e-15
+    assert abs(convert_anomaly_parabolic_to_mean(1.0) - 4 / 3) < 1e-15
+    assert isinstance(convert_anomaly_mean_to_parabolic(4 / 3), float)
+    assert abs(convert_anomaly_mean_to_parabolic(4 / 3) - 1) < 1e-15
+
+    # Barker's equation round trips, including tiny mean anomalies
+    mean_anomaly = np.concatenate([
+        np.linspace(-1e4, 1e4, 1001), [1e-300, -1e-20, 1e-8, 0.0]])
+    assert np.allclose(convert_anomaly_parabolic_to_mean(
+        convert_anomaly_mean_to_parabolic(mean_anomaly)), mean_anomaly,
+        rtol=1e-14, atol=0)
+
+    # Very large mean anomalies don't overflow, D ~ (3M)^(1/3)
+    for mean_anomaly in (1e160, -1e200, 1e300):
+        parabolic_anomaly = convert_anomaly_mean_to_parabolic(mean_anomaly)
+        assert abs(parabolic_anomaly / np.cbrt(3 * mean_anomaly) - 1) < 1e-14
+        assert abs(convert_anomaly_parabolic_to_mean(parabolic_anomaly) /
+                   mean_anomaly - 1) < 1e-14
+
+    # Beyond a half turn a parabola never gets there
+    assert np.isnan(convert_anomaly_true_to_parabolic([pi, -4.0])).all()
+
+
+def test_convert_anomaly_hyperbolic():
+    # e = 2, F = 1: M = 2 sinh(1) - 1, tan(nu / 2) = sqrt(3) tanh(1 / 2)
+    true_anomaly = 2 * np.arctan(np.sqrt(3) * np.tanh(0.5))
+    assert abs(convert_anomaly_hyperbolic_to_mean(1.0, 2.0) -
+               (2 * np.sinh(1) - 1)) < 1e-15
+    assert abs(convert_anomaly_hyperbolic_to_true(1.0, 2.0) -
+               true_anomaly) < 1e-15
+    assert abs(convert_anomaly_true_to_hyperbolic(true_anomaly, 2.0) - 1) \
+        < 1e-14
+    hyperbolic_anomaly = convert_anomaly_mean_to_hyperbolic(
+        2 * np.sinh(1) - 1, 2.0)
+    assert isinstance(hyperbolic_anomaly, float)
+    assert abs(hyperbolic_anomaly - 1) < 1e-12
+
+    # Every method converges quickly for near-parabolic to very hyperbolic
+    # orbits, far from periapsis and very close to it
+    rng = np.random.default_rng(4)
+    mean_anomaly = np.concatenate([
+        rng.uniform(-10, 10, 5000),
+        10**rng.uniform(-12, 8, 5000) * rng.choice([-1, 1], 5000)])
+    eccentricity = 1 + 10**rng.uniform(-12, 1.5, 10000)
+    for method in KEPLER_METHODS:
+        hyperbolic_anomaly, converged, iterations = solve_kepler_equation(
+            mean_anomaly, eccentricity, tolerance=1e-12, method=method,
+            return_iterations=True)
+        assert converged.all()
+        assert iterations.max() <= (6 if method == 'newton' else 4)
+        assert np.abs(convert_anomaly_hyperbolic_to_mean(
+            hyperbolic_anomaly, eccentricity) - mean_anomaly).max() < \
+            1e-12 * np.abs(mean_anomaly).max()
+
+    # Past the asymptotes, or not hyperbolic
+    assert np.isnan(convert_anomaly_true_to_hyperbolic(
+        [2.2, 3.0, 1.0], [2.0, 2.0, 0.5])).all()
+    assert np.isnan(convert_anomaly_hyperbolic_to_true(1.0, 1.0))
+    with pytest.raises(AbsoluteStateException):
+        convert_anomaly_mean_to_hyperbolic([1.0, 1.0], [2.0, 0.5])
+
+
+def test_convert_anomaly_mixed_regimes():
+    # One call handles elliptic, parabolic and hyperbolic elements, each
+    # matching its own conversion
+    mean_anomaly = np.array([1.0, 7.5, 1.0, -20.0, 1.0, 5e3])
+    eccentricity = np.array([0.3, 0.99, 1.0, 1.0, 1.5, 30.0])
+    anomaly, converged = solve_kepler_equation(
+        mean_anomaly, eccentricity, tolerance=1e-12, method='danby')
+    assert converged.all()
+    assert abs(anomaly[1] - convert_anomaly_mean_to_eccentric(
+        7.5, 0.99, tolerance=1e-12)) < 1e-10
+    assert np.allclose(
+        anomaly[2:4], convert_anomaly_mean_to_parabolic(mean_anomaly[2:4]),
+        rtol=1e-15)
+    assert np.allclose(anomaly[4:], convert_anomaly_mean_to_hyperbolic(
+        mean_anomaly[4:], eccentricity[4:], tolerance=1e-12), rtol=1e-12)
+
+    true_anomaly = convert_anomaly_mean_to_true(mean_anomaly, eccentricity)
+    assert abs(true_anomaly[0] - convert_anomaly_mean_to_true(1.0, 0.3)) \
+        < 1e-7
+    assert abs(true_anomaly[2] - 2 * np.arctan(
+        convert_anomaly_mean_to_parabolic(1.0))) < 1e-7
+    assert abs(convert_anomaly_mean_to_true(1.0, 1.5) - true_anomaly[4]) \
+        < 1e-7
+    assert np.allclose(convert_anomaly_true_to_mean(
+        true_anomaly, eccentricity), mean_anomaly, rtol=1e-9, atol=1e-9)
+
+    # Invalid or unreachable elements are NaN, and raise when solving
+    assert np.isnan(convert_anomaly_true_to_mean(
+        [1.0, 4.0, 3.0], [-0.1, 1.0, 2.0])).all()
+    with pytest.raises(AbsoluteStateException):
+        convert_anomaly_mean_to_true([1.0, 1.0], [0.5, -1.0])
+    with pytest.raises(AbsoluteStateException):
+        convert_anomaly_mean_to_eccentric([1.0, 1.0], [0.5, 1.5])
+
+
+def test_convert_anomaly_scalar_consistency():
+    # 0-d arrays come back as floats from every conversion
+    for conversion in (convert_anomaly_eccentric_to_true,
+                       convert_anomaly_true_to_eccentric,
+                       convert_anomaly_eccentric_to_mean,
+                       convert_anomaly_hyperbolic_to_true,
+                       convert_anomaly_hyperbolic_to_mean):
+        assert isinstance(conversion(np.array(1.0), np.array(0.5)), float)
+
+    # Invalid eccentricities give NaN on the scalar and array paths alike
+    for conversion in (convert_anomaly_eccentric_to_true,
+                       convert_anomaly_true_to_eccentric):
+        for eccentricity in (1.0, 1.5, -0.1):
+            assert np.isnan(conversion(1.0, eccentricity))
+            assert np.isnan(conversion(np.array([1.0]), eccentricity)).all()
+            assert np.isnan(conversion(np.array(1.0), eccentricity))
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# ------------------------------------------------------------------------------
+# test_earth_orientation
+# References:
+#   [1] IERS Rapid Service/Prediction Center, "Format of finals2000A".
+#       https://maia.usno.navy.mil/ser7/readme.finals2000A
+# ------------------------------------------------------------------------------
+
+# Python imports
+import gc
+import os
+import weakref
+import numpy as np
+import pytest
+
+# Astrochelle imports
+from astrochelle.utils.constants import ARCSECONDS_TO_RADIANS
+from astrochelle.utils.epoch import Epoch, EpochArray
+from astrochelle.utils.earth_orientation import *
+import astrochelle.utils.earth_orientation as earth_orientation
+
+# Rows around the 2017-01-01 leap second, with a prediction row missing UT1
+FINALS_ROWS = (
+    (16, 12, 30, 57752, 0.043237, 0.257926, -0.4098920, 0.8361),
+    (16, 12, 31, 57753, 0.042263, 0.256880, -0.4107193, 0.8196),
+    (17, 1, 1, 57754, 0.041254, 0.255863, 0.5884911, 0.7823),
+    (17, 1, 2, 57755, 0.040291, 0.254952, 0.5877646, None),
+    (17, 1, 3, 57756, 0.039401, 0.253930, None, None),
+)
+
+
+def write_finals(path):
+    # Fixed-width lines as laid out in Ref. 1
+    with open(path, 'w') as finals_file:
+        for year, month, day, mjd, x, y, ut1, lod in FINALS_ROWS:
+            ut1 = f'{ut1:10.7f}{0.0000075:10.7f}' if ut1 is not None \
+                else ' ' * 20
+            lod = f'{lod:7.4f}{0.0054:7.4f}' if lod is not None else ' ' * 14
+            finals_file.write(
+                f'{year:2d}{month:2d}{day:2d} {mjd:8.2f} I '
+                f'{x:9.6f}{0.000032:9.6f} {y:9.6f}{0.000036:9.6f}  I'
+                f'{ut1} {lod}\n')
+
+
+def test_parse_finals(tmp_path):
+    path = str(tmp_path / 'finals2000A.all')
+    write_finals(path)
+
+    table = parse_finals(path)
+    assert table.shape == (5, 4)
+    assert table[0].tolist() == [57752, 57753, 57754, 57755]
+    assert abs(table[1][0] - 0.043237 * ARCSECONDS_TO_RADIANS) < 1e-18
+    assert abs(table[3][0] - (-0.4098920 - 36)) < 1e-12
+    assert abs(table[3][2] - (0.5884911 - 37)) < 1e-12
+    assert abs(table[4][0] - 0.0008361) < 1e-15
+    assert np.isnan(table[4][3])
+
+
+def test_earth_orientation_parameters(tmp_path, monkeypatch):
+    path = str(tmp_path / 'finals2000A.all')
+    write_finals(path)
+
+    eop = EarthOrientationParameters(path)
+    assert os.path.exists(path + EOP_CACHE_SUFFIX)
+    assert isinstance(eop.ut1_minus_tai, np.memmap)
+
+    # Rows are reproduced, either side of the leap second
+    epoch = Epoch(mean_julian_day=57753)
+    x, y, ut1_minus_utc, length_of_day = eop.interpolate(epoch)
+    assert abs(x - 0.042263 * ARCSECONDS_TO_RADIANS) < 1e-18
+    assert abs(ut1_minus_utc - (-0.4107193)) < 1e-12
+    assert abs(length_of_day - 0.0008196) < 1e-15
+    assert abs(eop.get_ut1_minus_utc(Epoch(mean_julian_day=57754)) -
+               0.5884911) < 1e-12
+
+    # UT1-UTC is interpolated across the leap second through UT1-TAI
+    ut1_minus_utc = eop.get_ut1_minus_utc(Epoch(mean_julian_day=57753.5))
+    assert abs(ut1_minus_utc - (-0.4107193 + 0.5884911 - 1) / 2) < 1e-12
+
+    # Any time system, scalars match arrays, and cached scalars match
+    epochs = EpochArray(
+        [57752, 57753, 57754], nanoseconds_of_day=[600 * 10**9, 43200 * 10**9, 7],
+        time_system='TT')
+    x, y = eop.get_polar_motion(epochs)
+    ut1_minus_utc = eop.get_ut1_minus_utc(epochs)
+    for index, epoch in enumerate(epochs):
+        assert eop.get_polar_motion(epoch) == (x[index], y[index])
+        assert eop.get_ut1_minus_utc(epoch) == ut1_minus_utc[index]
+        assert eop.interpolate(epoch, cache=True) == eop.interpolate(epoch)
+
+    # The scalar cache keeps the most recently used epochs only
+    monkeypatch.setattr(earth_orientation, 'EOP_CACHE_SIZE', 2)
+    cached = EarthOrientationParameters(path)
+    for epoch in (epochs[0], epochs[1], epochs[0], epochs[2]):
+        cached.interpolate(epoch, cache=True)
+    assert list(cached._interpolate_cache) == [
+        (epoch.mean_julian_day, epoch.nanoseconds_of_day, 'TT')
+        for epoch in (epochs[0], epochs[2])]
+
+    # ... and doesn't keep the instance alive (no reference cycle)
+    reference = weakref.ref(cached)
+    gc.disable()
+    try:
+        del cached
+        assert reference() is None
+    finally:
+        gc.enable()
+
+    # The cache is reused (not parsed or rewritten) until the text file
+    # changes
+    parsed = []
+
+    def counting_parse_finals(path):
+        parsed.append(path)
+        return parse_finals(path)
+
+    monkeypatch.setattr(
+        earth_orientation, 'parse_finals', counting_parse_finals)
+    cache_stat = os.stat(path + EOP_CACHE_SUFFIX)
+    reloaded = EarthOrientationParameters(path)
+    assert parsed == []
+    assert os.stat(path + EOP_CACHE_SUFFIX).st_ino == cache_stat.st_ino
+    assert os.stat(path + EOP_CACHE_SUFFIX).st_mtime == cache_stat.st_mtime
+    assert isinstance(reloaded.ut1_minus_tai, np.memmap)
+    assert np.array_equal(reloaded.ut1_minus_tai, eop.ut1_minus_tai)
+
+    cache_time = cache_stat.st_mtime
+    os.utime(path, (cache_time + 10, cache_time + 10))
+    with open(path, 'a') as finals_file:
+        finals_file.write('\n')
+    eop = EarthOrientationParameters(path)
+    assert parsed == [path]
+    assert os.path.getmtime(path + EOP_CACHE_SUFFIX) > cache_time
+
+    # Outside of the table
+    with pytest.raises(EarthOrientationException):
+        eop.interpolate(Epoch(mean_julian_day=57755.5))
+    with pytest.raises(EarthOrientationException):
+        eop.interpolate(57753)
+
+
+pass
@@ -9,9 +9,12 @@
 # Python imports
 import pytest
 from copy import deepcopy
+import pickle
+import numpy as np
 
 # Astrochelle imports
 from astrochelle.utils.epoch import *
+import astrochelle.utils.epoch as epoch_module
 
 
 def test_epoch_initialization():
@@ -43,12 +46,58 @@ def test_epoch_initialization():
     with pytest.raises(Exception):
         epoch = Epoch(year=2022)
 
+    # Pass on MJD with a fractional part, moved into the nanoseconds of day
+    epoch = Epoch(mean_julian_day=59787.75, day_fraction=0.5)
+    assert epoch.mean_julian_day == 59788
+    assert epoch.nanoseconds_of_day == NANOSECONDS_IN_DAY // 4
+
+    # Time system not allowed
+    with pytest.raises(EpochException):
+        epoch = Epoch('LOL', mean_julian_day=59787)
+
     # TODO more?
 
 
+def test_epoch_representation():
+    epoch = Epoch(
+        year=2022,
+        month=7,
+        day=27,
+        hours=12,
+        minutes=5,
+        seconds=5.25)
+
+    # Slotted, stored as integer day and integer nanoseconds of day
+    assert not hasattr(epoch, '__dict__')
+    assert isinstance(epoch.mean_julian_day, int)
+    assert epoch.nanoseconds_of_day == \
+        (12*3600 + 5*60 + 5) * NANOSECONDS_IN_SECOND + 250000000
+    assert epoch.time_system == 'UTC'
+
+    # Copies keep every field
+    copied = deepcopy(epoch)
+    assert copied.mean_julian_day == epoch.mean_julian_day
+    assert copied.nanoseconds_of_day == epoch.nanoseconds_of_day
+    assert copied.time_system == epoch.time_system
+
+    # Setting the day fraction rounds to the nearest nanosecond
+    copied.day_fraction = 1.25
+    assert copied.mean_julian_day == epoch.mean_julian_day + 1
+    assert copied.nanoseconds_of_day == NANOSECONDS_IN_DAY // 4
+
+    # Accumulating 60.1 second steps over 601 days has no drift
+    num_steps = 601 * SECONDS_IN_DAY // 601 * 10
+    stepped = deepcopy(epoch)
+    for _ in range(num_steps):
+        stepped += 60.1
+    assert stepped.mean_julian_day == epoch.mean_julian_day + 601
+    assert stepped.nanoseconds_of_day == epoch.nanoseconds_of_day
+
+
 def test_add():
     # Mismatched time systems
-    # TODO when i have other time systems
+    with pytest.raises(EpochException):
+        Epoch('UTC', mean_julian_day=59787) + Epoch('TAI', mean_julian_day=1)
 
     # With rollover
     epoch_1 = Epoch(
@@ -69,8 +118,8 @@ def test_add():
     epoch_3 = epoch_1 + epoch_2
     assert epoch_3.mean_julian_day == epoch_1.mean_julian_day + \
         epoch_2.mean_julian_day + 1
-    assert epoch_3.day_fraction == epoch_1.day_fraction + \
-        epoch_2.day_fraction - 1
+    assert epoch_3.nanoseconds_of_day == epoch_1.nanoseconds_of_day + \
+        epoch_2.nanoseconds_of_day - NANOSECONDS_IN_DAY
 
     # Without rollover
     epoch_4 = Epoch(
@@ -97,6 +146,18 @@ def test_add():
     assert epoch_6.mean_julian_day == epoch_1.mean_julian_day
     assert epoch_6.day_fraction == epoch_1.day_fraction + 49.1/SECONDS_IN_DAY
 
+    # Input spans many days (100 years), rolls over in one step
+    epoch_7 = epoch_1 + 36525 * SECONDS_IN_DAY + 5
+    assert epoch_7.mean_julian_day == epoch_1.mean_julian_day + 36525
+    expected = epoch_1.day_fraction + 5/SECONDS_IN_DAY
+    assert abs(epoch_7.day_fraction - expected) < 1e-8
+
+    # Negative input rolls back to the previous day
+    epoch_8 = epoch_1 + (-13*3600)
+    assert epoch_8.mean_julian_day == epoch_1.mean_julian_day - 1
+    expected = epoch_1.day_fraction + 1 - (13*3600)/SECONDS_IN_DAY
+    assert abs(epoch_8.day_fraction - expected) < 1e-8
+
 
 def test_in_place_add():
     # Should reproduce the results of above but in place
@@ -117,6 +178,7 @@ def test_in_place_add():
     )
     original_mjd = epoch_1.mean_julian_day
     original_day_frac = epoch_1.day_fraction
+    original_nanoseconds = epoch_1.nanoseconds_of_day
     original_epoch_1 = deepcopy(epoch_1)
 
     # LOL why would you even do this i just realized this is dumb
@@ -124,8 +186,8 @@ def test_in_place_add():
 
     assert epoch_1.mean_julian_day == original_mjd + \
         epoch_2.mean_julian_day + 1
-    assert epoch_1.day_fraction == original_day_frac + \
-        epoch_2.day_fraction - 1
+    assert epoch_1.nanoseconds_of_day == original_nanoseconds + \
+        epoch_2.nanoseconds_of_day - NANOSECONDS_IN_DAY
 
     # Without rollover
     epoch_3 = Epoch(
@@ -155,10 +217,20 @@ def test_in_place_add():
     assert epoch_1.mean_julian_day == original_mjd
     assert epoch_1.day_fraction == original_day_frac + 49.1/SECONDS_IN_DAY
 
+    # Stepping modifies the same object, one day of 10 second steps
+    epoch_1 = deepcopy(original_epoch_1)
+    original_id = id(epoch_1)
+    for _ in range(8640):
+        epoch_1 += 10
+    assert id(epoch_1) == original_id
+    assert epoch_1.mean_julian_day == original_mjd + 1
+    assert abs(epoch_1.day_fraction - original_day_frac) < 1e-8
+
 
 def test_subtract():
     # Mismatched time systems
-    # TODO when i have other time systems
+    with pytest.raises(EpochException):
+        Epoch('UTC', mean_julian_day=59787) - Epoch('TAI', mean_julian_day=1)
 
     # With rollover
     epoch_1 = Epoch(
@@ -207,11 +279,19 @@ def test_subtract():
     assert epoch_6.mean_julian_day == epoch_1.mean_julian_day
     assert epoch_6.day_fraction == epoch_1.day_fraction - 49.1/SECONDS_IN_DAY
 
+    # Input spans many days (100 years), rolls back in one step
+    epoch_7 = epoch_1 - (36525 * SECONDS_IN_DAY + 5)
+    assert epoch_7.mean_julian_day == epoch_1.mean_julian_day - 36525
+    expected = epoch_1.day_fraction - 5/SECONDS_IN_DAY
+    assert abs(epoch_7.day_fraction - expected) < 1e-8
+
 
 def test_in_place_subtract():
     # Should reproduce the results of above
     # Mismatched time systems
-    # TODO when i have other time systems
+    epoch = Epoch('UTC', mean_julian_day=59787)
+    with pytest.raises(EpochException):
+        epoch -= Epoch('TAI', mean_julian_day=1)
 
     # With rollover
     epoch_1 = Epoch(
@@ -267,6 +347,15 @@ def test_in_place_subtract():
     assert epoch_1.mean_julian_day == original_mjd
     assert epoch_1.day_fraction == original_day_frac - 49.1/SECONDS_IN_DAY
 
+    # Stepping modifies the same object, one day of 10 second steps
+    epoch_1 = deepcopy(original_epoch_1)
+    original_id = id(epoch_1)
+    for _ in range(8640):
+        epoch_1 -= 10
+    assert id(epoch_1) == original_id
+    assert epoch_1.mean_julian_day == original_mjd - 1
+    assert abs(epoch_1.day_fraction - original_day_frac) < 1e-8
+
 
 def test_check_validity_date():
     # Defaults
@@ -344,6 +433,67 @@ def test_check_validity_date():
     assert flag_valid == False
 
 
+def test_check_validity_date_array():
+    # One row per case of test_check_validity_date, plus a valid row
+    years = np.array([2022, -4800, 2022, 2021, 2020, 2022, 2022, 2022])
+    months = np.array([7, 7, 13, 2, 2, 7, 7, 7])
+    days = np.array([27, 27, 27, 29, 29, 27, 27, 27])
+    hours = np.array([12, 12, 12, 12, 12, -10, 12, 23])
+    minutes = np.array([5, 5, 5, 5, 5, 5, -5, 60])
+    seconds = 5
+
+    valid, reasons = check_validity_date_array(
+        year=years, month=months, day=days, hours=hours,
+        minutes=minutes, seconds=seconds)
+
+    assert list(valid) == [True, False, False, False, True, False, False, False]
+    assert list(reasons) == [
+        DATE_VALID, DATE_INVALID_YEAR, DATE_INVALID_MONTH, DATE_INVALID_DAY,
+        DATE_VALID, DATE_INVALID_NEGATIVE_TIME, DATE_INVALID_NEGATIVE_TIME,
+        DATE_INVALID_DAY_FRACTION]
+
+    # Matches the scalar check row by row
+    for index in range(len(years)):
+        flag_valid, _ = check_validity_date(
+            year=years[index], month=months[index], day=days[index],
+            hours=hours[index], minutes=minutes[index], seconds=seconds)
+        assert flag_valid == valid[index]
+
+    # First failed check wins (bad year and bad month)
+    _, reasons = check_validity_date_array(
+        year=[-4800], month=[13], day=[1], hours=[0], minutes=[0],
+        seconds=[0])
+    assert reasons[0] == DATE_INVALID_YEAR
+
+    # Float columns (np.loadtxt's default) give the same answers, and
+    # match the scalar check on whole values
+    valid_float, reasons_float = check_validity_date_array(
+        year=years.astype(float), month=months.astype(float),
+        day=days.astype(float), hours=hours.astype(float),
+        minutes=minutes.astype(float), seconds=float(seconds))
+    assert list(valid_float) == list(valid)
+    assert list(reasons_float) == list(check_validity_date_array(
+        year=years, month=months, day=days, hours=hours, minutes=minutes,
+        seconds=seconds)[1])
+    assert check_validity_date(
+        year=2022.0, month=7.0, day=27.0, hours=12.0, minutes=5.0,
+        seconds=5.0)[0]
+
+    # Non-integer or missing values are invalid rather than raising
+    _, reasons = check_validity_date_array(
+        year=[2022.5, np.nan, 2022, 2022, 2022, 2022, 2022],
+        month=[7, 7, 7.5, np.nan, 7, np.inf, 7],
+        day=[27, 27, 27, 27, 27.5, 27, 27],
+        hours=[12, 12, 12, 12, 12, 12, np.nan], minutes=0, seconds=0)
+    assert list(reasons) == [
+        DATE_INVALID_YEAR, DATE_INVALID_YEAR, DATE_INVALID_MONTH,
+        DATE_INVALID_MONTH, DATE_INVALID_DAY, DATE_INVALID_MONTH,
+        DATE_INVALID_DAY_FRACTION]
+
+    # Every reason code has a description
+    assert set(DATE_VALIDITY_REASONS) == set(range(6))
+
+
 def test_check_leap_year():
     # Is leap year
     assert check_leap_year(year=2020)
@@ -354,6 +504,10 @@ def test_check_leap_year():
     # Is divisible by 4 but also by 100 and not by 400, not leap year
     assert not check_leap_year(year=1900)
 
+    # Arrays return a mask
+    assert list(check_leap_year(year=np.array([2020, 2021, 1900, 2000]))) == \
+        [True, False, False, True]
+
 
 def test_to_jd():
     # Comparing this algo to JPL's algorithm at Ref. 1.
@@ -380,8 +534,811 @@ def test_to_jd():
 
 
 def test_to_mjd():
-    # TODO
-    pass
+    # J2000 is MJD 51544.5
+    mean_julian_day, day_fraction = to_mjd(
+        year=2000, month=1, day=1, hours=12, minutes=0, seconds=0)
+    assert mean_julian_day == 51544
+    assert day_fraction == 0.5
+
+    # Integer division as in iauCal2jd, so years like 2050 are not a day off
+    mean_julian_day, _ = to_mjd(
+        year=2050, month=1, day=1, hours=0, minutes=0, seconds=0)
+    assert mean_julian_day == 69807
+
+    # Arrays match the scalar results exactly
+    rng = np.random.default_rng(0)
+    num_dates = 1000
+    years = rng.integers(-4700, 2500, num_dates)
+    months = rng.integers(1, 13, num_dates)
+    days = rng.integers(1, 29, num_dates)
+    hours = rng.integers(0, 24, num_dates)
+    minutes = rng.integers(0, 60, num_dates)
+    seconds = rng.uniform(0, 60, num_dates)
+
+    mean_julian_days, day_fractions = to_mjd(
+        year=years, month=months, day=days, hours=hours,
+        minutes=minutes, seconds=seconds)
+    assert mean_julian_days.dtype == np.int64
+
+    julian_dates = to_jd(
+        year=years, month=months, day=days, hours=hours,
+        minutes=minutes, seconds=seconds)
+
+    for index in range(num_dates):
+        inputs = dict(
+            year=int(years[index]), month=int(months[index]),
+            day=int(days[index]), hours=int(hours[index]),
+            minutes=int(minutes[index]), seconds=float(seconds[index]))
+        mean_julian_day, day_fraction = to_mjd(**inputs)
+        assert mean_julian_days[index] == mean_julian_day
+        assert day_fractions[index] == day_fraction
+        assert julian_dates[index] == to_jd(**inputs)
+
+    # Scalars broadcast against arrays
+    mean_julian_days, _ = to_mjd(
+        year=2022, month=7, day=[27, 28], hours=0, minutes=0, seconds=0)
+    assert list(mean_julian_days) == [59787, 59788]
+
+
+def test_epoch_array_initialization():
+    # Pass on integer days and fractions
+    epochs = EpochArray(
+        mean_julian_day=np.array([59787, 59788]),
+        day_fraction=np.array([0.25, 0.5]))
+    assert len(epochs) == 2
+    assert epochs.mean_julian_day.dtype == np.int64
+
+    # Fractional MJDs are moved into the day fraction
+    epochs = EpochArray(mean_julian_day=np.array([59787.75]))
+    assert epochs.mean_julian_day[0] == 59787
+    assert abs(epochs.day_fraction[0] - 0.75) < 1e-12
+
+    # Shape mismatch
+    with pytest.raises(EpochException):
+        EpochArray(
+            mean_julian_day=np.array([59787, 59788]),
+            day_fraction=np.array([0.25]))
+
+    # Time system not allowed
+    with pytest.raises(EpochException):
+        EpochArray(np.array([59787]), time_system='LOL')
+
+
+def test_epoch_array_conversions():
+    epoch_list = [
+        Epoch(year=2022, month=7, day=27, hours=12, minutes=5, seconds=5),
+        Epoch(year=2022, month=7, day=28, hours=1, minutes=5)
+    ]
+    epochs = EpochArray.from_epochs(epoch_list)
+
+    # Element access returns an Epoch matching the original
+    assert isinstance(epochs[1], Epoch)
+    assert epochs[1].mean_julian_day == epoch_list[1].mean_julian_day
+    assert epochs[1].day_fraction == epoch_list[1].day_fraction
+
+    # Round trip through a list of Epochs
+    for original, converted in zip(epoch_list, epochs.to_epochs()):
+        assert converted.mean_julian_day == original.mean_julian_day
+        assert converted.day_fraction == original.day_fraction
+
+    # Slices are views into the same memory
+    view = epochs[:1]
+    assert isinstance(view, EpochArray)
+    assert np.shares_memory(
+        view.nanoseconds_of_day, epochs.nanoseconds_of_day)
+    assert np.shares_memory(view.mean_julian_day, epochs.mean_julian_day)
+
+    # Empty list
+    assert len(EpochArray.from_epochs([])) == 0
+
+
+def test_epoch_array_add_subtract():
+    epoch_1 = Epoch(
+        year=2022, month=7, day=27, hours=12, minutes=5, seconds=5)
+    epoch_2 = Epoch(
+        year=2022, month=7, day=27, hours=1, minutes=5)
+    epochs = EpochArray.from_epochs([epoch_1, epoch_2])
+
+    # Seconds, with and without rollover, should match Epoch arithmetic
+    offsets = np.array([12*3600 + 5, 49.1])
+    added = epochs + offsets
+    for index, offset in enumerate(offsets):
+        expected = [epoch_1, epoch_2][index] + float(offset)
+        assert added[index].mean_julian_day == expected.mean_julian_day
+        assert abs(added[index].day_fraction - expected.day_fraction) < 1e-12
+
+    subtracted = epochs - 13*3600
+    for index, epoch in enumerate([epoch_1, epoch_2]):
+        expected = epoch - 13*3600
+        assert subtracted[index].mean_julian_day == expected.mean_julian_day
+        assert abs(
+            subtracted[index].day_fraction - expected.day_fraction) < 1e-12
+
+    # Epoch broadcast over the array
+    added = epochs + epoch_2
+    expected = epoch_1 + epoch_2
+    assert added[0].mean_julian_day == expected.mean_julian_day
+    assert abs(added[0].day_fraction - expected.day_fraction) < 1e-12
+
+    # EpochArray elementwise
+    subtracted = epochs - epochs
+    assert np.all(subtracted.mean_julian_day == 0)
+    assert np.all(subtracted.day_fraction == 0)
+
+
+def test_to_calendar():
+    # J2000 from MJD 51544.5
+    assert to_calendar(51544, NANOSECONDS_IN_DAY // 2) == \
+        (2000, 1, 1, 12, 0, 0.0)
+
+    # Start of the allowed range, 4713 BC (Ref. 2, page 67)
+    assert to_calendar(-2400001)[:3] == (-4713, 11, 24)
+
+    # Inverse of to_mjd, scalar and arrays
+    rng = np.random.default_rng(1)
+    num_dates = 1000
+    years = rng.integers(-4700, 2500, num_dates)
+    months = rng.integers(1, 13, num_dates)
+    days = rng.integers(1, 29, num_dates)
+    mean_julian_days, _ = to_mjd(
+        year=years, month=months, day=days, hours=0, minutes=0, seconds=0)
+    nanoseconds = rng.integers(0, NANOSECONDS_IN_DAY, num_dates)
+
+    calendar = to_calendar(mean_julian_days, nanoseconds)
+    assert np.all(calendar[0] == years)
+    assert np.all(calendar[1] == months)
+    assert np.all(calendar[2] == days)
+    assert np.all(np.abs(
+        ((calendar[3] * 60 + calendar[4]) * 60 + calendar[5]) *
+        NANOSECONDS_IN_SECOND - nanoseconds) < 1)
+
+    for index in range(0, num_dates, 50):
+        assert to_calendar(
+            int(mean_julian_days[index]), int(nanoseconds[index])) == \
+            tuple(value[index] for value in calendar)
+
+
+def test_epoch_to_calendar():
+    epoch = Epoch(
+        year=2022, month=7, day=27, hours=12, minutes=5, seconds=5.25)
+    assert epoch.to_calendar() == (2022, 7, 27, 12, 5, 5.25)
+    assert str(epoch) == "2022-07-27T12:05:05.250000000 UTC"
+
+    # Array version matches element by element
+    epochs = EpochArray.from_epochs([epoch, epoch + SECONDS_IN_DAY])
+    years, months, days, hours, minutes, seconds = epochs.to_calendar()
+    assert list(days) == [27, 28]
+    assert list(seconds) == [5.25, 5.25]
+
+
+def test_parse_timestamps():
+    expected = Epoch(
+        year=2022, month=7, day=27, hours=12, minutes=5, seconds=5.25)
+
+    # Calendar and day-of-year forms, with and without Z (fixed width)
+    for timestamps in (["2022-07-27T12:05:05.250Z", "2022-07-28T12:05:05.250Z"],
+                       ["2022-208T12:05:05.250", "2022-209T12:05:05.250"],
+                       np.array([b"2022-208T12:05:05.25", b"2022-209T12:05:05.25"])):
+        epochs = parse_timestamps(timestamps)
+        assert len(epochs) == 2
+        assert epochs[0].mean_julian_day == expected.mean_julian_day
+        assert epochs[1].mean_julian_day == expected.mean_julian_day + 1
+        assert np.all(epochs.nanoseconds_of_day == expected.nanoseconds_of_day)
+
+    # Mixed layouts and widths (general path)
+    epochs = parse_timestamps(
+        ("2022-07-27 12:05:05.123456789123", "2022-07-27", "2020-366"))
+    assert epochs[0].nanoseconds_of_day == \
+        (12*3600 + 5*60 + 5) * NANOSECONDS_IN_SECOND + 123456789
+    assert epochs[1].mean_julian_day == expected.mean_julian_day
+    assert epochs[1].nanoseconds_of_day == 0
+    assert epochs[2].to_calendar()[:3] == (2020, 12, 31)
+
+    # Many layouts, each length and layout decoded as a group, matches
+    # parsing one at a time (whitespace padding takes the per-row path)
+    timestamps = ["2022-07-27T12:05:05.250Z", "2022-208T12:05:05.25",
+                  "2022-07-28 00:00:01", "2022-209T00:00:01.5Z",
+                  " 2022-07-27T12:05:05.250Z ", "2022-07-27T12:05:05.250",
+                  "2022-210T00:00:01.000", "2022-07-27"] * 3
+    epochs = parse_timestamps(timestamps)
+    for index, timestamp in enumerate(timestamps):
+        single = parse_timestamps([timestamp.strip()])
+        assert epochs[index] == single[0]
+    assert epochs[0] == epochs[4] == expected
+
+    # Time system is passed through
+    assert parse_timestamps(["2022-07-27"], time_system='UTC').time_system == \
+        'UTC'
+
+    # Empty input
+    assert len(parse_timestamps([])) == 0
+
+    # A single string (or bytes) is one timestamp, not its characters
+    for timestamp in ("2022-07-27T12:05:05.25", b"2022-208T12:05:05.25",
+                      np.str_("2022-07-27T12:05:05.25")):
+        epochs = parse_timestamps(timestamp)
+        assert len(epochs) == 1
+        assert epochs[0] == expected
+
+    # Error messages quote the plain string
+    with pytest.raises(EpochException, match=r"timestamp 'July 27th'\."):
+        parse_timestamps(["2022-07-27", "July 27th"])
+    with pytest.raises(EpochException, match=r"first is '2021-02-29' "):
+        parse_timestamps(np.array([b"2021-02-28", b"2021-02-29"]))
+
+    # Invalid dates, unparseable strings, and non-strings
+    with pytest.raises(EpochException):
+        parse_timestamps(["2021-02-29T00:00:00", "2021-02-28T00:00:00"])
+    with pytest.raises(EpochException):
+        parse_timestamps(["2021-366T00:00:00"])
+    with pytest.raises(EpochException):
+        parse_timestamps(["2022-07-27", "July 27th"])
+    with pytest.raises(EpochException):
+        parse_timestamps([59787.5])
+
+    # Only ASCII digits, on every path (fullwidth and Arabic-Indic digits
+    # would otherwise decode to wrong values)
+    for timestamps in (["\uff12\uff10\uff12\uff12-07-27T12:05:05"],
+                       ["2022-07-27T12:05:05", "\uff12022-07-27T12:05:05"],
+                       ["2022-07-27", "2022-07-2\u0667T12:05:05"],
+                       np.array(["2022-07-27".encode(),
+                                 "2022-07-2\u0667".encode()])):
+        with pytest.raises(EpochException):
+            parse_timestamps(timestamps)
+
+
+def test_get_tai_minus_utc():
+    # Either side of the 2017-01-01 leap second
+    assert get_tai_minus_utc(57753) == 36
+    assert get_tai_minus_utc(57754) == 37
+
+    # First entry of the table, and earlier dates clamp to it
+    assert get_tai_minus_utc(41317) == 10
+    assert get_tai_minus_utc(30000) == 10
+
+    # Arrays match the scalar lookup
+    mean_julian_days = np.arange(30000, 70000, 7)
+    offsets = get_tai_minus_utc(mean_julian_days)
+    for mean_julian_day, offset in zip(mean_julian_days, offsets):
+        assert offset == get_tai_minus_utc(int(mean_julian_day))
+
+
+def test_get_tdb_minus_tt():
+    # Periodic, never more than about 2 milliseconds
+    mean_julian_days = np.arange(40000, 70000, 0.5)
+    tdb_minus_tt = get_tdb_minus_tt(mean_julian_days)
+    assert np.max(np.abs(tdb_minus_tt)) < 2e-3
+    assert np.max(tdb_minus_tt) > 1.5e-3
+
+    # Scalar matches array
+    assert get_tdb_minus_tt(51544, NANOSECONDS_IN_DAY // 2) == \
+        get_tdb_minus_tt(np.array([51544.5]))[0]
+
+
+def test_convert_time_system():
+    epoch = Epoch(year=2017, month=1, day=1, hours=0, minutes=0, seconds=0)
+
+    # Fixed offsets in 2017
+    expected = {
+        'UTC': 0,
+        'TAI': 37 * NANOSECONDS_IN_SECOND,
+        'TT': 69184000000,
+        'GPS': 18 * NANOSECONDS_IN_SECOND,
+    }
+    for time_system, nanoseconds in expected.items():
+        converted = epoch.to_time_system(time_system)
+        assert converted.time_system == time_system
+        assert converted.mean_julian_day == epoch.mean_julian_day
+        assert converted.nanoseconds_of_day == nanoseconds
+
+    # TDB is within 2 ms of TT
+    tdb = epoch.to_time_system('TDB')
+    tt = epoch.to_time_system('TT')
+    assert tdb.mean_julian_day == tt.mean_julian_day
+    assert abs(tdb.nanoseconds_of_day - tt.nanoseconds_of_day) < 2e6
+
+    # Round trips from every system to every other, across a leap second
+    epochs = EpochArray.from_epochs([
+        epoch - 0.5, epoch, epoch + 3600, epoch - 180 * SECONDS_IN_DAY])
+    for time_system_from in ALLOWED_TIME_SYSTEMS:
+        start = epochs.to_time_system(time_system_from)
+        for time_system_to in ALLOWED_TIME_SYSTEMS:
+            converted = start.to_time_system(time_system_to)
+            back = converted.to_time_system(time_system_from)
+            assert np.all(back.mean_julian_day == start.mean_julian_day)
+            assert np.all(np.abs(
+                back.nanoseconds_of_day - start.nanoseconds_of_day) <= 1)
+
+            # Scalar conversion matches the array conversion
+            scalar = start[1].to_time_system(time_system_to)
+            assert scalar.mean_julian_day == converted.mean_julian_day[1]
+            assert scalar.nanoseconds_of_day == \
+                converted.nanoseconds_of_day[1]
+
+    # Just before the leap second, UTC is 36 s behind TAI
+    tai = (epoch - 0.5).to_time_system('TAI')
+    assert tai.mean_julian_day == epoch.mean_julian_day
+    assert tai.nanoseconds_of_day == 35500000000
+
+    # Arithmetic keeps the time system
+    assert (tai + 10).time_system == 'TAI'
+    assert (epochs.to_time_system('GPS') + 10).time_system == 'GPS'
+
+    # Time system not allowed
+    with pytest.raises(EpochException):
+        epoch.to_time_system('LOL')
+
+
+def test_get_tdb_minus_tt_modes():
+    # Half-day grid over 1900-2100
+    days = np.arange(-36525, 36525, 0.5)
+    mean_julian_days = 51544 + np.floor(days).astype(np.int64)
+    nanoseconds = ((days % 1) * NANOSECONDS_IN_DAY).astype(np.int64)
+
+    # Fast series is within its 10 microsecond error of the precise series
+    precise = get_tdb_minus_tt(mean_julian_days, nanoseconds)
+    fast = get_tdb_minus_tt(mean_julian_days, nanoseconds, mode='fast')
+    assert np.max(np.abs(precise - fast)) < 1e-5
+
+    # Cached interpolation adds only a few nanoseconds, for scalars too
+    cached = get_tdb_minus_tt(mean_julian_days + 0.1, nanoseconds, cache=True)
+    uncached = get_tdb_minus_tt(mean_julian_days + 0.1, nanoseconds)
+    assert np.max(np.abs(cached - uncached)) < 5e-9
+    assert abs(get_tdb_minus_tt(59787, 123456789, cache=True) -
+               get_tdb_minus_tt(59787, 123456789)) < 5e-9
+
+    # Spread out epochs use only the nodes they need
+    spread = np.array([0, 100000, 200000])
+    assert np.max(np.abs(
+        get_tdb_minus_tt(spread, 0, cache=True) -
+        get_tdb_minus_tt(spread, 0))) < 5e-9
+
+    # Mode not allowed
+    with pytest.raises(EpochException):
+        get_tdb_minus_tt(59787, mode='LOL')
+
+
+def test_get_tdb_minus_tt_array_cache(monkeypatch):
+    # Count the series evaluations of array calls
+    evaluate = epoch_module._evaluate_tdb_minus_tt
+    evaluated = []
+
+    def counting_evaluate(days, mode):
+        evaluated.append(np.size(days))
+        return evaluate(days, mode)
+
+    monkeypatch.setattr(
+        epoch_module, '_evaluate_tdb_minus_tt', counting_evaluate)
+
+    # Dense epochs share nodes, so fewer evaluations than epochs
+    dense = 59787 + np.arange(10000) // 1000
+    nanoseconds = np.arange(10000) * 8640000
+    get_tdb_minus_tt(dense, nanoseconds, cache=True)
+    assert evaluated[-1] < 10000
+
+    # Sparse epochs, spread out or a few per node, never evaluate more
+    # than there are epochs, and stay exact when evaluated directly
+    for sparse in (np.array([59787, 59788, 59790]),
+                   np.arange(40000, 70000, 300),
+                   np.array([40000, 40000, 70000])):
+        tdb_minus_tt = get_tdb_minus_tt(sparse, 0, cache=True)
+        assert evaluated[-1] <= sparse.size
+        assert np.max(np.abs(
+            tdb_minus_tt - get_tdb_minus_tt(sparse, 0))) < 5e-9
+
+
+def test_epoch_comparison():
+    epoch_1 = Epoch(
+        year=2022, month=7, day=27, hours=12, minutes=5, seconds=5)
+    epoch_2 = epoch_1 + 1e-9
+    epoch_3 = Epoch(mean_julian_day=epoch_1.mean_julian_day,
+                    day_fraction=epoch_1.day_fraction)
+
+    # Exact, down to the nanosecond
+    assert epoch_1 == epoch_3
+    assert epoch_1 != epoch_2
+    assert epoch_1 < epoch_2 and epoch_1 <= epoch_2 and epoch_1 <= epoch_3
+    assert epoch_2 > epoch_1 and epoch_2 >= epoch_1 and epoch_3 >= epoch_1
+    assert epoch_1 - SECONDS_IN_DAY < epoch_1
+
+    # Sorting and dict keys
+    assert sorted([epoch_2, epoch_1 + 60, epoch_1]) == \
+        [epoch_1, epoch_2, epoch_1 + 60]
+    events = {epoch_1: 'start', epoch_2: 'stop'}
+    assert events[epoch_3] == 'start'
+    assert len({epoch_1, epoch_3}) == 1
+
+    # Different time systems are not equal and can't be ordered
+    tai = Epoch('TAI', mean_julian_day=epoch_1.mean_julian_day,
+                day_fraction=epoch_1.day_fraction)
+    assert epoch_1 != tai
+    with pytest.raises(EpochException):
+        epoch_1 < tai
+
+    # Not an Epoch
+    assert epoch_1 != epoch_1.mean_julian_day
+    with pytest.raises(TypeError):
+        epoch_1 < 5
+
+
+def test_epoch_index():
+    start = Epoch(year=2022, month=7, day=27, hours=0, minutes=0)
+    grid = EpochArray.from_epochs([start + 60 * step for step in range(100)])
+
+    # Unsorted input is sorted, order maps back to the input
+    shuffled = grid[np.random.default_rng(2).permutation(100)]
+    index = EpochIndex(shuffled)
+    assert len(index) == 100
+    assert np.all(index.epochs.nanoseconds_of_day ==
+                  grid.nanoseconds_of_day)
+    assert np.all(shuffled[index.order].nanoseconds_of_day ==
+                  grid.nanoseconds_of_day)
+
+    # Scalar lookups
+    assert index.bracket(start + 90) == 1
+    assert index.bracket(start) == 0
+    assert index.bracket(start + 99 * 60) == 98
+    assert index.nearest(start + 89) == 1
+    assert index.nearest(start + 91) == 2
+    assert index.nearest(start - SECONDS_IN_DAY) == 0
+    assert index.nearest(start + 1000 * SECONDS_IN_DAY) == 99
+    assert index.searchsorted(start + 60) == 1
+    assert index.searchsorted(start + 60, side='right') == 2
+
+    # Array lookups match the scalar ones
+    queries = grid + 31.0
+    assert list(index.bracket(queries[:-1])) == list(range(99))
+    assert list(index.nearest(queries)) == \
+        [index.nearest(query) for query in queries]
+
+    # Also from a list of Epochs
+    assert EpochIndex(grid.to_epochs()).nearest(start + 30) == 0
+
+    # Out of range, mismatched time system, empty, too long
+    with pytest.raises(EpochException):
+        index.bracket(start - 1)
+    with pytest.raises(EpochException):
+        index.nearest(start.to_time_system('TAI'))
+    with pytest.raises(EpochException):
+        EpochIndex([])
+    with pytest.raises(EpochException):
+        EpochIndex([start, start + (MAX_INDEX_SPAN_DAYS + 1) * SECONDS_IN_DAY])
+
+
+def test_epoch_range():
+    start = Epoch(year=2022, month=7, day=27, hours=23, minutes=59, seconds=50)
+    stop = start + 35
+
+    # Stop is excluded, rolls over into the next day
+    epochs = list(epoch_range(start, stop, 10))
+    assert epochs == [start, start + 10, start + 20, start + 30]
+    assert epochs[1].to_calendar()[2:] == (28, 0, 0, 0.0)
+
+    # Backwards
+    assert list(epoch_range(stop, start, -10)) == \
+        [stop, stop - 10, stop - 20, stop - 30]
+
+    # Empty when stop is behind start
+    assert list(epoch_range(stop, start, 10)) == []
+
+    # A 30 day grid of 10 second steps, is lazy and ends exactly
+    grid = epoch_range(start, start + 30 * SECONDS_IN_DAY, 10)
+    assert next(grid) == start
+    num_epochs = 1 + sum(1 for _ in grid)
+    assert num_epochs == 30 * SECONDS_IN_DAY // 10
+
+    # Mismatched time systems and zero step
+    with pytest.raises(EpochException):
+        next(epoch_range(start, stop.to_time_system('TAI'), 10))
+    with pytest.raises(EpochException):
+        next(epoch_range(start, stop, 0))
+
+
+def test_epoch_range_chunked():
+    start = Epoch(year=2022, month=7, day=27, hours=23, minutes=59, seconds=50)
+    stop = start + 2 * SECONDS_IN_DAY
+
+    # Blocks concatenate to the same grid as epoch_range
+    blocks = list(epoch_range_chunked(start, stop, 10.5, chunk_size=1000))
+    assert all(isinstance(block, EpochArray) for block in blocks)
+    assert [len(block) for block in blocks[:-1]] == [1000] * (len(blocks) - 1)
+    epochs = [epoch for block in blocks for epoch in block]
+    assert epochs == list(epoch_range(start, stop, 10.5))
+
+    # Backwards
+    blocks = list(epoch_range_chunked(stop, start, -60, chunk_size=7))
+    assert [epoch for block in blocks for epoch in block] == \
+        list(epoch_range(stop, start, -60))
+
+    # Chunk size not allowed
+    with pytest.raises(EpochException):
+        next(epoch_range_chunked(start, stop, 10, chunk_size=0))
+
+
+def test_datetime64_conversions():
+    values = np.array(['2022-07-27T12:05:05.25', '1969-12-31T23:59:59.999999999',
+                       '1972-01-01'], dtype='datetime64[ns]')
+
+    # Array round trip, including epochs before 1970
+    epochs = EpochArray.from_datetime64(values)
+    assert epochs.time_system == 'UTC'
+    assert epochs.mean_julian_day.tolist() == [59787, 40586, 41317]
+    assert epochs.nanoseconds_of_day.tolist() == [
+        43505250000000, 86399999999999, 0]
+    assert np.array_equal(epochs.to_datetime64(), values)
+
+    # Time of day is a view of the integer representation
+    assert np.shares_memory(epochs.time_of_day, epochs.nanoseconds_of_day)
+    assert epochs.time_of_day[0] == np.timedelta64(43505250000000, 'ns')
+
+    # Other units and lists are converted
+    epochs = EpochArray.from_datetime64(['2022-07-27'], time_system='TT')
+    assert epochs.time_system == 'TT'
+    assert epochs.mean_julian_day.tolist() == [59787]
+
+    # Scalar round trip
+    epoch = Epoch.from_datetime64(values[0])
+    assert epoch == EpochArray.from_datetime64(values)[0]
+    assert epoch.to_datetime64() == values[0]
+
+    # NaT and out of range epochs raise
+    with pytest.raises(EpochException):
+        EpochArray.from_datetime64(np.array(['NaT'], dtype='datetime64[ns]'))
+    with pytest.raises(EpochException):
+        Epoch.from_datetime64(np.datetime64('NaT'))
+    with pytest.raises(EpochException):
+        Epoch(year=2300, month=1, day=1).to_datetime64()
+    with pytest.raises(EpochException):
+        EpochArray([-100000]).to_datetime64()
+
+
+def test_serialization():
+    # Single epochs: 18 bytes, round trips exactly in every time system
+    for time_system in ALLOWED_TIME_SYSTEMS:
+        epoch = Epoch(time_system, year=2022, month=7, day=27, hours=12,
+                      minutes=5, seconds=5.25)
+        data = epoch.to_bytes()
+        assert len(data) == 18
+        decoded = Epoch.from_bytes(data)
+        assert decoded == epoch
+        assert decoded.time_system == time_system
+        assert pickle.loads(pickle.dumps(epoch)) == epoch
+
+    # Arrays: header then contiguous blocks, read back without a copy
+    epochs = EpochArray([59787, 40000, 60000],
+                        nanoseconds_of_day=[0, 1, NANOSECONDS_IN_DAY - 1],
+                        time_system='GPS')
+    data = epochs.to_bytes()
+    assert len(data) == 16 + 16 * 3
+    decoded = EpochArray.from_bytes(data)
+    assert decoded.time_system == 'GPS'
+    assert decoded.mean_julian_day.tolist() == [59787, 40000, 60000]
+    assert decoded.nanoseconds_of_day.tolist() == [
+        0, 1, NANOSECONDS_IN_DAY - 1]
+    assert np.shares_memory(decoded.nanoseconds_of_day,
+                            np.frombuffer(data, dtype=np.uint8))
+    decoded = pickle.loads(pickle.dumps(epochs[1:]))
+    assert decoded.mean_julian_day.tolist() == [40000, 60000]
+    assert len(EpochArray.from_bytes(EpochArray([]).to_bytes())) == 0
+
+    # Bad input
+    with pytest.raises(EpochException):
+        Epoch.from_bytes(data[:17])
+    with pytest.raises(EpochException):
+        Epoch.from_bytes(b'\x02' + epoch.to_bytes()[1:])
+    with pytest.raises(EpochException):
+        Epoch.from_bytes(epoch.to_bytes()[:1] + b'\x09' +
+                         epoch.to_bytes()[2:])
+    with pytest.raises(EpochException):
+        EpochArray.from_bytes(data[:-1])
+    with pytest.raises(EpochException):
+        EpochArray.from_bytes(b'XXXX' + data[4:])
+
+
+def test_elapsed_time():
+    start = Epoch(year=2000, month=1, day=1, hours=11, minutes=58,
+                  seconds=55.816)
+    end = Epoch(year=2022, month=7, day=27, hours=12, minutes=5, seconds=5.25)
+
+    # Exact on the split representation
+    assert end.nanoseconds_since(start) == 712195569434000000
+    assert end.seconds_since(start) == 712195569.434
+    assert start.seconds_since(end) == -712195569.434
+    assert end.seconds_since(end) == 0.0
+
+    # A nanosecond step is resolved decades away from the start
+    assert (end + 1e-9).nanoseconds_since(end) == 1
+    assert (end + 60.1).seconds_since(end) == 60.1
+
+    # Elementwise over arrays, broadcasting a single epoch
+    epochs = EpochArray([51544, 59787],
+                        nanoseconds_of_day=[0, NANOSECONDS_IN_DAY - 1])
+    assert epochs.nanoseconds_since(start).tolist() == [
+        -43135816000000, 712152064184000000 + NANOSECONDS_IN_DAY - 1]
+    assert np.array_equal(start.seconds_since(epochs),
+                          -epochs.seconds_since(start))
+    assert epochs.nanoseconds_since(epochs[::-1]).tolist() == [
+        -712281599999999999, 712281599999999999]
+    for index, epoch in enumerate(epochs):
+        assert epochs.seconds_since(start)[index] == \
+            epoch.seconds_since(start)
+
+    # Mismatched time systems and other types raise
+    with pytest.raises(EpochException):
+        end.seconds_since(start.to_time_system('TT'))
+    with pytest.raises(EpochException):
+        epochs.seconds_since(EpochArray([51544, 59787], time_system='TAI'))
+    with pytest.raises(EpochException):
+        end.seconds_since(59787.5)
+    with pytest.raises(EpochException):
+        EpochArray([0]).nanoseconds_since(EpochArray([200000]))
+
+
+def test_epoch_unchecked_construction():
+    epoch = Epoch(year=2022, month=7, day=27, hours=12, minutes=5,
+                  seconds=5.25)
+
+    # Trusted constructors match the validated ones
+    assert Epoch.from_calendar_unchecked(2022, 7, 27, 12, 5, 5.25) == epoch
+    assert Epoch.from_mjd_unchecked(
+        epoch.mean_julian_day, epoch.nanoseconds_of_day) == epoch
+    tt_epoch = Epoch.from_calendar_unchecked(2022, 7, 27, time_system='TT')
+    assert tt_epoch.time_system == 'TT'
+    assert tt_epoch == Epoch('TT', year=2022, month=7, day=27, hours=0,
+                             minutes=0)
+    for year in (1858, 1900, 2000, 2024, 2100):
+        for month in range(1, 13):
+            assert Epoch.from_calendar_unchecked(
+                year, month, 1).mean_julian_day == to_mjd(
+                year=year, month=month, day=1, hours=0, minutes=0,
+                seconds=0)[0]
+
+    # Unknown time systems still raise EpochException
+    with pytest.raises(EpochException):
+        Epoch.from_mjd_unchecked(59787, 0, time_system='LOL')
+    with pytest.raises(EpochException):
+        Epoch.from_calendar_unchecked(2022, 7, 27, time_system='LOL')
+
+    # Invalid dates raise unless validation is switched off
+    with pytest.raises(EpochException):
+        Epoch(year=2022, month=13, day=1, hours=0, minutes=0)
+    previous = set_epoch_validation(False)
+    try:
+        assert previous is True
+        Epoch(year=2022, month=2, day=30, hours=0, minutes=0)
+    finally:
+        set_epoch_validation(previous)
+    with pytest.raises(EpochException):
+        Epoch(year=2022, month=2, day=30, hours=0, minutes=0)
+
+    # Missing components always raise
+    with pytest.raises(EpochException):
+        Epoch(year=2022, month=7, day=27)
+
+
+def test_numpy_scalar_offsets():
+    # NumPy scalars (e.g. elements of an EpochArray computation) work like
+    # Python numbers in every operator
+    epoch = Epoch('UTC', mean_julian_day=59787)
+    for offset in (np.int64(90000), np.float64(90000.0), np.int32(90000),
+                   np.float32(90000.0)):
+        assert epoch + offset == epoch + 90000
+        assert epoch - offset == epoch - 90000
+        shifted = Epoch('UTC', mean_julian_day=59787)
+        shifted += offset
+        assert shifted == epoch + 90000
+        shifted -= offset
+        assert shifted == epoch
+
+    # Large integer offsets stay exact (no int64 nanosecond overflow)
+    offset = np.int64(400 * 365 * SECONDS_IN_DAY)
+    assert (epoch + offset).mean_julian_day == 59787 + 400 * 365
+    assert (epoch + offset).nanoseconds_of_day == 0
+
+
+def test_mixed_operands():
+    # Epoch with EpochArray works in either order, elementwise
+    epoch = Epoch('UTC', mean_julian_day=59787) + 1e-8
+    epochs = EpochArray(np.array([1, 2]), time_system='UTC',
+                        nanoseconds_of_day=np.array([5, 20]))
+    for result in (epoch + epochs, epochs + epoch):
+        assert isinstance(result, EpochArray)
+        np.testing.assert_array_equal(result.mean_julian_day, [59788, 59789])
+        np.testing.assert_array_equal(result.nanoseconds_of_day, [15, 30])
+    result = 30.0 + epochs
+    np.testing.assert_array_equal(
+        result.nanoseconds_of_day, [5 + 30 * 10**9, 20 + 30 * 10**9])
+
+    result = epoch - epochs
+    assert isinstance(result, EpochArray)
+    np.testing.assert_array_equal(result.mean_julian_day, [59786, 59784])
+    np.testing.assert_array_equal(
+        result.nanoseconds_of_day, [5, NANOSECONDS_IN_DAY - 10])
+    np.testing.assert_array_equal(
+        (epochs - epoch).mean_julian_day, [-59787, -59785])
+
+    with pytest.raises(EpochException):
+        Epoch('TAI', mean_julian_day=59787) - epochs
+
+    # Unsupported operands raise TypeError in either order
+    for operand in ('x', None, [1.0]):
+        with pytest.raises(TypeError):
+            epoch + operand
+        with pytest.raises(TypeError):
+            operand + epoch
+        with pytest.raises(TypeError):
+            epoch - operand
+        with pytest.raises(TypeError):
+            operand - epoch
+        shifted = Epoch('UTC', mean_julian_day=59787)
+        with pytest.raises(TypeError):
+            shifted += operand
+        with pytest.raises(TypeError):
+            shifted -= operand
+    with pytest.raises(TypeError):
+        30.0 - epochs
+
+
+def test_convert_time_system_tdb_options(monkeypatch):
+    epoch = Epoch('TT', year=2022, month=7, day=27, hours=12, minutes=5,
+                  seconds=5)
+    epochs = EpochArray.from_epochs([epoch + offset
+                                     for offset in range(0, 86400, 60)])
+
+    # Fast mode goes through to the series, within its error of precise
+    precise = epoch.to_time_system('TDB')
+    fast = epoch.to_time_system('TDB', tdb_mode='fast')
+    assert fast != precise
+    assert abs(fast.seconds_since(precise)) < 1e-5
+    assert fast.mean_julian_day == epoch.mean_julian_day
+    assert abs((fast.nanoseconds_of_day - epoch.nanoseconds_of_day) * 1e-9 -
+               get_tdb_minus_tt(epoch.mean_julian_day,
+                                epoch.nanoseconds_of_day, mode='fast')) < 1e-9
+
+    # Repeated scalar conversions hit the node cache
+    epoch_module._get_tdb_minus_tt_node.cache_clear()
+    for offset in range(10):
+        (epoch + offset).to_time_system('TDB', tdb_cache=True)
+    assert epoch_module._get_tdb_minus_tt_node.cache_info().hits > 0
+    assert abs((epoch + 9).to_time_system('TDB', tdb_cache=True)
+               .seconds_since((epoch + 9).to_time_system('TDB'))) < 1e-8
+
+    # Options reach get_tdb_minus_tt both to and from TDB, for arrays too
+    get_tdb_minus_tt_original = epoch_module.get_tdb_minus_tt
+    calls = []
+
+    def recording_get_tdb_minus_tt(*args, mode='precise', cache=False):
+        calls.append((mode, cache))
+        return get_tdb_minus_tt_original(*args, mode=mode, cache=cache)
+
+    monkeypatch.setattr(
+        epoch_module, 'get_tdb_minus_tt', recording_get_tdb_minus_tt)
+    tdb = epochs.to_time_system('TDB', tdb_mode='fast', tdb_cache=True)
+    tdb.to_time_system('UTC', tdb_mode='fast', tdb_cache=True)
+    epoch.to_time_system('TDB')
+    assert calls == [('fast', True), ('fast', True), ('precise', False)]
+
+    # Mode not allowed
+    with pytest.raises(EpochException):
+        epoch.to_time_system('TDB', tdb_mode='LOL')
+
+
+def test_split_time_helpers():
+    # Whole days carried out either way, scalars and arrays
+    assert normalize_split_time(59787, NANOSECONDS_IN_DAY + 5) == (59788, 5)
+    assert normalize_split_time(59787, -5) == \
+        (59786, NANOSECONDS_IN_DAY - 5)
+    days, nanoseconds = normalize_split_time(
+        np.array([59787, 59787]), np.array([-1, 2 * NANOSECONDS_IN_DAY]))
+    np.testing.assert_array_equal(days, [59786, 59789])
+    np.testing.assert_array_equal(nanoseconds, [NANOSECONDS_IN_DAY - 1, 0])
+
+    # Rounded to the nearest nanosecond
+    assert seconds_to_nanoseconds(1.0000000004) == NANOSECONDS_IN_SECOND
+    assert isinstance(seconds_to_nanoseconds(0.5), int)
+    nanoseconds = seconds_to_nanoseconds(np.array([-1.5e-9, 2.6e-9]))
+    assert nanoseconds.dtype == np.int64
+    np.testing.assert_array_equal(nanoseconds, [-2, 3])
 
 
 pass
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# ------------------------------------------------------------------------------
+# test_epoch_intervals
+# ------------------------------------------------------------------------------
+
+# Python imports
+import numpy as np
+import pytest
+
+# Astrochelle imports
+from astrochelle.utils.epoch import Epoch, EpochArray
+from astrochelle.utils.epoch_intervals import *
+
+START = Epoch(year=2022, month=7, day=27, hours=23, minutes=59, seconds=50)
+
+
+def make_set(windows, time_system='UTC'):
+    # Windows as (start, stop) seconds after START
+    start = START.to_time_system(time_system) if time_system != 'UTC' \
+        else START
+    return EpochIntervalSet([start + float(a) for a, _ in windows],
+                            [start + float(b) for _, b in windows],
+                            time_system=time_system)
+
+
+def as_seconds(interval_set):
+    return [(start.seconds_since(START), stop.seconds_since(START))
+            for start, stop in interval_set]
+
+
+def test_epoch_interval_set():
+    # Windows are sorted and merged (overlapping and touching), empty
+    # windows dropped
+    a = make_set([(20, 30), (0, 10), (5, 12), (30, 40), (50, 50)])
+    b = make_set([(8, 25), (50, 60)])
+    assert as_seconds(a) == [(0, 12), (20, 40)]
+    assert len(a) == 2
+    assert a.starts.time_system == 'UTC'
+
+    # Set operations (windows cross midnight)
+    assert as_seconds(a | b) == [(0, 40), (50, 60)]
+    assert as_seconds(a & b) == [(8, 12), (20, 25)]
+    assert as_seconds(a - b) == [(0, 8), (25, 40)]
+    assert as_seconds(b - a) == [(12, 20), (50, 60)]
+    assert as_seconds(a.complement()) == [(12, 20)]
+    assert as_seconds(a.complement(START - 5, START + 100)) == [
+        (-5, 0), (12, 20), (40, 100)]
+    assert as_seconds(EpochIntervalSet.union_all([a, b, make_set(
+        [(100, 110)])])) == [(0, 40), (50, 60), (100, 110)]
+    assert as_seconds(EpochIntervalSet.intersection_all(
+        [a, b, make_set([(0, 22)])])) == [(8, 12), (20, 22)]
+
+    # Touching windows intersect to nothing
+    assert len(make_set([(0, 10)]) & make_set([(10, 20)])) == 0
+
+    # Durations are exact
+    assert a.durations().tolist() == [12, 20]
+    assert a.total_duration() == 32
+    assert make_set([(0, 1e-9)]).total_duration() == 1e-9
+
+    # Membership, half open
+    assert a.contains(START + 11.999)
+    assert not a.contains(START + 12)
+    epochs = EpochArray([START.mean_julian_day] * 3,
+                        nanoseconds_of_day=[START.nanoseconds_of_day] * 3) \
+        + np.array([-1, 0, 45])
+    assert a.contains(epochs).tolist() == [False, True, False]
+    assert not a.contains(Epoch(mean_julian_day=0))
+
+    # Empty sets
+    empty = EpochIntervalSet([], [])
+    assert len(empty) == 0 and empty.total_duration() == 0
+    assert as_seconds(empty | a) == as_seconds(a)
+    assert len(empty & a) == 0 and len(empty - a) == 0
+    assert as_seconds(a - empty) == as_seconds(a)
+    assert as_seconds(empty.complement(START, START + 5)) == [(0, 5)]
+    assert not empty.contains(START)
+    assert not empty.contains(epochs).any()
+
+    # The complement of an empty set counts from its own span, so any date
+    # works (not only within MAX_INDEX_SPAN_DAYS of MJD 0)
+    far = Epoch(mean_julian_day=150000.25)
+    gaps = empty.complement(far, far + 5)
+    assert [(start.seconds_since(far), stop.seconds_since(far))
+            for start, stop in gaps] == [(0, 5)]
+    assert gaps.contains(far + 1) and not gaps.contains(START)
+    assert len(gaps | make_set([(0, 1)])) == 2
+
+    # Bad input
+    with pytest.raises(EpochIntervalException):
+        make_set([(10, 0)])
+    with pytest.raises(EpochIntervalException):
+        a | make_set([(0, 1)], time_system='TT')
+    with pytest.raises(EpochIntervalException):
+        empty.complement()
+    with pytest.raises(EpochIntervalException):
+        a | make_set([(0, 1e10)])
+
+
+def test_epoch_interval_set_random():
+    # Compare against brute force membership on a grid
+    rng = np.random.default_rng(0)
+    grid = np.arange(0, 1000, 0.5)
+    grid_epochs = EpochArray([START.mean_julian_day] * grid.size,
+                             nanoseconds_of_day=[START.nanoseconds_of_day] *
+                             grid.size) + grid
+
+    def random_set():
+        starts = rng.integers(0, 950, 40)
+        return make_set(list(zip(starts, starts + rng.integers(0, 40, 40))))
+
+    for _ in range(20):
+        a, b, c = random_set(), random_set(), random_set()
+        in_a, in_b, in_c = (interval_set.contains(grid_epochs)
+                            for interval_set in (a, b, c))
+        assert np.array_equal((a | b).contains(grid_epochs), in_a | in_b)
+        assert np.array_equal((a & b).contains(grid_epochs), in_a & in_b)
+        assert np.array_equal((a - b).contains(grid_epochs), in_a & ~in_b)
+        assert np.array_equal(
+            EpochIntervalSet.intersection_all([a, b, c]).contains(
+                grid_epochs), in_a & in_b & in_c)
+        assert np.array_equal(
+            a.complement(START, START + 1000.0).contains(grid_epochs),
+            ~in_a)
+        assert (a | b).total_duration() + (a & b).total_duration() == \
+            a.total_duration() + b.total_duration()
+
+
+pass
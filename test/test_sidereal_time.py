@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# ------------------------------------------------------------------------------
+# test_sidereal_time
+# References:
+#   [1] Software Routines from the IAU SOFA Collection were used.
+#       Copyright International Astronomical Union Standards of Fundamental
+#       Astronomy (http://www.iausofa.org)”.
+# ------------------------------------------------------------------------------
+
+# Python imports
+from math import pi
+import numpy as np
+import pytest
+
+# Astrochelle imports
+from astrochelle.utils import sidereal_time
+from astrochelle.utils.epoch import Epoch, EpochArray
+from astrochelle.utils.sidereal_time import *
+
+
+def test_earth_rotation_angle():
+    # Values from `iauEra00` and `iauGmst06` in Ref. 1
+    epoch = Epoch(year=2022, month=7, day=27, hours=12, minutes=5,
+                  seconds=5.25)
+    ut1_minus_utc = -0.0123
+    assert abs(get_earth_rotation_angle(epoch, ut1_minus_utc) -
+               2.201523670982482) < 1e-12
+    assert abs(get_greenwich_mean_sidereal_time(epoch, ut1_minus_utc) -
+               2.206570398211992) < 1e-12
+
+    # The time system of the epoch doesn't change the answer
+    assert abs(get_greenwich_mean_sidereal_time(
+        epoch.to_time_system('TDB'), ut1_minus_utc) -
+        2.206570398211992) < 1e-12
+
+    # One sidereal day later the Earth is back where it started
+    later = epoch + 86164.0905
+    assert abs(get_earth_rotation_angle(later, ut1_minus_utc) -
+               2.201523670982482) < 1e-6
+
+    # Arrays match scalars
+    epochs = EpochArray(
+        [59787, 51544, 45000],
+        nanoseconds_of_day=[43505250000000, 43200000000000, 0],
+        time_system='TT')
+    earth_rotation_angles = get_earth_rotation_angle(epochs, ut1_minus_utc)
+    gmsts = get_greenwich_mean_sidereal_time(epochs, [0.1, 0.2, 0.3])
+    assert isinstance(gmsts, np.ndarray)
+    for index, epoch in enumerate(epochs):
+        assert earth_rotation_angles[index] == get_earth_rotation_angle(
+            epoch, ut1_minus_utc)
+        assert gmsts[index] == get_greenwich_mean_sidereal_time(
+            epoch, [0.1, 0.2, 0.3][index])
+    assert np.all((gmsts >= 0) & (gmsts < 2 * pi))
+
+    # Cached values match and are shared between calls
+    epoch = Epoch(year=2022, month=7, day=27, hours=12, minutes=5, seconds=5)
+    assert get_greenwich_mean_sidereal_time(epoch, cache=True) == \
+        get_greenwich_mean_sidereal_time(epoch)
+    assert get_earth_rotation_angle(epoch, cache=True) == \
+        get_earth_rotation_angle(epoch)
+    hits = sidereal_time._evaluate_sidereal_time_cached.cache_info().hits
+    get_greenwich_mean_sidereal_time(epoch, cache=True)
+    assert sidereal_time._evaluate_sidereal_time_cached.cache_info().hits \
+        == hits + 1
+
+    # The cache follows the epoch's value, not the object
+    epoch += 60
+    assert get_greenwich_mean_sidereal_time(epoch, cache=True) == \
+        get_greenwich_mean_sidereal_time(epoch)
+
+    with pytest.raises(SiderealTimeException):
+        get_earth_rotation_angle(59787.5)
+
+
+pass